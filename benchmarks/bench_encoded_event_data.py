@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from eventstoredb.client.append_to_stream.grpc import create_append_request
+from eventstoredb.events import JsonEvent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serialization cost per event on the append path")
+    parser.add_argument("--number", type=int, default=10000)
+    parser.add_argument("--payload-size", type=int, default=256)
+    args = parser.parse_args()
+
+    event = JsonEvent(
+        type="BenchmarkEvent",
+        data=json.dumps({"payload": "x" * args.payload_size}).encode(),
+        metadata=json.dumps({"correlation-id": "bench"}).encode(),
+    )
+    encoded = event.encode()
+
+    plain = timeit.timeit(lambda: bytes(create_append_request(event)), number=args.number)
+    cached = timeit.timeit(lambda: bytes(create_append_request(encoded)), number=args.number)
+
+    print(f"EventData:        {plain / args.number * 1e6:8.2f} us/event")
+    print(f"EncodedEventData: {cached / args.number * 1e6:8.2f} us/event")
+    print(f"saving:           {(plain - cached) / args.number * 1e6:8.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from eventstoredb.events import ContentType, JsonRecordedEvent, ReadEvent
+from eventstoredb.types import AllPosition
+from eventstoredb.utils import uuid_from_int
+
+
+def plain_dataclass(cls: type) -> type:
+    # the class as it was before the slots change, a frozen dataclass with a __dict__
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(f.name, Any) for f in dataclasses.fields(cls)],
+        frozen=True,
+    )
+
+
+def event_factory(
+    read_event_cls: type,
+    recorded_event_cls: type,
+    position_cls: type,
+    payload_size: int,
+) -> Callable[[int], Any]:
+    payload = b"x" * payload_size
+    created = time.time_ns() // 100
+
+    def create(i: int) -> Any:
+        # ids, positions and payloads are allocated per event, like events coming off the wire
+        position = position_cls(i, i)
+        return read_event_cls(
+            event=recorded_event_cls(
+                stream_name="benchmark-stream",
+                id=uuid_from_int(i),
+                type="BenchmarkEvent",
+                content_type=ContentType.JSON,
+                revision=i,
+                created=created,
+                position=position,
+                data=payload + i.to_bytes(8, "big"),
+                metadata=None,
+                serializer=None,
+            ),
+            link=None,
+            commit_position=i,
+        )
+
+    return create
+
+
+def measure(create: Callable[[int], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    events = [create(i) for i in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return (end - start) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory held per event when loading many events")
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--payload-size", type=int, default=256)
+    args = parser.parse_args()
+
+    plain = measure(
+        event_factory(
+            plain_dataclass(ReadEvent),
+            plain_dataclass(JsonRecordedEvent),
+            plain_dataclass(AllPosition),
+            args.payload_size,
+        ),
+        args.count,
+    )
+    slotted = measure(
+        event_factory(ReadEvent, JsonRecordedEvent, AllPosition, args.payload_size),
+        args.count,
+    )
+
+    print(f"events:  {args.count}")
+    print(f"plain:   {plain:8.1f} bytes/event")
+    print(f"slotted: {slotted:8.1f} bytes/event")
+    print(f"saving:  {plain - slotted:8.1f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import timeit
+import uuid
+
+from eventstoredb.client.decoder import decode_read_response
+from eventstoredb.client.read_stream.grpc import convert_read_response
+from eventstoredb.generated.event_store.client import StreamIdentifier, Uuid
+from eventstoredb.generated.event_store.client.streams import (
+    ReadResp,
+    ReadRespReadEvent,
+    ReadRespReadEventRecordedEvent,
+)
+from eventstoredb.serializers import DEFAULT_SERIALIZER
+
+
+def create_message(payload_size: int) -> bytes:
+    recorded_event = ReadRespReadEventRecordedEvent(
+        id=Uuid(string=str(uuid.uuid4())),
+        stream_identifier=StreamIdentifier(b"benchmark-stream"),
+        stream_revision=42,
+        prepare_position=4200,
+        commit_position=4200,
+        metadata={
+            "type": "BenchmarkEvent",
+            "content-type": "application/json",
+            "created": str(time.time_ns() // 100),
+        },
+        custom_metadata=json.dumps({"correlation-id": "bench"}).encode(),
+        data=json.dumps({"payload": "x" * payload_size}).encode(),
+    )
+    return bytes(ReadResp(event=ReadRespReadEvent(event=recorded_event, commit_position=4200)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decoding cost per event on the read path")
+    parser.add_argument("--number", type=int, default=10000)
+    parser.add_argument("--payload-size", type=int, default=256)
+    args = parser.parse_args()
+
+    raw = create_message(args.payload_size)
+
+    betterproto = timeit.timeit(
+        lambda: convert_read_response(ReadResp().parse(raw), serializer=DEFAULT_SERIALIZER),
+        number=args.number,
+    )
+    fast = timeit.timeit(
+        lambda: decode_read_response(raw, DEFAULT_SERIALIZER),
+        number=args.number,
+    )
+
+    headers_only = timeit.timeit(
+        lambda: decode_read_response(raw, DEFAULT_SERIALIZER, headers_only=True),
+        number=args.number,
+    )
+
+    print(f"betterproto:  {betterproto / args.number * 1e6:8.2f} us/event")
+    print(f"fast decoder: {fast / args.number * 1e6:8.2f} us/event")
+    print(f"headers only: {headers_only / args.number * 1e6:8.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
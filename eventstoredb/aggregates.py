@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from eventstoredb.client.append_to_stream.types import AppendExpectedRevision, AppendToStreamOptions
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.events import JsonRecordedEvent, ReadEvent
+from eventstoredb.types import ReadDirection, StreamPosition
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from eventstoredb.client.append_to_stream.types import AppendResult
+    from eventstoredb.client.client import Client
+    from eventstoredb.events import EventData, RecordedEvent
+    from eventstoredb.types import StreamRevision
+
+
+logger = logging.getLogger(__name__)
+
+A = TypeVar("A")
+
+# event types starting with $ are reserved for the server
+SNAPSHOT_EVENT_TYPE = "Snapshot"
+STREAM_METADATA_EVENT_TYPE = "$metadata"
+
+
+@dataclass
+class AggregateRepositoryOptions:
+    snapshot_interval: int = 1000  # events replayed after the latest snapshot
+    snapshot_stream_prefix: str = "snapshot-"
+    # snapshots of another version are ignored, bump it when the snapshot format changes
+    snapshot_version: int = 1
+    # $maxCount of the snapshot stream, only the latest snapshot is ever read
+    snapshot_max_count: int = 1
+
+
+@dataclass
+class Snapshot(Generic[A]):
+    revision: StreamRevision
+    state: A
+
+
+@dataclass
+class LoadedAggregate(Generic[A]):
+    stream_name: str
+    state: A
+    revision: StreamRevision | None = None  # None when the stream does not exist yet
+    snapshot_revision: StreamRevision | None = None
+
+    @property
+    def expected_revision(self) -> AppendExpectedRevision | StreamRevision:
+        if self.revision is None:
+            return AppendExpectedRevision.NO_STREAM
+        return self.revision
+
+
+class AggregateRepository(Generic[A]):
+    # loads aggregates from the latest snapshot and the events after it. snapshots are
+    # written in the background once a load had to replay snapshot_interval events
+    def __init__(
+        self,
+        client: Client,
+        initial: Callable[[], A],
+        apply: Callable[[A, RecordedEvent], A],
+        to_snapshot: Callable[[A], Any],
+        from_snapshot: Callable[[Any], A],
+        options: AggregateRepositoryOptions | None = None,
+    ) -> None:
+        self._client = client
+        self._initial = initial
+        self._apply = apply
+        self._to_snapshot = to_snapshot
+        self._from_snapshot = from_snapshot
+        self._options = options or AggregateRepositoryOptions()
+        self._snapshot_tasks: dict[str, asyncio.Task[None]] = {}
+
+    def snapshot_stream_name(self, stream_name: str) -> str:
+        return f"{self._options.snapshot_stream_prefix}{stream_name}"
+
+    async def load(self, stream_name: str) -> LoadedAggregate[A]:
+        snapshot = await self.read_snapshot(stream_name)
+        aggregate = LoadedAggregate(stream_name=stream_name, state=self._initial())
+        from_revision: StreamRevision | StreamPosition = StreamPosition.START
+        if snapshot is not None:
+            aggregate.state = snapshot.state
+            aggregate.revision = aggregate.snapshot_revision = snapshot.revision
+            from_revision = snapshot.revision + 1
+
+        replayed = 0
+        try:
+            async for event in self._client.read_stream(
+                stream_name,
+                ReadStreamOptions(from_revision=from_revision),
+            ):
+                if not isinstance(event, ReadEvent) or event.event is None:
+                    continue
+                aggregate.state = self._apply(aggregate.state, event.event)
+                aggregate.revision = event.event.revision
+                replayed += 1
+        except StreamNotFoundError:
+            if snapshot is None:
+                return aggregate
+            raise
+
+        if replayed >= self._options.snapshot_interval and aggregate.revision is not None:
+            # serialize now, the caller may mutate the state before the snapshot is written
+            data = self._to_snapshot(aggregate.state)
+            self._schedule_snapshot(stream_name, aggregate.revision, data)
+        return aggregate
+
+    async def save(
+        self,
+        aggregate: LoadedAggregate[A],
+        events: EventData | Iterable[EventData],
+    ) -> AppendResult:
+        return await self._client.append_to_stream(
+            stream_name=aggregate.stream_name,
+            events=events,
+            options=AppendToStreamOptions(expected_revision=aggregate.expected_revision),
+        )
+
+    async def read_snapshot(self, stream_name: str) -> Snapshot[A] | None:
+        options = ReadStreamOptions(
+            from_revision=StreamPosition.END,
+            direction=ReadDirection.BACKWARDS,
+            max_count=1,
+        )
+        try:
+            events = [
+                e
+                async for e in self._client.read_stream(
+                    self.snapshot_stream_name(stream_name),
+                    options,
+                )
+                if isinstance(e, ReadEvent)
+            ]
+        except StreamNotFoundError:
+            return None
+        if not events or not isinstance(events[0].event, JsonRecordedEvent):
+            return None
+        data = events[0].event.json()
+        if not isinstance(data, dict) or data.get("version") != self._options.snapshot_version:
+            return None
+        return Snapshot(revision=data["revision"], state=self._from_snapshot(data["state"]))
+
+    async def write_snapshot(self, stream_name: str, snapshot: Snapshot[A]) -> None:
+        await self._write_snapshot(
+            stream_name,
+            snapshot.revision,
+            self._to_snapshot(snapshot.state),
+        )
+
+    async def wait_for_snapshots(self) -> None:
+        await asyncio.gather(*self._snapshot_tasks.values())
+
+    async def _write_snapshot(self, stream_name: str, revision: StreamRevision, data: Any) -> None:
+        event = self._client.json_event(
+            type=SNAPSHOT_EVENT_TYPE,
+            data={
+                "version": self._options.snapshot_version,
+                "revision": revision,
+                "state": data,
+            },
+        )
+        snapshot_stream_name = self.snapshot_stream_name(stream_name)
+        result = await self._client.append_to_stream(snapshot_stream_name, event)
+        if result.next_expected_revision == 0:
+            # the first snapshot created the stream, older snapshots are truncated from now on
+            await self._client.append_to_stream(
+                f"$${snapshot_stream_name}",
+                self._client.json_event(
+                    type=STREAM_METADATA_EVENT_TYPE,
+                    data={"$maxCount": self._options.snapshot_max_count},
+                ),
+            )
+
+    def _schedule_snapshot(self, stream_name: str, revision: StreamRevision, data: Any) -> None:
+        # concurrent loads of the same aggregate write a single snapshot
+        if stream_name in self._snapshot_tasks:
+            return
+        task = asyncio.create_task(self._write_snapshot(stream_name, revision, data))
+        self._snapshot_tasks[stream_name] = task
+        task.add_done_callback(lambda _: self._on_snapshot_done(stream_name, task))
+
+    def _on_snapshot_done(self, stream_name: str, task: asyncio.Task[None]) -> None:
+        self._snapshot_tasks.pop(stream_name, None)
+        # a failed snapshot only means the next load replays more events, so it is logged
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Writing the snapshot of stream '%s' failed",
+                stream_name,
+                exc_info=task.exception(),
+            )
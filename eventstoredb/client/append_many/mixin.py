@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Mapping
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.append_many.types import AppendManyOptions, AppendManyResult
+from eventstoredb.client.append_to_stream.mixin import AppendToStreamMixin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from eventstoredb.client.append_many.types import AppendManyRequest
+    from eventstoredb.client.append_to_stream.types import AppendToStreamOptions
+    from eventstoredb.events import EventData
+
+
+class AppendManyMixin(AppendToStreamMixin):
+    async def append_many(
+        self,
+        requests: Mapping[str, EventData | Iterable[EventData]]
+        | Iterable[AppendManyRequest]
+        | AsyncIterable[AppendManyRequest],
+        options: AppendManyOptions | None = None,
+    ) -> list[AppendManyResult]:
+        if options is None:
+            options = AppendManyOptions()
+
+        semaphore = asyncio.Semaphore(options.max_in_flight)
+        results: list[AppendManyResult] = []
+        pending: set[asyncio.Task[None]] = set()
+        # the latest append of each stream, later requests for the stream wait for it
+        streams: dict[str, asyncio.Task[None]] = {}
+
+        try:
+            async for request in iterate_append_many_requests(requests):
+                # requests are only consumed while there is room in the in-flight window
+                await semaphore.acquire()
+                self._submit_append(request, results, pending, streams, semaphore)
+            await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+
+        return results
+
+    def _submit_append(
+        self,
+        request: AppendManyRequest,
+        results: list[AppendManyResult],
+        pending: set[asyncio.Task[None]],
+        streams: dict[str, asyncio.Task[None]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        stream_name, events, options = request
+        result = AppendManyResult(stream_name=stream_name)
+        results.append(result)
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            pending.discard(task)
+            if streams.get(stream_name) is task:
+                del streams[stream_name]
+            semaphore.release()
+
+        # appends to the same stream run one after the other in submission order, so
+        # expected revisions of later requests see the events of the earlier ones
+        previous = streams.get(stream_name)
+        task = asyncio.create_task(self._append_one(result, events, options, previous))
+        streams[stream_name] = task
+        pending.add(task)
+        task.add_done_callback(on_done)
+
+    async def _append_one(
+        self,
+        result: AppendManyResult,
+        events: EventData | Iterable[EventData],
+        options: AppendToStreamOptions | None,
+        previous: asyncio.Task[None] | None = None,
+    ) -> None:
+        if previous is not None:
+            # failures are stored on the result, only cancellation is raised
+            await previous
+        try:
+            result.result = await self.append_to_stream(
+                stream_name=result.stream_name,
+                events=events,
+                options=options,
+            )
+        except Exception as e:  # noqa: BLE001
+            result.error = e
+
+
+async def iterate_append_many_requests(
+    requests: Mapping[str, EventData | Iterable[EventData]]
+    | Iterable[AppendManyRequest]
+    | AsyncIterable[AppendManyRequest],
+) -> AsyncIterator[AppendManyRequest]:
+    if isinstance(requests, Mapping):
+        for stream_name, events in requests.items():
+            yield stream_name, events, None
+    elif isinstance(requests, AsyncIterable):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from eventstoredb.client.append_to_stream.types import AppendResult, AppendToStreamOptions
+    from eventstoredb.events import EventData
+
+
+@dataclass
+class AppendManyOptions:
+    max_in_flight: int = 100
+
+
+@dataclass
+class AppendManyResult:
+    stream_name: str
+    result: AppendResult | None = None
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+# NOTE not using union-operator for python3.9 compatibility
+AppendManyRequest = tuple[
+    str,
+    Union["EventData", Iterable["EventData"]],
+    Optional["AppendToStreamOptions"],
+]
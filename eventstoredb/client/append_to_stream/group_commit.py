@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.append_to_stream.grpc import (
+    convert_append_response,
+    create_append_header,
+    create_append_request,
+)
+from eventstoredb.client.append_to_stream.types import (
+    AppendExpectedRevision,
+    AppendResult,
+    AppendToStreamOptions,
+)
+from eventstoredb.generated.event_store.client.streams import AppendReq, StreamsStub
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from grpclib.client import Channel
+
+    from eventstoredb.client.append_to_stream.types import GroupCommitOptions
+    from eventstoredb.compression import CompressionOptions
+    from eventstoredb.events import EventData
+
+
+@dataclass
+class PendingGroup:
+    waiters: list[tuple[list[EventData], asyncio.Future[AppendResult]]] = field(
+        default_factory=list,
+    )
+    size: int = 0  # events
+    timer: asyncio.TimerHandle | None = None
+
+
+class GroupCommit:
+    def __init__(
+        self,
+        channel: Channel,
+        options: GroupCommitOptions,
+        compression: CompressionOptions | None = None,
+        structured_uuids: bool = False,
+    ) -> None:
+        self._client = StreamsStub(channel=channel)
+        self._options = options
+        self._compression = compression
+        self._structured_uuids = structured_uuids
+        self._groups: dict[str, PendingGroup] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def append_to_stream(
+        self,
+        stream_name: str,
+        events: list[EventData],
+    ) -> AppendResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[AppendResult] = loop.create_future()
+
+        group = self._groups.get(stream_name)
+        if group is None:
+            group = self._groups[stream_name] = PendingGroup()
+            group.timer = loop.call_later(
+                self._options.window / 1_000_000,
+                self._flush,
+                stream_name,
+            )
+        group.waiters.append((events, future))
+        group.size += len(events)
+
+        if group.size >= self._options.max_events:
+            self._flush(stream_name)
+
+        return await future
+
+    def _flush(self, stream_name: str) -> None:
+        group = self._groups.pop(stream_name, None)
+        if group is None:
+            return
+        if group.timer is not None:
+            group.timer.cancel()
+        task = asyncio.create_task(self._commit(stream_name, group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _commit(self, stream_name: str, group: PendingGroup) -> None:
+        # callers cancelled before the write starts are left out of it
+        waiters = [(events, future) for events, future in group.waiters if not future.done()]
+        try:
+            if waiters:
+                await self._commit_waiters(stream_name, waiters)
+        finally:
+            # a cancelled commit must not leave any caller waiting
+            for _, future in waiters:
+                if not future.done():
+                    future.cancel()
+
+    async def _commit_waiters(
+        self,
+        stream_name: str,
+        waiters: list[tuple[list[EventData], asyncio.Future[AppendResult]]],
+    ) -> None:
+        options = AppendToStreamOptions(expected_revision=AppendExpectedRevision.ANY)
+
+        async def request_iterator() -> AsyncGenerator[AppendReq, None]:
+            yield create_append_header(stream_name=stream_name, options=options)
+            for events, _ in waiters:
+                for event in events:
+                    yield create_append_request(
+                        event,
+                        compression=self._compression,
+                        structured_uuids=self._structured_uuids,
+                    )
+
+        try:
+            response = await self._client.append(request_iterator())
+            result = convert_append_response(stream_name, response)
+        except Exception as e:  # noqa: BLE001
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # each caller gets the revision of its own last event within the merged write
+        remaining = sum(len(events) for events, _ in waiters)
+        for events, future in waiters:
+            remaining -= len(events)
+            if not future.done():
+                future.set_result(
+                    AppendResult(
+                        success=result.success,
+                        next_expected_revision=result.next_expected_revision - remaining,
+                        position=result.position,
+                    ),
+                )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING
 
 import betterproto
+from betterproto import encode_varint
 
 from eventstoredb.client.append_to_stream.exceptions import (
     RevisionMismatchError,
@@ -14,7 +16,9 @@ from eventstoredb.client.append_to_stream.types import (
     AppendToStreamOptions,
 )
 from eventstoredb.client.exceptions import StreamNotFoundError
-from eventstoredb.generated.event_store.client import Empty, StreamIdentifier, Uuid
+from eventstoredb.compression import compress_payload
+from eventstoredb.events import ContentType, EncodedEventData
+from eventstoredb.generated.event_store.client import Empty, StreamIdentifier
 from eventstoredb.generated.event_store.client.streams import (
     AppendReq,
     AppendReqOptions,
@@ -24,11 +28,34 @@ from eventstoredb.generated.event_store.client.streams import (
     AppendRespWrongExpectedVersion,
 )
 from eventstoredb.types import AllPosition, StreamRevision
+from eventstoredb.utils import uuid_to_message
 
 if TYPE_CHECKING:
+    from eventstoredb.compression import CompressionOptions
     from eventstoredb.events import EventData
 
 
+class EncodedAppendReq(AppendReq):
+    # bypasses betterproto field handling, the request is sent as the cached bytes. the fields
+    # are never set, so comparing and printing go through the encoded bytes
+    def __init__(self, event_data: EncodedEventData) -> None:
+        proposed_message = event_data.encoded
+        self._encoded = b"\x12" + encode_varint(len(proposed_message)) + proposed_message
+
+    def __bytes__(self) -> bytes:
+        return self._encoded
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AppendReq):
+            return NotImplemented
+        return bytes(self) == bytes(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({AppendReq().parse(self._encoded)!r})"
+
+
 def create_append_header(stream_name: str, options: AppendToStreamOptions) -> AppendReq:
     request_options = AppendReqOptions()
     request_options.stream_identifier = StreamIdentifier(stream_name.encode())
@@ -45,16 +72,65 @@ def create_append_header(stream_name: str, options: AppendToStreamOptions) -> Ap
     return AppendReq(options=request_options)
 
 
-def create_append_request(event_data: EventData) -> AppendReq:
+def create_append_request(
+    event_data: EventData,
+    compression: CompressionOptions | None = None,
+    structured_uuids: bool = False,
+) -> AppendReq:
+    if isinstance(event_data, EncodedEventData):
+        encoded = event_data.encode(structured_uuids=structured_uuids, compression=compression)
+        return EncodedAppendReq(encoded)
+    if compression is not None:
+        event_data = compress_event_data(event_data, compression)
+    return AppendReq(
+        proposed_message=create_proposed_message(event_data, structured_uuids=structured_uuids),
+    )
+
+
+def compress_event_data(event_data: EventData, options: CompressionOptions) -> EventData:
+    # json payloads stay readable for the server, e.g. for projections
+    if event_data.content_type != ContentType.BINARY or not event_data.data:
+        return event_data
+    data = compress_payload(event_data.data, options)
+    if data is None:
+        return event_data
+    return dataclasses.replace(event_data, data=data)
+
+
+def create_proposed_message(
+    event_data: EventData,
+    structured_uuids: bool = False,
+) -> AppendReqProposedMessage:
     message = AppendReqProposedMessage()
-    message.id = Uuid(string=str(event_data.id))
+    message.id = uuid_to_message(event_data.id, structured=structured_uuids)
     message.metadata["type"] = event_data.type
     message.metadata["content-type"] = event_data.content_type
     if event_data.data:
         message.data = event_data.data
     if event_data.metadata:
         message.custom_metadata = event_data.metadata
-    return AppendReq(proposed_message=message)
+    return message
+
+
+def encode_event_data(
+    event_data: EventData,
+    structured_uuids: bool = False,
+    compression: CompressionOptions | None = None,
+) -> EncodedEventData:
+    # the fields keep the original payload, so the event can be encoded again with other options
+    sent = event_data
+    if compression is not None:
+        sent = compress_event_data(event_data, compression)
+    return EncodedEventData(
+        type=event_data.type,
+        content_type=event_data.content_type,
+        id=event_data.id,
+        data=event_data.data,
+        metadata=event_data.metadata,
+        encoded=bytes(create_proposed_message(sent, structured_uuids=structured_uuids)),
+        structured_uuids=structured_uuids,
+        compression=compression,
+    )
 
 
 def convert_append_response(stream_name: str, message: AppendResp) -> AppendResult:
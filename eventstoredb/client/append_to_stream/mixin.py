@@ -1,45 +1,226 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+from eventstoredb.client.append_to_stream.exceptions import (
+    RevisionMismatchError,
+    StreamAlreadyExistsError,
+)
+from eventstoredb.client.append_to_stream.group_commit import GroupCommit
 from eventstoredb.client.append_to_stream.grpc import (
     convert_append_response,
     create_append_header,
     create_append_request,
 )
 from eventstoredb.client.append_to_stream.types import (
+    AppendExpectedRevision,
     AppendResult,
     AppendToStreamOptions,
+    AppendToStreamWithRetryOptions,
 )
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.exceptions import StreamNotFoundError
 from eventstoredb.client.protocol import ClientProtocol
-from eventstoredb.events import EventData
+from eventstoredb.client.read_stream.grpc import convert_read_response, create_read_request
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.events import EncodedEventData, EventData, JsonEvent, ReadEvent
 from eventstoredb.generated.event_store.client.streams import AppendReq, StreamsStub
+from eventstoredb.types import ReadDirection, StreamPosition
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Iterable
 
+    from eventstoredb.client.append_to_stream.types import ConflictHandler
+    from eventstoredb.events import RecordedEvent
+    from eventstoredb.types import StreamRevision
+
 
 class AppendToStreamMixin(ClientProtocol):
+    _group_commit: GroupCommit | None = None
+
     async def append_to_stream(
         self,
         stream_name: str,
-        events: EventData | Iterable[EventData],
+        events: EventData | Iterable[EventData] | AsyncIterable[EventData],
         options: AppendToStreamOptions | None = None,
     ) -> AppendResult:
         if options is None:
             options = AppendToStreamOptions()
 
+        try:
+            result = await self._append_to_stream(stream_name, events, options)
+        except StreamNotFoundError:
+            # the stream was deleted, its cached revision is no longer valid
+            if self.revision_cache is not None:
+                self.revision_cache.pop(stream_name)
+            raise
+        self._update_revision_cache(stream_name, result)
+        return result
+
+    async def _append_to_stream(
+        self,
+        stream_name: str,
+        events: EventData | Iterable[EventData] | AsyncIterable[EventData],
+        options: AppendToStreamOptions,
+    ) -> AppendResult:
+        group_commit_options = self.options.group_commit
+        if (
+            group_commit_options is not None
+            and options.expected_revision == AppendExpectedRevision.ANY
+            and not isinstance(events, AsyncIterable)
+        ):
+            if self._group_commit is None:
+                self._group_commit = GroupCommit(
+                    channel=self.channel,
+                    options=group_commit_options,
+                    compression=self.options.compression,
+                    structured_uuids=self.options.structured_uuids,
+                )
+            return await self._group_commit.append_to_stream(
+                stream_name=stream_name,
+                events=[events] if isinstance(events, EventData) else list(events),
+            )
+
+        create_request = partial(
+            create_append_request,
+            compression=self.options.compression,
+            structured_uuids=self.options.structured_uuids,
+        )
+
         async def request_iterator() -> AsyncGenerator[AppendReq, None]:
             yield create_append_header(
                 stream_name=stream_name,
                 options=options,
             )
             if isinstance(events, EventData):
-                yield create_append_request(events)
+                yield create_request(events)
+            elif isinstance(events, AsyncIterable):
+                # events are pulled one at a time as grpclib sends them, which only
+                # happens when the http2 flow-control window has room for more data
+                async for event in events:
+                    yield create_request(event)
             else:
                 for event in events:
-                    yield create_append_request(event)
+                    yield create_request(event)
 
         client = StreamsStub(channel=self.channel)
         response = await client.append(request_iterator())
         return convert_append_response(stream_name, response)
+
+    def encode_event(self, event_data: EventData) -> EncodedEventData:
+        # encoded with the options of this client, so appends can send the cached bytes as is
+        return event_data.encode(
+            structured_uuids=self.options.structured_uuids,
+            compression=self.options.compression,
+        )
+
+    def json_event(
+        self,
+        type: str,  # noqa: A002
+        data: Any = None,
+        metadata: Any = None,
+    ) -> JsonEvent:
+        # serialized with the serializer of this client
+        return JsonEvent.from_obj(
+            type=type,
+            data=data,
+            metadata=metadata,
+            serializer=self.serializer,
+        )
+
+    async def append_to_stream_with_retry(
+        self,
+        stream_name: str,
+        events: EventData | Iterable[EventData],
+        on_conflict: ConflictHandler,
+        options: AppendToStreamWithRetryOptions | None = None,
+    ) -> AppendResult:
+        if options is None:
+            options = AppendToStreamWithRetryOptions()
+
+        expected_revision = await self._get_expected_revision(stream_name)
+        retries = 0
+        while True:
+            try:
+                return await self.append_to_stream(
+                    stream_name=stream_name,
+                    events=events,
+                    options=AppendToStreamOptions(expected_revision=expected_revision),
+                )
+            except (  # noqa: PERF203
+                RevisionMismatchError,
+                StreamAlreadyExistsError,
+                StreamNotFoundError,
+            ) as e:
+                if retries >= options.max_retries:
+                    raise
+                retries += 1
+                # only the events written since the expected revision need to be loaded
+                new_events = await self._read_events_after(stream_name, expected_revision)
+                if new_events:
+                    expected_revision = new_events[-1].revision
+                elif isinstance(e, RevisionMismatchError) and e.current_revision is not None:
+                    expected_revision = e.current_revision
+                elif isinstance(e, StreamNotFoundError):
+                    # the stream was deleted since the expected revision was read
+                    expected_revision = AppendExpectedRevision.NO_STREAM
+                if self.revision_cache is not None and isinstance(expected_revision, int):
+                    self.revision_cache.put(stream_name, expected_revision)
+                events = await on_conflict(new_events)
+
+    async def _get_expected_revision(
+        self,
+        stream_name: str,
+    ) -> StreamRevision | AppendExpectedRevision:
+        if self.revision_cache is not None:
+            revision = self.revision_cache.get(stream_name)
+            if revision is not None:
+                return revision
+
+        options = ReadStreamOptions(
+            from_revision=StreamPosition.END,
+            direction=ReadDirection.BACKWARDS,
+            max_count=1,
+        )
+        events = await self._read_events(stream_name, options)
+        if not events:
+            return AppendExpectedRevision.NO_STREAM
+        if self.revision_cache is not None:
+            self.revision_cache.update(stream_name, events[0].revision)
+        return events[0].revision
+
+    async def _read_events_after(
+        self,
+        stream_name: str,
+        revision: StreamRevision | AppendExpectedRevision,
+    ) -> list[RecordedEvent]:
+        options = ReadStreamOptions()
+        if isinstance(revision, int):
+            options.from_revision = revision + 1
+        return await self._read_events(stream_name, options)
+
+    async def _read_events(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> list[RecordedEvent]:
+        request = create_read_request(
+            stream_name=stream_name,
+            options=options,
+            structured_uuids=self.options.structured_uuids,
+        )
+
+        try:
+            return [
+                event.event
+                async for event in iterate_read_responses(self, request, convert_read_response)
+                if isinstance(event, ReadEvent) and event.event is not None
+            ]
+        except StreamNotFoundError:
+            return []
+
+    def _update_revision_cache(self, stream_name: str, result: AppendResult) -> None:
+        if self.revision_cache is not None:
+            self.revision_cache.update(stream_name, result.next_expected_revision)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
+    from eventstoredb.events import EventData, RecordedEvent
     from eventstoredb.types import AllPosition, StreamRevision
 
 
@@ -19,8 +21,26 @@ class AppendToStreamOptions:
     expected_revision: AppendExpectedRevision | StreamRevision = AppendExpectedRevision.ANY
 
 
+@dataclass
+class AppendToStreamWithRetryOptions:
+    max_retries: int = 3
+
+
+@dataclass
+class GroupCommitOptions:
+    window: int = 1000  # microseconds
+    max_events: int = 1000
+
+
 @dataclass
 class AppendResult:
     success: bool
     next_expected_revision: StreamRevision
     position: AllPosition | None = None
+
+
+# NOTE not using union-operator for python3.9 compatibility
+ConflictHandler = Callable[
+    [list["RecordedEvent"]],
+    Awaitable[Union["EventData", Iterable["EventData"]]],
+]
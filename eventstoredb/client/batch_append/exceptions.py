@@ -0,0 +1,12 @@
+from eventstoredb.client.append_to_stream.exceptions import AppendToStreamError
+
+
+class BatchAppendWriterClosedError(AppendToStreamError):
+    def __init__(self) -> None:
+        super().__init__("BatchAppendWriter is closed")
+
+
+class UnexpectedBatchAppendResponseError(AppendToStreamError):
+    def __init__(self, stream_name: str) -> None:
+        self.stream_name = stream_name
+        super().__init__(f"Batch append to stream '{stream_name}' returned no result")
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import betterproto
+from betterproto.lib.google.protobuf import Empty as ProtobufEmpty
+
+from eventstoredb.client.append_to_stream.exceptions import (
+    AppendToStreamError,
+    RevisionMismatchError,
+    StreamAlreadyExistsError,
+)
+from eventstoredb.client.append_to_stream.grpc import compress_event_data
+from eventstoredb.client.append_to_stream.types import AppendExpectedRevision, AppendResult
+from eventstoredb.client.batch_append.exceptions import UnexpectedBatchAppendResponseError
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.events import EncodedEventData, EventData
+from eventstoredb.generated.event_store.client import (
+    StreamIdentifier,
+    Uuid,
+    WrongExpectedVersion,
+)
+from eventstoredb.generated.event_store.client.streams import (
+    BatchAppendReq,
+    BatchAppendReqOptions,
+    BatchAppendReqProposedMessage,
+    BatchAppendResp,
+    BatchAppendRespSuccess,
+)
+from eventstoredb.types import AllPosition, StreamRevision
+from eventstoredb.utils import uuid_to_message
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from eventstoredb.client.batch_append.types import BatchAppendOptions
+    from eventstoredb.compression import CompressionOptions
+    from eventstoredb.generated.google.rpc import Status
+
+WRONG_EXPECTED_VERSION_TYPE_URL = "type.googleapis.com/event_store.client.WrongExpectedVersion"
+
+
+class EncodedBatchAppendReqProposedMessage(BatchAppendReqProposedMessage):
+    # bypasses betterproto field handling, the message is sent as the cached bytes. the fields
+    # are never set, so comparing and printing go through the encoded bytes
+    def __init__(self, event_data: EncodedEventData) -> None:
+        self._encoded = event_data.encoded
+
+    def __bytes__(self) -> bytes:
+        return self._encoded
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BatchAppendReqProposedMessage):
+            return NotImplemented
+        return bytes(self) == bytes(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({BatchAppendReqProposedMessage().parse(self._encoded)!r})"
+
+
+def create_batch_append_options(
+    stream_name: str,
+    options: BatchAppendOptions,
+) -> BatchAppendReqOptions:
+    request_options = BatchAppendReqOptions()
+    request_options.stream_identifier = StreamIdentifier(stream_name.encode())
+
+    if isinstance(options.expected_revision, StreamRevision):
+        request_options.stream_position = options.expected_revision
+    elif options.expected_revision == AppendExpectedRevision.STREAM_EXISTS:
+        request_options.stream_exists = ProtobufEmpty()
+    elif options.expected_revision == AppendExpectedRevision.NO_STREAM:
+        request_options.no_stream = ProtobufEmpty()
+    else:
+        request_options.any = ProtobufEmpty()
+
+    if options.deadline is not None:
+        request_options.deadline = timedelta(milliseconds=options.deadline)
+
+    return request_options
+
+
+def create_batch_append_proposed_message(
+    event_data: EventData,
+    structured_uuids: bool = False,
+    compression: CompressionOptions | None = None,
+) -> BatchAppendReqProposedMessage:
+    if isinstance(event_data, EncodedEventData):
+        # AppendReq and BatchAppendReq share the layout of their proposed messages
+        encoded = event_data.encode(structured_uuids=structured_uuids, compression=compression)
+        return EncodedBatchAppendReqProposedMessage(encoded)
+    if compression is not None:
+        event_data = compress_event_data(event_data, compression)
+    message = BatchAppendReqProposedMessage()
+    message.id = uuid_to_message(event_data.id, structured=structured_uuids)
+    message.metadata["type"] = event_data.type
+    message.metadata["content-type"] = event_data.content_type
+    if event_data.data:
+        message.data = event_data.data
+    if event_data.metadata:
+        message.custom_metadata = event_data.metadata
+    return message
+
+
+class BatchAppendRequestChunker:
+    def __init__(
+        self,
+        correlation_id: UUID,
+        stream_name: str,
+        options: BatchAppendOptions,
+        compression: CompressionOptions | None = None,
+        structured_uuids: bool = False,
+    ) -> None:
+        self._compression = compression
+        self._structured_uuids = structured_uuids
+        # responses are matched to their requests by the string form of the correlation id
+        self._correlation_id = Uuid(string=str(correlation_id))
+        self._options = create_batch_append_options(stream_name=stream_name, options=options)
+        self._max_chunk_size = options.max_chunk_size
+        self._messages: list[BatchAppendReqProposedMessage] = []
+        self._size = 0
+
+    def add(self, event_data: EventData) -> BatchAppendReq | None:
+        encoded = event_data.encode(
+            structured_uuids=self._structured_uuids,
+            compression=self._compression,
+        )
+        size = len(encoded.encoded)
+        chunk = None
+        if self._messages and self._size + size > self._max_chunk_size:
+            chunk = self._create_request(is_final=False)
+        self._messages.append(
+            create_batch_append_proposed_message(
+                encoded,
+                structured_uuids=self._structured_uuids,
+                compression=self._compression,
+            ),
+        )
+        self._size += size
+        return chunk
+
+    def finish(self) -> BatchAppendReq:
+        return self._create_request(is_final=True)
+
+    def _create_request(self, is_final: bool) -> BatchAppendReq:
+        request = BatchAppendReq(
+            correlation_id=self._correlation_id,
+            options=self._options,
+            proposed_messages=self._messages,
+            is_final=is_final,
+        )
+        self._messages = []
+        self._size = 0
+        return request
+
+
+def convert_batch_append_response(stream_name: str, message: BatchAppendResp) -> AppendResult:
+    result_type, _ = betterproto.which_one_of(message, "result")
+    if result_type == "error":
+        raise convert_batch_append_error(stream_name=stream_name, message=message.error)
+
+    if result_type == "success":
+        return convert_batch_append_response_success(message=message.success)
+
+    raise UnexpectedBatchAppendResponseError(stream_name=stream_name)
+
+
+def convert_batch_append_response_success(message: BatchAppendRespSuccess) -> AppendResult:
+    position_type, _ = betterproto.which_one_of(message, "position_option")
+    if position_type == "position":
+        position = AllPosition(
+            commit_position=message.position.commit_position,
+            prepare_position=message.position.prepare_position,
+        )
+    else:
+        position = None
+    return AppendResult(
+        success=True,
+        next_expected_revision=message.current_revision,
+        position=position,
+    )
+
+
+def convert_batch_append_error(
+    stream_name: str,
+    message: Status,
+) -> StreamNotFoundError | StreamAlreadyExistsError | RevisionMismatchError | AppendToStreamError:
+    if message.details.type_url == WRONG_EXPECTED_VERSION_TYPE_URL:
+        details = WrongExpectedVersion().parse(message.details.value)
+        return convert_batch_append_wrong_expected_version(stream_name=stream_name, message=details)
+    return AppendToStreamError(message.message)
+
+
+def convert_batch_append_wrong_expected_version(
+    stream_name: str,
+    message: WrongExpectedVersion,
+) -> StreamNotFoundError | StreamAlreadyExistsError | RevisionMismatchError:
+    expected_type, _ = betterproto.which_one_of(message, "expected_stream_position_option")
+    current_type, _ = betterproto.which_one_of(message, "current_stream_revision_option")
+
+    if expected_type == "expected_no_stream":
+        return StreamAlreadyExistsError(stream_name=stream_name)
+    if current_type == "current_no_stream":
+        return StreamNotFoundError(stream_name=stream_name)
+    if expected_type == "expected_stream_position":
+        expected_revision: AppendExpectedRevision | StreamRevision
+        expected_revision = message.expected_stream_position
+    elif expected_type == "expected_stream_exists":
+        expected_revision = AppendExpectedRevision.STREAM_EXISTS
+    else:
+        expected_revision = AppendExpectedRevision.ANY
+    return RevisionMismatchError(
+        stream_name=stream_name,
+        expected_revision=expected_revision,
+        current_revision=message.current_stream_revision,
+    )
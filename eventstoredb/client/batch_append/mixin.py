@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+from eventstoredb.client.batch_append.exceptions import BatchAppendWriterClosedError
+from eventstoredb.client.batch_append.grpc import (
+    BatchAppendRequestChunker,
+    convert_batch_append_response,
+)
+from eventstoredb.client.batch_append.types import BatchAppendOptions
+from eventstoredb.client.exceptions import ClientError
+from eventstoredb.client.protocol import ClientProtocol
+from eventstoredb.events import EventData
+from eventstoredb.generated.event_store.client.streams import (
+    BatchAppendReq,
+    BatchAppendResp,
+    StreamsStub,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from grpclib.client import Channel
+
+    from eventstoredb.client.append_to_stream.types import AppendResult
+    from eventstoredb.compression import CompressionOptions
+
+
+class BatchAppendMixin(ClientProtocol):
+    def batch_append_writer(self) -> BatchAppendWriter:
+        return BatchAppendWriter(
+            channel=self.channel,
+            compression=self.options.compression,
+            structured_uuids=self.options.structured_uuids,
+        )
+
+
+REQUEST_QUEUE_SIZE = 16  # chunks waiting to be sent
+
+
+# NOTE not using union-operator for python3.9 compatibility
+class RequestQueue(AsyncIterator[BatchAppendReq], asyncio.Queue[Optional[BatchAppendReq]]):
+    def __aiter__(self) -> AsyncIterator[BatchAppendReq]:
+        return self
+
+    async def __anext__(self) -> BatchAppendReq:
+        request = await self.get()
+        if request is None:
+            raise StopAsyncIteration
+        return request
+
+
+class BatchAppendWriter:
+    def __init__(
+        self,
+        channel: Channel,
+        compression: CompressionOptions | None = None,
+        structured_uuids: bool = False,
+        queue_size: int = REQUEST_QUEUE_SIZE,
+    ) -> None:
+        self._client = StreamsStub(channel=channel)
+        self._compression = compression
+        self._structured_uuids = structured_uuids
+        # producers wait for the request-stream once this many chunks are queued
+        self._request_queue = RequestQueue(maxsize=queue_size)
+        self._pending: dict[str, tuple[str, asyncio.Future[AppendResult]]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> BatchAppendWriter:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def append_to_stream(
+        self,
+        stream_name: str,
+        events: EventData | Iterable[EventData] | AsyncIterable[EventData],
+        options: BatchAppendOptions | None = None,
+    ) -> AppendResult:
+        if self._closed:
+            raise BatchAppendWriterClosedError
+        if options is None:
+            options = BatchAppendOptions()
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._receive_responses())
+
+        correlation_id = uuid4()
+        future: asyncio.Future[AppendResult] = asyncio.get_running_loop().create_future()
+        self._pending[str(correlation_id)] = (stream_name, future)
+
+        # events are sent in chunks of at most max_chunk_size bytes, the server only
+        # commits them once the chunk marked as final has been received
+        chunker = BatchAppendRequestChunker(
+            correlation_id=correlation_id,
+            stream_name=stream_name,
+            options=options,
+            compression=self._compression,
+            structured_uuids=self._structured_uuids,
+        )
+        try:
+            await self._send_chunks(chunker, events)
+        except BaseException:
+            # only this append fails, the writer stays open for the others. without a final
+            # chunk the server never commits the chunks already sent, it drops them once the
+            # deadline passes or the request-stream ends and the late response is ignored
+            self._pending.pop(str(correlation_id), None)
+            if future.done() and not future.cancelled():
+                future.exception()
+            raise
+        return await future
+
+    async def _send_chunks(
+        self,
+        chunker: BatchAppendRequestChunker,
+        events: EventData | Iterable[EventData] | AsyncIterable[EventData],
+    ) -> None:
+        if isinstance(events, EventData):
+            events = [events]
+        if isinstance(events, AsyncIterable):
+            async for event in events:
+                await self._put_chunk(chunker.add(event))
+        else:
+            for event in events:
+                await self._put_chunk(chunker.add(event))
+        await self._put_chunk(chunker.finish())
+
+    async def _put_chunk(self, request: BatchAppendReq | None) -> None:
+        if request is None:
+            return
+        if self._task is not None and self._task.done():
+            raise BatchAppendWriterClosedError
+        await self._request_queue.put(request)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            return
+        # ends the request-stream, the server then completes all outstanding appends
+        if not self._task.done():
+            await self._request_queue.put(None)
+        await self._task
+
+    async def _receive_responses(self) -> None:
+        error: Exception = BatchAppendWriterClosedError()
+        try:
+            async for response in self._client.batch_append(self._request_queue):
+                self._resolve(response)
+        except Exception as e:  # noqa: BLE001
+            error = e
+        finally:
+            self._closed = True
+            # wakes up producers waiting for room in the queue, their next chunk raises
+            while not self._request_queue.empty():
+                self._request_queue.get_nowait()
+            for _, future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    def _resolve(self, response: BatchAppendResp) -> None:
+        pending = self._pending.pop(response.correlation_id.string, None)
+        if pending is None:
+            return
+        stream_name, future = pending
+        if future.done():
+            return
+        try:
+            future.set_result(convert_batch_append_response(stream_name, response))
+        except ClientError as e:
+            future.set_exception(e)
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from eventstoredb.client.append_to_stream.types import AppendToStreamOptions
+
+
+@dataclass
+class BatchAppendOptions(AppendToStreamOptions):
+    deadline: int | None = None  # milliseconds
+    max_chunk_size: int = 1024 * 1024  # bytes
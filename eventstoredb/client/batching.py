@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+async def iterate_batches(
+    responses: AsyncIterator[R],
+    convert: Callable[[R], T],
+    batch_size: int,
+    max_wait: int | None = None,
+) -> AsyncIterator[list[T]]:
+    if max_wait is None:
+        batch: list[T] = []
+        async for response in responses:
+            batch.append(convert(response))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    async for batch in iterate_timed_batches(responses, convert, batch_size, max_wait):
+        yield batch
+
+
+async def iterate_timed_batches(
+    responses: AsyncIterator[R],
+    convert: Callable[[R], T],
+    batch_size: int,
+    max_wait: int,
+) -> AsyncIterator[list[T]]:
+    loop = asyncio.get_running_loop()
+    # the pending receive survives a timeout, so no response is lost when a batch is cut short
+    receive: asyncio.Future[Any] | None = None
+    batch: list[T] = []
+    deadline = 0.0
+    try:
+        while True:
+            if receive is None:
+                receive = asyncio.ensure_future(responses.__anext__())
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            done, _ = await asyncio.wait({receive}, timeout=timeout)
+            if not done:
+                yield batch
+                batch = []
+                continue
+            received, receive = receive, None
+            try:
+                response = received.result()
+            except StopAsyncIteration:
+                break
+            if not batch:
+                deadline = loop.time() + max_wait / 1000
+            batch.append(convert(response))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        if receive is not None:
+            receive.cancel()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from eventstoredb.events import RecordedEvent
+from eventstoredb.types import AllPosition, StreamPosition, StreamRevision
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from eventstoredb.events import ReadEvent
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class StreamRevisionCache(LRUCache[str, StreamRevision]):
+    def update(self, stream_name: str, revision: StreamRevision) -> None:
+        # results of concurrent operations may arrive out of order, never go backwards
+        current = self.get(stream_name)
+        if current is None or revision > current:
+            self.put(stream_name, revision)
+
+
+# the stream name and revision of the event a link points to
+LinkTarget = tuple[str, StreamRevision]
+
+
+class LinkCache(LRUCache[LinkTarget, RecordedEvent]):
+    # resolved link targets, events are immutable once written so entries never go stale.
+    # a truncated or deleted target may still be served until it is evicted
+    ...
+
+
+class PositionCache(LRUCache[int, AllPosition]):
+    # positions in $all found for timestamps in ticks
+    ...
+
+
+# rough memory use of a decoded event without its payload, see benchmarks/bench_event_memory.py
+EVENT_SIZE_OVERHEAD = 1000
+
+
+def estimate_event_size(event: ReadEvent) -> int:
+    size = EVENT_SIZE_OVERHEAD
+    if event.event is not None:
+        size += len(event.event.data or b"") + len(event.event.metadata or b"")
+    return size
+
+
+@dataclass
+class CachedStream:
+    # the events of a stream from its first readable revision on, without gaps
+    metadata_revision: StreamRevision | None
+    events: list[ReadEvent] = field(default_factory=list)
+    size: int = 0
+
+    def append(self, event: ReadEvent) -> None:
+        self.events.append(event)
+        self.size += estimate_event_size(event)
+
+    def extend(self, events: Iterable[ReadEvent]) -> None:
+        # concurrent reads of the stream fetch the same tail, events already held are skipped
+        for event in events:
+            next_revision = self.next_revision
+            if (
+                isinstance(next_revision, StreamRevision)
+                and event.event is not None
+                and event.event.revision < next_revision
+            ):
+                continue
+            self.append(event)
+
+    @property
+    def next_revision(self) -> StreamRevision | StreamPosition:
+        if not self.events or self.events[-1].event is None:
+            return StreamPosition.START
+        return self.events[-1].event.revision + 1
+
+    def index(self, from_revision: StreamRevision | StreamPosition) -> int | None:
+        if from_revision == StreamPosition.START:
+            return 0
+        if not isinstance(from_revision, StreamRevision) or not self.events:
+            return None
+        first_event = self.events[0].event
+        if first_event is None:
+            return None
+        index = from_revision - first_event.revision
+        if 0 <= index <= len(self.events):
+            return index
+        return None
+
+
+class StreamEventCache(LRUCache[str, CachedStream]):
+    # max_size is in bytes, entries are weighed by the estimated size of their events
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self.size = 0
+
+    def put(self, key: str, value: CachedStream) -> None:
+        self.pop(key)
+        self._entries[key] = value
+        self.size += value.size
+        self._evict()
+
+    def extend(self, key: str, value: CachedStream, events: Iterable[ReadEvent]) -> None:
+        # the entry grows in place, so its growth has to be added to the size of the cache
+        if self._entries.get(key) is not value:
+            value.extend(events)
+            self.put(key, value)
+            return
+        size = value.size
+        value.extend(events)
+        self._entries.move_to_end(key)
+        self.size += value.size - size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_size and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def pop(self, key: str) -> CachedStream | None:
+        value = super().pop(key)
+        if value is not None:
+            self.size -= value.size
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self.size = 0
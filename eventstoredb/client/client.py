@@ -2,7 +2,15 @@ from __future__ import annotations
 
 from grpclib.client import Channel
 
+from eventstoredb.client.append_many.mixin import AppendManyMixin
 from eventstoredb.client.append_to_stream.mixin import AppendToStreamMixin
+from eventstoredb.client.batch_append.mixin import BatchAppendMixin
+from eventstoredb.client.cache import (
+    LinkCache,
+    PositionCache,
+    StreamEventCache,
+    StreamRevisionCache,
+)
 from eventstoredb.client.create_persistent_subscription_to_all.mixin import (
     CreatePersistentSubscriptionToAllMixin,
 )
@@ -15,11 +23,17 @@ from eventstoredb.client.delete_persistent_subscription_to_all.mixin import (
 from eventstoredb.client.delete_persistent_subscription_to_stream.mixin import (
     DeletePersistentSubscriptionToStreamMixin,
 )
+from eventstoredb.client.find_position.mixin import FindPositionMixin
 from eventstoredb.client.get_persistent_subscription_details.mixin import (
     GetPersistentSubscriptionDetailsMixin,
 )
 from eventstoredb.client.read_all.mixin import ReadAllMixin
+from eventstoredb.client.read_paged.mixin import ReadPagedMixin
 from eventstoredb.client.read_stream.mixin import ReadStreamMixin
+from eventstoredb.client.read_streams.mixin import ReadStreamsMixin
+from eventstoredb.client.resolve_links.mixin import ResolveLinksMixin
+from eventstoredb.client.scan_all.mixin import ScanAllMixin
+from eventstoredb.client.segment_cache import SegmentCache
 from eventstoredb.client.subscribe_to_all.mixin import SubscribeToAllMixin
 from eventstoredb.client.subscribe_to_persistent_subscription_to_all.mixin import (
     SubscribeToPersistentSubscriptionToAllMixin,
@@ -35,12 +49,20 @@ from eventstoredb.client.update_persistent_subscription_to_all.mixin import (
 from eventstoredb.client.update_persistent_subscription_to_stream.mixin import (
     UpdatePersistentSubscriptionToStreamMixin,
 )
+from eventstoredb.serializers import Serializer, get_serializer
 
 
 class Client(
+    ReadPagedMixin,
+    ReadStreamsMixin,
+    ResolveLinksMixin,
     ReadStreamMixin,
+    AppendManyMixin,
     AppendToStreamMixin,
+    BatchAppendMixin,
     SubscribeToStreamMixin,
+    ScanAllMixin,
+    FindPositionMixin,
     ReadAllMixin,
     SubscribeToAllMixin,
     CreatePersistentSubscriptionToStreamMixin,
@@ -59,9 +81,56 @@ class Client(
         else:
             self._options = options
         self._channel: Channel | None = None
+        self._revision_cache: StreamRevisionCache | None = None
+        if self._options.revision_cache_size > 0:
+            self._revision_cache = StreamRevisionCache(self._options.revision_cache_size)
+        self._read_cache: StreamEventCache | None = None
+        if self._options.read_cache_size > 0:
+            self._read_cache = StreamEventCache(self._options.read_cache_size)
+        self._link_cache: LinkCache | None = None
+        if self._options.link_cache_size > 0:
+            self._link_cache = LinkCache(self._options.link_cache_size)
+        self._position_cache: PositionCache | None = None
+        if self._options.position_cache_size > 0:
+            self._position_cache = PositionCache(self._options.position_cache_size)
+        self._segment_cache: SegmentCache | None = None
+        if self._options.segment_cache_dir is not None:
+            self._segment_cache = SegmentCache(self._options.segment_cache_dir)
+        self._serializer = get_serializer(self._options.serializer)
+
+    @property
+    def options(self) -> ClientOptions:
+        return self._options
+
+    @property
+    def revision_cache(self) -> StreamRevisionCache | None:
+        return self._revision_cache
+
+    @property
+    def read_cache(self) -> StreamEventCache | None:
+        return self._read_cache
+
+    @property
+    def link_cache(self) -> LinkCache | None:
+        return self._link_cache
+
+    @property
+    def position_cache(self) -> PositionCache | None:
+        return self._position_cache
+
+    @property
+    def segment_cache(self) -> SegmentCache | None:
+        return self._segment_cache
+
+    @property
+    def serializer(self) -> Serializer:
+        return self._serializer
 
     @property
     def channel(self) -> Channel:
         if self._channel is None:
-            self._channel = Channel(host=self._options.host, port=self._options.port)
+            self._channel = self.create_channel()
         return self._channel
+
+    def create_channel(self) -> Channel:
+        return Channel(host=self._options.host, port=self._options.port)
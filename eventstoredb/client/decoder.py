@@ -0,0 +1,619 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar, Union, cast
+from uuid import UUID
+
+import betterproto
+
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.client.subscribe_to_all.grpc import convert_subscribe_to_all_response
+from eventstoredb.client.subscribe_to_all.types import Checkpoint
+from eventstoredb.client.subscribe_to_persistent_subscription_to_stream.grpc import (
+    convert_read_response as convert_persistent_subscription_read_response,
+)
+from eventstoredb.client.subscribe_to_persistent_subscription_to_stream.types import (
+    PersistentSubscriptionConfirmation,
+)
+from eventstoredb.client.subscribe_to_stream.types import SubscriptionConfirmation
+from eventstoredb.compression import is_compressed_payload
+from eventstoredb.events import (
+    BinaryRecordedEvent,
+    CaughtUp,
+    CompressedBinaryRecordedEvent,
+    ContentType,
+    FellBehind,
+    JsonRecordedEvent,
+    PersistentSubscriptionEvent,
+    ReadEvent,
+)
+from eventstoredb.generated.event_store.client import persistent_subscriptions, streams
+from eventstoredb.types import AllPosition
+from eventstoredb.utils import INT64_MASK, uuid_from_int
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Iterable
+
+    from grpclib.client import Channel
+    from grpclib.metadata import Deadline
+
+    from eventstoredb.client.protocol import ClientProtocol
+    from eventstoredb.serializers import Serializer
+
+T = TypeVar("T")
+
+# NOTE not using union-operator for python3.9 compatibility
+# records are decoded from received messages as well as from memory-mapped files
+Buffer = Union[bytes, memoryview]
+ReadResponse = Union[ReadEvent, CaughtUp, FellBehind, SubscriptionConfirmation, Checkpoint]
+PersistentSubscriptionReadResponse = Union[
+    PersistentSubscriptionEvent,
+    PersistentSubscriptionConfirmation,
+]
+
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_FIXED64 = 1
+WIRE_TYPE_LENGTH_DELIMITED = 2
+WIRE_TYPE_FIXED32 = 5
+
+# field numbers of the content oneof of both ReadResp messages
+READ_RESPONSE_CONTENT = range(1, 10)
+PERSISTENT_SUBSCRIPTION_READ_RESPONSE_CONTENT = range(1, 3)
+
+# an unset id decodes like an empty structured uuid
+EMPTY_UUID = UUID(int=0)
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def read_varint(data: Buffer, pos: int) -> tuple[int, int]:
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = data[pos]
+        result |= (byte & 0x7F) << shift
+        pos += 1
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def skip_field(data: Buffer, pos: int, wire_type: int) -> int:
+    if wire_type == WIRE_TYPE_VARINT:
+        _, pos = read_varint(data, pos)
+        return pos
+    if wire_type == WIRE_TYPE_FIXED64:
+        return pos + 8
+    if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+        length, pos = read_varint(data, pos)
+        return pos + length
+    if wire_type == WIRE_TYPE_FIXED32:
+        return pos + 4
+    raise DecodeError(f"unsupported wire type {wire_type}")  # noqa: TRY003
+
+
+def decode_uuid(data: Buffer, pos: int, end: int) -> UUID:
+    string = ""
+    most_significant_bits = least_significant_bits = 0
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key & 7 != WIRE_TYPE_LENGTH_DELIMITED:
+            pos = skip_field(data, pos, key & 7)
+            continue
+        length, pos = read_varint(data, pos)
+        # string and structured are a oneof, whichever comes last wins
+        if key >> 3 == 1:
+            string = ""
+            most_significant_bits, least_significant_bits = decode_uuid_structured(
+                data,
+                pos,
+                pos + length,
+            )
+        elif key >> 3 == 2:
+            string = str(data[pos : pos + length], "utf-8")
+            most_significant_bits = least_significant_bits = 0
+        pos += length
+    if string:
+        return UUID(string)
+    # negative int64 are sent as their 64 bit two's complement, which is what the uuid needs
+    return uuid_from_int(
+        (most_significant_bits & INT64_MASK) << 64 | least_significant_bits & INT64_MASK,
+    )
+
+
+def decode_uuid_structured(data: Buffer, pos: int, end: int) -> tuple[int, int]:
+    most_significant_bits = least_significant_bits = 0
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key & 7 == WIRE_TYPE_VARINT and key >> 3 in (1, 2):
+            value, pos = read_varint(data, pos)
+            if key >> 3 == 1:
+                most_significant_bits = value
+            else:
+                least_significant_bits = value
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return most_significant_bits, least_significant_bits
+
+
+def decode_stream_name(data: Buffer, pos: int, end: int) -> str:
+    value: Buffer = b""
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key >> 3 == 3 and key & 7 == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            value = data[pos : pos + length]
+            pos += length
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return str(value, "utf-8")
+
+
+def decode_map_entry(data: Buffer, pos: int, end: int) -> tuple[str, str]:
+    key_value = value = ""
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key & 7 == WIRE_TYPE_LENGTH_DELIMITED and key >> 3 in (1, 2):
+            length, pos = read_varint(data, pos)
+            if key >> 3 == 1:
+                key_value = str(data[pos : pos + length], "utf-8")
+            else:
+                value = str(data[pos : pos + length], "utf-8")
+            pos += length
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return key_value, value
+
+
+def decode_recorded_event(  # noqa: C901
+    data: Buffer,
+    pos: int,
+    end: int,
+    serializer: Serializer,
+    headers_only: bool = False,
+    decompress: bool = False,
+) -> JsonRecordedEvent | BinaryRecordedEvent:
+    event_id = EMPTY_UUID
+    stream_name = ""
+    revision = prepare_position = commit_position = 0
+    metadata: dict[str, str] = {}
+    custom_metadata = payload = b""
+
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        field_number = key >> 3
+        wire_type = key & 7
+        if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            field_end = pos + length
+            if field_number == 1:
+                event_id = decode_uuid(data, pos, field_end)
+            elif field_number == 2:
+                stream_name = decode_stream_name(data, pos, field_end)
+            elif field_number == 6:
+                entry_key, entry_value = decode_map_entry(data, pos, field_end)
+                metadata[entry_key] = entry_value
+            # the payloads are left in the buffer when only the headers are needed
+            elif field_number == 7 and not headers_only:
+                custom_metadata = bytes(data[pos:field_end])
+            elif field_number == 8 and not headers_only:
+                payload = bytes(data[pos:field_end])
+            pos = field_end
+        elif wire_type == WIRE_TYPE_VARINT:
+            value, pos = read_varint(data, pos)
+            if field_number == 3:
+                revision = value
+            elif field_number == 4:
+                prepare_position = value
+            elif field_number == 5:
+                commit_position = value
+        else:
+            pos = skip_field(data, pos, wire_type)
+
+    content_type = ContentType(metadata["content-type"])
+    event_class: Callable[..., JsonRecordedEvent | BinaryRecordedEvent]
+    if content_type == ContentType.JSON:
+        event_class = partial(JsonRecordedEvent, serializer=serializer)
+    elif decompress and is_compressed_payload(payload):
+        event_class = CompressedBinaryRecordedEvent
+    else:
+        event_class = BinaryRecordedEvent
+    return event_class(
+        stream_name=stream_name,
+        id=event_id,
+        revision=revision,
+        type=metadata["type"],
+        content_type=content_type,
+        created=int(metadata["created"]),
+        position=AllPosition(
+            commit_position=commit_position,
+            prepare_position=prepare_position,
+        ),
+        data=payload or None,
+        metadata=custom_metadata or None,
+    )
+
+
+def decode_read_event(  # noqa: C901
+    data: Buffer,
+    pos: int,
+    end: int,
+    serializer: Serializer,
+    persistent: bool = False,
+    headers_only: bool = False,
+    decompress: bool = False,
+) -> ReadEvent | PersistentSubscriptionEvent:
+    event = link = None
+    commit_position = retry_count = 0
+
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        field_number = key >> 3
+        wire_type = key & 7
+        if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            field_end = pos + length
+            # empty messages are treated as unset, same as betterproto does
+            if field_number == 1 and length:
+                event = decode_recorded_event(
+                    data,
+                    pos,
+                    field_end,
+                    serializer,
+                    headers_only,
+                    decompress,
+                )
+            elif field_number == 2 and length:
+                link = decode_recorded_event(
+                    data,
+                    pos,
+                    field_end,
+                    serializer,
+                    headers_only,
+                    decompress,
+                )
+            elif field_number == 4:
+                commit_position = 0
+            elif field_number == 6:
+                retry_count = 0
+            pos = field_end
+        elif wire_type == WIRE_TYPE_VARINT:
+            value, pos = read_varint(data, pos)
+            if field_number == 3:
+                commit_position = value
+            elif field_number == 5:
+                # int32 is sign-extended to 64 bits on the wire
+                retry_count = value - (1 << 64) if value >= 1 << 63 else value
+        else:
+            pos = skip_field(data, pos, wire_type)
+
+    if persistent:
+        return PersistentSubscriptionEvent(
+            event=event,
+            link=link,
+            commit_position=commit_position or None,
+            retry_count=retry_count or None,
+        )
+    return ReadEvent(event=event, link=link, commit_position=commit_position or None)
+
+
+def decode_stream_identifier(data: Buffer, pos: int, end: int) -> str:
+    stream_name = ""
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key >> 3 == 1 and key & 7 == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            stream_name = decode_stream_name(data, pos, pos + length)
+            pos += length
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return stream_name
+
+
+def decode_checkpoint(data: Buffer, pos: int, end: int) -> Checkpoint:
+    commit_position = prepare_position = 0
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key & 7 == WIRE_TYPE_VARINT and key >> 3 in (1, 2):
+            value, pos = read_varint(data, pos)
+            if key >> 3 == 1:
+                commit_position = value
+            else:
+                prepare_position = value
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return Checkpoint(commit_position=commit_position, prepare_position=prepare_position)
+
+
+def decode_string_field(data: Buffer, pos: int, end: int, field_number: int) -> str:
+    value = ""
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        if key >> 3 == field_number and key & 7 == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            value = str(data[pos : pos + length], "utf-8")
+            pos += length
+        else:
+            pos = skip_field(data, pos, key & 7)
+    return value
+
+
+def find_content(data: Buffer, field_numbers: range) -> tuple[int, int, int]:
+    # the last field of a oneof on the wire wins, so the content is decoded after the scan
+    content = (0, 0, 0)
+    pos = 0
+    end = len(data)
+    while pos < end:
+        key, pos = read_varint(data, pos)
+        field_number = key >> 3
+        wire_type = key & 7
+        if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = read_varint(data, pos)
+            if field_number in field_numbers:
+                content = (field_number, pos, pos + length)
+            pos += length
+        else:
+            if field_number in field_numbers:
+                content = (field_number, 0, 0)
+            pos = skip_field(data, pos, wire_type)
+    return content
+
+
+def decode_read_response(
+    data: Buffer,
+    serializer: Serializer,
+    headers_only: bool = False,
+    decompress: bool = False,
+) -> ReadResponse:
+    field_number, pos, end = find_content(data, READ_RESPONSE_CONTENT)
+    if field_number == 1:
+        return decode_read_event(
+            data,
+            pos,
+            end,
+            serializer,
+            headers_only=headers_only,
+            decompress=decompress,
+        )
+    if field_number == 2:
+        return SubscriptionConfirmation(id=decode_string_field(data, pos, end, 1))
+    if field_number == 3:
+        return decode_checkpoint(data, pos, end)
+    if field_number == 4:
+        raise StreamNotFoundError(stream_name=decode_stream_identifier(data, pos, end))
+    if field_number == 8:
+        return CaughtUp()
+    if field_number == 9:
+        return FellBehind()
+    # everything else is rare enough to go through betterproto
+    message = streams.ReadResp().parse(bytes(data))
+    return convert_subscribe_to_all_response(
+        message,
+        serializer=serializer,
+        decompress=decompress,
+    )
+
+
+def decode_persistent_subscription_read_response(
+    data: Buffer,
+    serializer: Serializer,
+    decompress: bool = False,
+) -> PersistentSubscriptionReadResponse:
+    field_number, pos, end = find_content(data, PERSISTENT_SUBSCRIPTION_READ_RESPONSE_CONTENT)
+    if field_number == 1:
+        return cast(
+            "PersistentSubscriptionEvent",
+            decode_read_event(data, pos, end, serializer, persistent=True, decompress=decompress),
+        )
+    if field_number == 2:
+        return PersistentSubscriptionConfirmation(id=decode_string_field(data, pos, end, 1))
+    message = persistent_subscriptions.ReadResp().parse(bytes(data))
+    return convert_persistent_subscription_read_response(
+        message,
+        serializer=serializer,
+        decompress=decompress,
+    )
+
+
+class ReadResponseDecoder:
+    # stands in for the message type, grpclib hands the raw bytes to FromString
+    def __init__(
+        self,
+        serializer: Serializer,
+        headers_only: bool = False,
+        decompress: bool = False,
+    ) -> None:
+        self.serializer = serializer
+        self.headers_only = headers_only
+        self.decompress = decompress
+
+    def FromString(self, data: bytes) -> ReadResponse:  # noqa: N802
+        return decode_read_response(data, self.serializer, self.headers_only, self.decompress)
+
+
+class PersistentSubscriptionReadResponseDecoder:
+    def __init__(self, serializer: Serializer, decompress: bool = False) -> None:
+        self.serializer = serializer
+        self.decompress = decompress
+
+    def FromString(self, data: bytes) -> PersistentSubscriptionReadResponse:  # noqa: N802
+        return decode_persistent_subscription_read_response(
+            data,
+            self.serializer,
+            self.decompress,
+        )
+
+
+class RawResponseDecoder:
+    # hands out the received bytes as they are, for callers that keep them around
+    @staticmethod
+    def FromString(data: bytes) -> bytes:  # noqa: N802
+        return data
+
+
+class DecodingStreamsStub(streams.StreamsStub):
+    def __init__(
+        self,
+        channel: Channel,
+        serializer: Serializer,
+        headers_only: bool = False,
+        decompress: bool = False,
+    ) -> None:
+        super().__init__(channel=channel)
+        self._decoder = ReadResponseDecoder(
+            serializer,
+            headers_only=headers_only,
+            decompress=decompress,
+        )
+
+    async def read_decoded(
+        self,
+        read_req: streams.ReadReq,
+        *,
+        timeout: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[ReadResponse]:
+        async for response in self._unary_stream(
+            "/event_store.client.streams.Streams/Read",
+            read_req,
+            self._decoder,
+            timeout=timeout,
+            deadline=deadline,
+        ):
+            yield cast("ReadResponse", response)
+
+    async def read_raw(
+        self,
+        read_req: streams.ReadReq,
+        *,
+        timeout: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[bytes]:
+        async for response in self._unary_stream(
+            "/event_store.client.streams.Streams/Read",
+            read_req,
+            RawResponseDecoder,
+            timeout=timeout,
+            deadline=deadline,
+        ):
+            yield cast("bytes", response)
+
+
+class DecodingPersistentSubscriptionsStub(persistent_subscriptions.PersistentSubscriptionsStub):
+    def __init__(self, channel: Channel, serializer: Serializer, decompress: bool = False) -> None:
+        super().__init__(channel=channel)
+        self._decoder = PersistentSubscriptionReadResponseDecoder(serializer, decompress)
+
+    async def read_decoded(
+        self,
+        read_req_iterator: AsyncIterable[persistent_subscriptions.ReadReq]
+        | Iterable[persistent_subscriptions.ReadReq],
+        *,
+        timeout: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[PersistentSubscriptionReadResponse]:
+        async for response in self._stream_stream(
+            "/event_store.client.persistent_subscriptions.PersistentSubscriptions/Read",
+            read_req_iterator,
+            persistent_subscriptions.ReadReq,
+            self._decoder,
+            timeout=timeout,
+            deadline=deadline,
+        ):
+            yield cast("PersistentSubscriptionReadResponse", response)
+
+
+async def iterate_read_responses(
+    client: ClientProtocol,
+    request: streams.ReadReq,
+    convert: Callable[..., T],
+    channel: Channel | None = None,
+    headers_only: bool = False,
+) -> AsyncGenerator[T, None]:
+    if channel is None:
+        channel = client.channel
+    # payloads that look compressed are only decompressed by clients that compress
+    decompress = client.options.compression is not None
+
+    # lazy recorded events keep the betterproto message around, decoding it upfront would be wasted
+    if client.options.fast_decoder and not client.options.lazy_recorded_events:
+        stub = DecodingStreamsStub(
+            channel=channel,
+            serializer=client.serializer,
+            headers_only=headers_only,
+            decompress=decompress,
+        )
+        async for response in stub.read_decoded(read_req=request):
+            # the decoder produces what the converters produce for the same message
+            yield cast("T", response)
+        return
+
+    async for message in streams.StreamsStub(channel=channel).read(read_req=request):
+        if headers_only:
+            clear_payloads(message)
+        yield convert(
+            message,
+            serializer=client.serializer,
+            lazy=client.options.lazy_recorded_events,
+            decompress=decompress,
+        )
+
+
+def create_read_response_decoder(
+    client: ClientProtocol,
+    convert: Callable[..., T],
+    headers_only: bool = False,
+) -> Callable[[Buffer], T]:
+    # decodes received bytes with the same choice of decoder as iterate_read_responses
+    decompress = client.options.compression is not None
+    if client.options.fast_decoder and not client.options.lazy_recorded_events:
+        return cast(
+            "Callable[[Buffer], T]",
+            partial(
+                decode_read_response,
+                serializer=client.serializer,
+                headers_only=headers_only,
+                decompress=decompress,
+            ),
+        )
+
+    def decode(data: Buffer) -> T:
+        # copied, lazy recorded events keep the message and the buffer may be released
+        message = streams.ReadResp().parse(bytes(data))
+        if headers_only:
+            clear_payloads(message)
+        return convert(
+            message,
+            serializer=client.serializer,
+            lazy=client.options.lazy_recorded_events,
+            decompress=decompress,
+        )
+
+    return decode
+
+
+async def iterate_raw_read_responses(
+    client: ClientProtocol,
+    request: streams.ReadReq,
+    channel: Channel | None = None,
+) -> AsyncGenerator[bytes, None]:
+    stub = DecodingStreamsStub(channel=channel or client.channel, serializer=client.serializer)
+    async for data in stub.read_raw(read_req=request):
+        yield data
+
+
+def clear_payloads(message: streams.ReadResp) -> None:
+    # betterproto has parsed the payloads already, dropping them keeps them from being held
+    content_type, _ = betterproto.which_one_of(message, "content")
+    if content_type != "event":
+        return
+    for recorded_event in (message.event.event, message.event.link):
+        if recorded_event:
+            recorded_event.data = b""
+            recorded_event.custom_metadata = b""
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.read_all.mixin import ReadAllMixin
+from eventstoredb.client.read_all.types import ReadAllOptions
+from eventstoredb.client.scan_all.types import position_key
+from eventstoredb.events import ReadEvent
+from eventstoredb.types import AllPosition, ReadDirection, StreamPosition
+
+if TYPE_CHECKING:
+    from eventstoredb.events import RecordedEvent
+
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+TICKS_PER_MICROSECOND = 10
+SCAN_PAGE_SIZE = 100
+
+
+class FindPositionMixin(ReadAllMixin):
+    async def find_position_at(self, timestamp: datetime) -> AllPosition | None:
+        # the position of the first event created at or after the timestamp, None when there
+        # is no such event yet. read_all starts at this event, subscribe_to_all after it
+        ticks = to_ticks(timestamp)
+        if self.position_cache is not None:
+            cached = self.position_cache.get(ticks)
+            if cached is not None:
+                return cached
+
+        position = await self._find_position_at(ticks)
+        # a missing position is not cached, the event may be written later
+        if position is not None and self.position_cache is not None:
+            self.position_cache.put(ticks, position)
+        return position
+
+    async def _find_position_at(self, ticks: int) -> AllPosition | None:
+        first, last = await asyncio.gather(
+            self._probe_event(StreamPosition.START, ReadDirection.FORWARDS),
+            self._probe_event(StreamPosition.END, ReadDirection.BACKWARDS),
+        )
+        if first is None or last is None or last.created < ticks:
+            return None
+        if first.created >= ticks:
+            return first.position
+
+        # created is taken as increasing along $all. low is created before the timestamp and high
+        # at or after it, every event between them has a commit position below upper. a probe
+        # reads the first event at or after a position, so the commit position range is halved
+        low, high = first, last
+        upper = high.position.commit_position
+        while upper - low.position.commit_position > 1:
+            middle = (low.position.commit_position + upper) // 2
+            event = await self._probe_event(AllPosition(middle, middle), ReadDirection.FORWARDS)
+            if event is None or position_key(event.position) >= position_key(high.position):
+                upper = middle
+            elif event.created < ticks:
+                low = event
+            else:
+                high = event
+                upper = high.position.commit_position
+
+        return await self._scan_position_at(low.position, high.position, ticks)
+
+    async def _scan_position_at(
+        self,
+        from_position: AllPosition,
+        end: AllPosition,
+        ticks: int,
+    ) -> AllPosition:
+        # only events of the same commit as low or high are left between them
+        while True:
+            options = ReadAllOptions(
+                from_position=from_position,
+                max_count=SCAN_PAGE_SIZE,
+                headers_only=True,
+            )
+            events = [
+                e.event
+                async for e in self.read_all(options)
+                if isinstance(e, ReadEvent) and e.event is not None
+            ]
+            for event in events:
+                if event.created >= ticks or position_key(event.position) >= position_key(end):
+                    return event.position
+            if len(events) < SCAN_PAGE_SIZE:
+                return end
+            from_position = events[-1].position
+
+    async def _probe_event(
+        self,
+        from_position: AllPosition | StreamPosition,
+        direction: ReadDirection,
+    ) -> RecordedEvent | None:
+        options = ReadAllOptions(
+            from_position=from_position,
+            direction=direction,
+            max_count=1,
+            headers_only=True,
+        )
+        events = [
+            e.event
+            async for e in self.read_all(options)
+            if isinstance(e, ReadEvent) and e.event is not None
+        ]
+        return events[0] if events else None
+
+
+def to_ticks(timestamp: datetime) -> int:
+    # created is in 100ns ticks since the unix epoch, naive timestamps are taken as UTC
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - UNIX_EPOCH) // timedelta(microseconds=1) * TICKS_PER_MICROSECOND
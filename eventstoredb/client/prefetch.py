@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+T = TypeVar("T")
+
+
+@dataclass
+class PrefetchEnd:
+    error: Exception | None = None
+
+
+async def iterate_prefetched(responses: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    # the responses are received by a background task, so receiving and decoding the next
+    # ones overlaps with the consumer handling the current one. at most size are held
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=size)
+
+    async def fill() -> None:
+        error = None
+        try:
+            async for response in responses:
+                await queue.put(response)
+        except Exception as e:  # noqa: BLE001
+            error = e
+        finally:
+            aclose = getattr(responses, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(PrefetchEnd(error=error))
+
+    task = asyncio.create_task(fill())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, PrefetchEnd):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -5,7 +5,40 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from grpclib.client import Channel
 
+    from eventstoredb.client.cache import (
+        LinkCache,
+        PositionCache,
+        StreamEventCache,
+        StreamRevisionCache,
+    )
+    from eventstoredb.client.segment_cache import SegmentCache
+    from eventstoredb.client.types import ClientOptions
+    from eventstoredb.serializers import Serializer
+
 
 class ClientProtocol(Protocol):
     @property
     def channel(self) -> Channel: ...
+
+    @property
+    def options(self) -> ClientOptions: ...
+
+    @property
+    def revision_cache(self) -> StreamRevisionCache | None: ...
+
+    @property
+    def read_cache(self) -> StreamEventCache | None: ...
+
+    @property
+    def link_cache(self) -> LinkCache | None: ...
+
+    @property
+    def position_cache(self) -> PositionCache | None: ...
+
+    @property
+    def segment_cache(self) -> SegmentCache | None: ...
+
+    @property
+    def serializer(self) -> Serializer: ...
+
+    def create_channel(self) -> Channel: ...
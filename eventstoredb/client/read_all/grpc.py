@@ -24,12 +24,18 @@ if TYPE_CHECKING:
     from eventstoredb.client.read_all.types import ReadAllOptions
 
 
-def create_read_all_request(options: ReadAllOptions) -> ReadReq:  # noqa: C901
+def create_read_all_request(  # noqa: C901
+    options: ReadAllOptions,
+    structured_uuids: bool = False,
+) -> ReadReq:
     request_options = ReadReqOptions()
 
     request_options.resolve_links = options.resolve_links
     request_options.count = options.max_count
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
 
     if options.direction == ReadDirection.FORWARDS:
         request_options.read_direction = ReadReqOptionsReadDirection.Forwards
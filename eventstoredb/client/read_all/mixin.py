@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from typing import TYPE_CHECKING, cast
 
+from eventstoredb.client.batching import iterate_batches
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.prefetch import iterate_prefetched
 from eventstoredb.client.protocol import ClientProtocol
 from eventstoredb.client.read_all.grpc import create_read_all_request
-from eventstoredb.client.read_all.types import ReadAllOptions
+from eventstoredb.client.read_all.types import ReadAllBatchesOptions, ReadAllOptions
 from eventstoredb.client.read_stream.grpc import convert_read_response
-from eventstoredb.generated.event_store.client.streams import StreamsStub
+from eventstoredb.client.segment_cache import (
+    is_segment_cacheable,
+    iterate_segment_cached_responses,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from eventstoredb.client.decoder import ReadResponse
     from eventstoredb.events import CaughtUp, FellBehind, ReadEvent
+    from eventstoredb.generated.event_store.client.streams import ReadReq
+    from eventstoredb.types import AllPosition, StreamPosition
 
 
 class ReadAllMixin(ClientProtocol):
@@ -22,9 +32,71 @@ class ReadAllMixin(ClientProtocol):
         if options is None:
             options = ReadAllOptions()
 
-        client = StreamsStub(channel=self.channel)
-        request = create_read_all_request(options=options)
+        responses: AsyncIterator[ReadResponse]
+        if (
+            self.segment_cache is not None
+            and is_segment_cacheable(options)
+            and self.segment_cache.covers(options.from_position)
+        ):
+            read_options = options
+
+            def create_request(from_position: AllPosition | StreamPosition, count: int) -> ReadReq:
+                return create_read_all_request(
+                    options=replace(read_options, from_position=from_position, max_count=count),
+                    structured_uuids=self.options.structured_uuids,
+                )
+
+            responses = iterate_segment_cached_responses(
+                self,
+                self.segment_cache,
+                options.from_position,
+                create_request,
+                convert_read_response,
+                max_count=options.max_count,
+                headers_only=options.headers_only,
+            )
+        else:
+            request = create_read_all_request(
+                options=options,
+                structured_uuids=self.options.structured_uuids,
+            )
+            responses = iterate_read_responses(
+                self,
+                request,
+                convert_read_response,
+                headers_only=options.headers_only,
+            )
+        if options.prefetch > 0:
+            responses = iterate_prefetched(responses, options.prefetch)
 
         # TODO raise exception StreamNotFoundError
-        async for response in client.read(read_req=request):
-            yield convert_read_response(response)
+        async for event in responses:
+            yield cast("ReadEvent | CaughtUp | FellBehind", event)
+
+    async def read_all_batches(
+        self,
+        options: ReadAllBatchesOptions | None = None,
+    ) -> AsyncIterator[list[ReadEvent | CaughtUp | FellBehind]]:
+        if options is None:
+            options = ReadAllBatchesOptions()
+
+        request = create_read_all_request(
+            options=options,
+            structured_uuids=self.options.structured_uuids,
+        )
+
+        def convert(event: ReadEvent | CaughtUp | FellBehind) -> ReadEvent | CaughtUp | FellBehind:
+            return event
+
+        async for batch in iterate_batches(
+            responses=iterate_read_responses(
+                self,
+                request,
+                convert_read_response,
+                headers_only=options.headers_only,
+            ),
+            convert=convert,
+            batch_size=options.batch_size,
+            max_wait=options.max_wait,
+        ):
+            yield batch
@@ -20,3 +20,11 @@ class ReadAllOptions:
     direction: ReadDirection = ReadDirection.FORWARDS
     resolve_links: bool = False
     filter: ExcludeSystemEventsFilter | EventTypeFilter | StreamNameFilter | None = None
+    prefetch: int = 0  # responses received ahead of the consumer
+    headers_only: bool = False  # data and metadata are left unset
+
+
+@dataclass
+class ReadAllBatchesOptions(ReadAllOptions):
+    batch_size: int = 1000
+    max_wait: int | None = None  # milliseconds
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+
+from eventstoredb.client.read_all.mixin import ReadAllMixin
+from eventstoredb.client.read_all.types import ReadAllOptions
+from eventstoredb.client.read_paged.types import (
+    PagedReadOptions,
+    ReadAllPagedOptions,
+    ReadStreamPagedOptions,
+)
+from eventstoredb.client.read_stream.mixin import ReadStreamMixin
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.events import ReadEvent
+from eventstoredb.types import AllPosition, ReadDirection, StreamPosition, StreamRevision
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from types import TracebackType
+
+C = TypeVar("C")
+R = TypeVar("R", bound="PagedReader[Any]")
+
+TRANSIENT_STATUSES = {
+    Status.UNAVAILABLE,
+    Status.DEADLINE_EXCEEDED,
+    Status.ABORTED,
+    Status.RESOURCE_EXHAUSTED,
+}
+
+
+def is_transient_error(error: Exception) -> bool:
+    if isinstance(error, GRPCError):
+        return error.status in TRANSIENT_STATUSES
+    return isinstance(error, (StreamTerminatedError, ConnectionError))
+
+
+async def aclose_iterator(iterator: AsyncIterator[Any]) -> None:
+    # closes the gRPC stream behind a read right away instead of on garbage collection
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+class ReadPagedMixin(ReadStreamMixin, ReadAllMixin):
+    def read_stream_paged(
+        self,
+        stream_name: str,
+        options: ReadStreamPagedOptions | None = None,
+    ) -> PagedStreamReader:
+        if options is None:
+            options = ReadStreamPagedOptions()
+        return PagedStreamReader(client=self, stream_name=stream_name, options=options)
+
+    def read_all_paged(
+        self,
+        options: ReadAllPagedOptions | None = None,
+    ) -> PagedAllReader:
+        if options is None:
+            options = ReadAllPagedOptions()
+        return PagedAllReader(client=self, options=options)
+
+
+class PagedReader(AsyncIterator[ReadEvent], Generic[C]):
+    # reads in pages of bounded size and continues after the last event that was handed out,
+    # the cursor can be stored to resume in another process. AsyncIterator is an ABC already,
+    # subclasses implement cursor and _read_page
+    def __init__(self, options: PagedReadOptions) -> None:
+        self._page_options = options
+        self._events: AsyncGenerator[ReadEvent, None] | None = None
+        self._closed = False
+        self.done = False
+
+    @property
+    @abstractmethod
+    def cursor(self) -> C: ...
+
+    def __aiter__(self) -> AsyncIterator[ReadEvent]:
+        return self
+
+    async def __anext__(self) -> ReadEvent:
+        if self._closed:
+            raise StopAsyncIteration
+        if self._events is None:
+            self._events = self._iterate()
+        return await self._events.__anext__()
+
+    async def __aenter__(self: R) -> R:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        # stops reading, e.g. after breaking out of the loop. the cursor stays valid to resume
+        self._closed = True
+        if self._events is not None:
+            await self._events.aclose()
+
+    async def _iterate(self) -> AsyncGenerator[ReadEvent, None]:
+        retries = 0
+        while not self.done:
+            count = 0
+            page = self._read_page()
+            try:
+                async for event in page:
+                    count += 1
+                    retries = 0
+                    yield event
+            except Exception as e:
+                if not is_transient_error(e) or retries >= self._page_options.max_retries:
+                    raise
+                await asyncio.sleep(self._page_options.retry_delay / 1000 * 2**retries)
+                retries += 1
+                continue
+            finally:
+                await aclose_iterator(page)
+            if count < self._page_options.page_size:
+                self.done = True
+
+    @abstractmethod
+    def _read_page(self) -> AsyncIterator[ReadEvent]: ...
+
+
+# NOTE not using union-operator for python3.9 compatibility
+class PagedStreamReader(PagedReader[Union[StreamRevision, StreamPosition]]):
+    def __init__(
+        self,
+        client: ReadStreamMixin,
+        stream_name: str,
+        options: ReadStreamPagedOptions,
+    ) -> None:
+        super().__init__(options)
+        self._client = client
+        self._stream_name = stream_name
+        self._options = options
+        self._cursor = options.from_revision
+
+    @property
+    def cursor(self) -> StreamRevision | StreamPosition:
+        # the revision the next page starts at
+        return self._cursor
+
+    async def _read_page(self) -> AsyncIterator[ReadEvent]:
+        options = ReadStreamOptions(
+            from_revision=self._cursor,
+            max_count=self._options.page_size,
+            direction=self._options.direction,
+            resolve_links=self._options.resolve_links,
+            headers_only=self._options.headers_only,
+        )
+        events = self._client.read_stream(self._stream_name, options)
+        try:
+            async for event in events:
+                if not isinstance(event, ReadEvent):
+                    continue
+                # with resolved links the link is the record within the stream
+                recorded_event = event.link or event.event
+                if recorded_event is None:
+                    continue
+                if self._options.direction == ReadDirection.FORWARDS:
+                    self._cursor = recorded_event.revision + 1
+                elif recorded_event.revision > 0:
+                    self._cursor = recorded_event.revision - 1
+                else:
+                    self.done = True
+                yield event
+                if self.done:
+                    return
+        finally:
+            await aclose_iterator(events)
+
+
+class PagedAllReader(PagedReader[Optional[AllPosition]]):
+    def __init__(self, client: ReadAllMixin, options: ReadAllPagedOptions) -> None:
+        super().__init__(options)
+        self._client = client
+        self._options = options
+        self._cursor = options.after_position
+
+    @property
+    def cursor(self) -> AllPosition | None:
+        # the position of the last event, pass it as after_position to resume
+        return self._cursor
+
+    async def _read_page(self) -> AsyncIterator[ReadEvent]:
+        forwards = self._options.direction == ReadDirection.FORWARDS
+        from_position: AllPosition | StreamPosition
+        if self._cursor is not None:
+            from_position = self._cursor
+        else:
+            from_position = StreamPosition.START if forwards else StreamPosition.END
+        # reading forwards includes the event at the position, it was handed out already
+        skip = self._cursor if forwards else None
+        options = ReadAllOptions(
+            from_position=from_position,
+            max_count=self._options.page_size + (1 if skip is not None else 0),
+            direction=self._options.direction,
+            resolve_links=self._options.resolve_links,
+            filter=self._options.filter,
+            headers_only=self._options.headers_only,
+        )
+        events = self._client.read_all(options)
+        try:
+            async for event in events:
+                if not isinstance(event, ReadEvent):
+                    continue
+                # with resolved links the link is the record within the $all
+                recorded_event = event.link or event.event
+                if recorded_event is None:
+                    continue
+                if recorded_event.position == skip:
+                    continue
+                self._cursor = recorded_event.position
+                yield event
+        finally:
+            await aclose_iterator(events)
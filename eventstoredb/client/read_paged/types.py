@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from eventstoredb.types import ReadDirection, StreamPosition, StreamRevision
+
+if TYPE_CHECKING:
+    from eventstoredb.filters import (
+        EventTypeFilter,
+        ExcludeSystemEventsFilter,
+        StreamNameFilter,
+    )
+    from eventstoredb.types import AllPosition
+
+
+@dataclass
+class PagedReadOptions:
+    page_size: int = 1000
+    max_retries: int = 5
+    retry_delay: int = 500  # milliseconds, doubled with every retry in a row
+
+
+@dataclass
+class ReadStreamPagedOptions(PagedReadOptions):
+    from_revision: StreamRevision | StreamPosition = StreamPosition.START
+    direction: ReadDirection = ReadDirection.FORWARDS
+    resolve_links: bool = False
+    headers_only: bool = False  # data and metadata are left unset
+
+
+@dataclass
+class ReadAllPagedOptions(PagedReadOptions):
+    # the position of the last event that was read, reading continues after it
+    after_position: AllPosition | None = None
+    direction: ReadDirection = ReadDirection.FORWARDS
+    resolve_links: bool = False
+    filter: ExcludeSystemEventsFilter | EventTypeFilter | StreamNameFilter | None = None
+    headers_only: bool = False  # data and metadata are left unset
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
-from uuid import UUID
 
 import betterproto
 
 from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.compression import is_compressed_payload
 from eventstoredb.events import (
     BinaryRecordedEvent,
     CaughtUp,
+    CompressedBinaryRecordedEvent,
     ContentType,
     FellBehind,
     JsonRecordedEvent,
+    LazyBinaryRecordedEvent,
+    LazyCompressedBinaryRecordedEvent,
+    LazyJsonRecordedEvent,
     ReadEvent,
 )
 from eventstoredb.generated.event_store.client import Empty, StreamIdentifier
@@ -25,23 +30,35 @@ from eventstoredb.generated.event_store.client.streams import (
     ReadRespReadEvent,
     ReadRespReadEventRecordedEvent,
 )
+from eventstoredb.serializers import DEFAULT_SERIALIZER
 from eventstoredb.types import (
     AllPosition,
     ReadDirection,
     StreamPosition,
     StreamRevision,
 )
+from eventstoredb.utils import uuid_from_message
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from eventstoredb.client.read_stream.types import ReadStreamOptions
+    from eventstoredb.serializers import Serializer
 
 
-def create_read_request(stream_name: str, options: ReadStreamOptions) -> ReadReq:
+def create_read_request(
+    stream_name: str,
+    options: ReadStreamOptions,
+    structured_uuids: bool = False,
+) -> ReadReq:
     request_options = ReadReqOptions()
 
     request_options.resolve_links = options.resolve_links
     request_options.count = options.max_count
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
 
     if options.direction == ReadDirection.FORWARDS:
         request_options.read_direction = ReadReqOptionsReadDirection.Forwards
@@ -62,10 +79,20 @@ def create_read_request(stream_name: str, options: ReadStreamOptions) -> ReadReq
     return ReadReq(options=request_options)
 
 
-def convert_read_response(message: ReadResp) -> ReadEvent | CaughtUp | FellBehind:
+def convert_read_response(
+    message: ReadResp,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
+) -> ReadEvent | CaughtUp | FellBehind:
     content_type, _ = betterproto.which_one_of(message, "content")
     if content_type == "event":
-        return convert_read_response_read_event(message.event)
+        return convert_read_response_read_event(
+            message.event,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
     if content_type == "caught_up":
         return CaughtUp()
     if content_type == "fell_behind":
@@ -78,30 +105,60 @@ def convert_read_response(message: ReadResp) -> ReadEvent | CaughtUp | FellBehin
     raise Exception(f"i shouldnt be here {content_type=} {message=}")  # noqa: TRY002,TRY003
 
 
-def convert_read_response_read_event(message: ReadRespReadEvent) -> ReadEvent:
-    event = ReadEvent()
+def convert_read_response_read_event(
+    message: ReadRespReadEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
+) -> ReadEvent:
+    event = None
     if message.event:
-        event.event = convert_read_response_recorded_event(message.event)
+        event = convert_read_response_recorded_event(
+            message.event,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
+    link = None
     if message.link:
-        event.link = convert_read_response_recorded_event(message.link)
+        link = convert_read_response_recorded_event(
+            message.link,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
     # TODO should this use which_one_of?
-    if message.commit_position:
-        event.commit_position = message.commit_position
-    return event
+    commit_position = message.commit_position or None
+    return ReadEvent(event=event, link=link, commit_position=commit_position)
 
 
 def convert_read_response_recorded_event(
     message: ReadRespReadEventRecordedEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> JsonRecordedEvent | BinaryRecordedEvent:
+    if lazy:
+        return convert_read_response_lazy_recorded_event(
+            message,
+            serializer=serializer,
+            decompress=decompress,
+        )
+
     stream_name = message.stream_identifier.stream_name.decode()
-    event_id = UUID(message.id.string)
+    event_id = uuid_from_message(message.id)
     content_type = ContentType(message.metadata["content-type"])
     position = AllPosition(
         commit_position=message.commit_position,
         prepare_position=message.prepare_position,
     )
-    event_class: type[JsonRecordedEvent] | type[BinaryRecordedEvent]
-    event_class = JsonRecordedEvent if content_type == ContentType.JSON else BinaryRecordedEvent
+    event_class: Callable[..., JsonRecordedEvent | BinaryRecordedEvent]
+    if content_type == ContentType.JSON:
+        event_class = partial(JsonRecordedEvent, serializer=serializer)
+    elif decompress and is_compressed_payload(message.data):
+        event_class = CompressedBinaryRecordedEvent
+    else:
+        event_class = BinaryRecordedEvent
     return event_class(
         stream_name=stream_name,
         id=event_id,
@@ -113,3 +170,16 @@ def convert_read_response_recorded_event(
         data=message.data if message.data else None,
         metadata=message.custom_metadata if message.custom_metadata else None,
     )
+
+
+def convert_read_response_lazy_recorded_event(
+    message: ReadRespReadEventRecordedEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    decompress: bool = False,
+) -> LazyJsonRecordedEvent | LazyBinaryRecordedEvent:
+    # content-type is needed upfront to pick the class, everything else is decoded on access
+    if message.metadata["content-type"] == ContentType.JSON:
+        return LazyJsonRecordedEvent(message, serializer=serializer)
+    if decompress and is_compressed_payload(message.data):
+        return LazyCompressedBinaryRecordedEvent(message)
+    return LazyBinaryRecordedEvent(message)
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
+from eventstoredb.client.batching import iterate_batches
+from eventstoredb.client.cache import CachedStream
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.client.prefetch import iterate_prefetched
 from eventstoredb.client.protocol import ClientProtocol
 from eventstoredb.client.read_stream.grpc import (
     convert_read_response,
     create_read_request,
 )
-from eventstoredb.client.read_stream.types import ReadStreamOptions
-from eventstoredb.generated.event_store.client.streams import StreamsStub
+from eventstoredb.client.read_stream.types import ReadStreamBatchesOptions, ReadStreamOptions
+from eventstoredb.events import ReadEvent
+from eventstoredb.types import ReadDirection, StreamPosition, StreamRevision
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from eventstoredb.events import CaughtUp, FellBehind, ReadEvent
+    from eventstoredb.client.cache import StreamEventCache
+    from eventstoredb.events import CaughtUp, FellBehind
 
 
 class ReadStreamMixin(ClientProtocol):
@@ -25,12 +34,193 @@ class ReadStreamMixin(ClientProtocol):
         if options is None:
             options = ReadStreamOptions()
 
-        client = StreamsStub(channel=self.channel)
+        if self.read_cache is not None and is_cacheable_read(options):
+            events = self._read_stream_cached(stream_name, options, self.read_cache)
+        else:
+            events = self._read_stream(stream_name, options)
+        if options.prefetch > 0:
+            events = iterate_prefetched(events, options.prefetch)
+
+        # TODO raise exception StreamNotFoundError
+        try:
+            async for event in events:
+                self._cache_read_revision(stream_name, event)
+                yield event
+        except StreamNotFoundError:
+            if self.revision_cache is not None:
+                self.revision_cache.pop(stream_name)
+            if self.read_cache is not None:
+                self.read_cache.pop(stream_name)
+            raise
+
+    def _read_stream(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> AsyncIterator[ReadEvent | CaughtUp | FellBehind]:
         request = create_read_request(
             stream_name=stream_name,
             options=options,
+            structured_uuids=self.options.structured_uuids,
+        )
+        return iterate_read_responses(
+            self,
+            request,
+            convert_read_response,
+            headers_only=options.headers_only,
         )
 
-        # TODO raise exception StreamNotFoundError
-        async for response in client.read(read_req=request):
-            yield convert_read_response(response)
+    async def _read_stream_cached(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+        cache: StreamEventCache,
+    ) -> AsyncIterator[ReadEvent | CaughtUp | FellBehind]:
+        cached = cache.get(stream_name)
+        index = cached.index(options.from_revision) if cached is not None else None
+        if cached is None or index is None:
+            async for event in self._read_stream_uncached(stream_name, options, cache):
+                yield event
+            return
+
+        # the metadata is read alongside the tail, a changed metadata revision means the
+        # stream may have been truncated or deleted and recreated since it was cached
+        cached_count = len(cached.events) - index
+        tail_options = replace(
+            options,
+            from_revision=cached.next_revision,
+            max_count=max(options.max_count - cached_count, 0),
+        )
+        metadata_revision, tail = await asyncio.gather(
+            self._read_metadata_revision(stream_name),
+            self._read_events_list(stream_name, tail_options),
+        )
+        if metadata_revision != cached.metadata_revision:
+            cache.pop(stream_name)
+            async for event in self._read_stream_uncached(stream_name, options, cache):
+                yield event
+            return
+
+        # concurrent reads may have extended the entry meanwhile, their events are part of tail
+        events = cached.events[index : index + min(cached_count, options.max_count)]
+        cache.extend(stream_name, cached, tail)
+
+        for event in events:
+            yield event
+        for event in tail:
+            yield event
+
+    async def _read_stream_uncached(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+        cache: StreamEventCache,
+    ) -> AsyncIterator[ReadEvent | CaughtUp | FellBehind]:
+        # only reads from the start of the stream give a prefix that can be served later
+        if options.from_revision != StreamPosition.START:
+            async for event in self._read_stream(stream_name, options):
+                yield event
+            return
+
+        metadata_revision = asyncio.create_task(self._read_metadata_revision(stream_name))
+        cached = None
+        try:
+            async for event in self._read_stream(stream_name, options):
+                if isinstance(event, ReadEvent):
+                    if cached is None:
+                        cached = CachedStream(metadata_revision=None)
+                    cached.append(event)
+                yield event
+            if cached is not None:
+                cached.metadata_revision = await metadata_revision
+                cache.put(stream_name, cached)
+        finally:
+            metadata_revision.cancel()
+
+    async def _read_events_list(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> list[ReadEvent]:
+        if options.max_count == 0:
+            return []
+        return [
+            event
+            async for event in self._read_stream(stream_name, options)
+            if isinstance(event, ReadEvent)
+        ]
+
+    async def _read_metadata_revision(self, stream_name: str) -> StreamRevision | None:
+        options = ReadStreamOptions(
+            from_revision=StreamPosition.END,
+            direction=ReadDirection.BACKWARDS,
+            max_count=1,
+        )
+        try:
+            events = await self._read_events_list(f"$${stream_name}", options)
+        except StreamNotFoundError:
+            return None
+        if not events or events[0].event is None:
+            return None
+        return events[0].event.revision
+
+    async def read_stream_batches(
+        self,
+        stream_name: str,
+        options: ReadStreamBatchesOptions | None = None,
+    ) -> AsyncIterator[list[ReadEvent | CaughtUp | FellBehind]]:
+        if options is None:
+            options = ReadStreamBatchesOptions()
+
+        request = create_read_request(
+            stream_name=stream_name,
+            options=options,
+            structured_uuids=self.options.structured_uuids,
+        )
+
+        def cache_read_revision(
+            event: ReadEvent | CaughtUp | FellBehind,
+        ) -> ReadEvent | CaughtUp | FellBehind:
+            self._cache_read_revision(stream_name, event)
+            return event
+
+        try:
+            async for batch in iterate_batches(
+                responses=iterate_read_responses(
+                    self,
+                    request,
+                    convert_read_response,
+                    headers_only=options.headers_only,
+                ),
+                convert=cache_read_revision,
+                batch_size=options.batch_size,
+                max_wait=options.max_wait,
+            ):
+                yield batch
+        except StreamNotFoundError:
+            if self.revision_cache is not None:
+                self.revision_cache.pop(stream_name)
+            raise
+
+    def _cache_read_revision(
+        self,
+        stream_name: str,
+        event: ReadEvent | CaughtUp | FellBehind,
+    ) -> None:
+        if self.revision_cache is None or not isinstance(event, ReadEvent):
+            return
+        # with resolved links the link is the record within this stream
+        recorded_event = event.link or event.event
+        if recorded_event is not None:
+            self.revision_cache.update(stream_name, recorded_event.revision)
+
+
+def is_cacheable_read(options: ReadStreamOptions) -> bool:
+    # resolved links may point to events that are deleted later, so they are never cached.
+    # events without their payloads can not serve later reads either
+    return (
+        options.direction == ReadDirection.FORWARDS
+        and not options.resolve_links
+        and not options.headers_only
+        and options.from_revision != StreamPosition.END
+    )
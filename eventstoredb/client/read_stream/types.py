@@ -11,3 +11,11 @@ class ReadStreamOptions:
     max_count: int = 2**64 - 1  # max-uint64
     direction: ReadDirection = ReadDirection.FORWARDS
     resolve_links: bool = False
+    prefetch: int = 0  # responses received ahead of the consumer
+    headers_only: bool = False  # data and metadata are left unset
+
+
+@dataclass
+class ReadStreamBatchesOptions(ReadStreamOptions):
+    batch_size: int = 1000
+    max_wait: int | None = None  # milliseconds
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.read_stream.mixin import ReadStreamMixin
+from eventstoredb.client.read_streams.types import (
+    ReadStreamResult,
+    ReadStreamsOptions,
+    ReadStreamsResult,
+)
+from eventstoredb.events import ReadEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class ReadStreamsMixin(ReadStreamMixin):
+    async def read_streams(
+        self,
+        stream_names: Iterable[str],
+        options: ReadStreamsOptions | None = None,
+    ) -> ReadStreamsResult:
+        if options is None:
+            options = ReadStreamsOptions()
+
+        semaphore = asyncio.Semaphore(options.concurrency)
+        results = [ReadStreamResult(stream_name=stream_name) for stream_name in stream_names]
+        await asyncio.gather(*(self._read_one(result, options, semaphore) for result in results))
+        return ReadStreamsResult(results=results, direction=options.direction)
+
+    async def _read_one(
+        self,
+        result: ReadStreamResult,
+        options: ReadStreamsOptions,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        async with semaphore:
+            try:
+                result.events = [
+                    event
+                    async for event in self.read_stream(result.stream_name, options)
+                    if isinstance(event, ReadEvent)
+                ]
+            except Exception as e:  # noqa: BLE001
+                result.error = e
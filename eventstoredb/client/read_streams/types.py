@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.types import ReadDirection
+
+if TYPE_CHECKING:
+    from eventstoredb.events import ReadEvent
+
+
+@dataclass
+class ReadStreamsOptions(ReadStreamOptions):
+    concurrency: int = 10
+
+
+@dataclass
+class ReadStreamResult:
+    stream_name: str
+    events: list[ReadEvent] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ReadStreamsResult:
+    results: list[ReadStreamResult]
+    direction: ReadDirection = ReadDirection.FORWARDS
+
+    def __getitem__(self, stream_name: str) -> ReadStreamResult:
+        for result in self.results:
+            if result.stream_name == stream_name:
+                return result
+        raise KeyError(stream_name)
+
+    @property
+    def errors(self) -> list[ReadStreamResult]:
+        return [result for result in self.results if not result.success]
+
+    def interleaved(self) -> list[ReadEvent]:
+        # every stream is already sorted by its position in $all, so a heap merge is enough
+        return list(
+            heapq.merge(
+                *(result.events for result in self.results),
+                key=commit_position_key,
+                reverse=self.direction == ReadDirection.BACKWARDS,
+            ),
+        )
+
+
+def commit_position_key(event: ReadEvent) -> tuple[int, int]:
+    # with resolved links the link is the record within the stream
+    recorded_event = event.link or event.event
+    if recorded_event is None:
+        return 0, 0
+    return recorded_event.position.commit_position, recorded_event.position.prepare_position
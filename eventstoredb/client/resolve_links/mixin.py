@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.client.read_stream.mixin import ReadStreamMixin
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.client.resolve_links.types import ResolveLinksOptions
+from eventstoredb.events import ReadEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from eventstoredb.client.cache import LinkTarget
+    from eventstoredb.events import RecordedEvent
+    from eventstoredb.types import StreamRevision
+
+LINK_EVENT_TYPE = "$>"
+
+
+class ResolveLinksMixin(ReadStreamMixin):
+    async def resolve_links(
+        self,
+        events: Iterable[ReadEvent],
+        options: ResolveLinksOptions | None = None,
+    ) -> list[ReadEvent]:
+        # resolves the link events of a batch read with resolve_links=False on the client,
+        # the result has the same shape as a read with resolve_links=True
+        if options is None:
+            options = ResolveLinksOptions()
+
+        events = list(events)
+        resolved: dict[LinkTarget, RecordedEvent] = {}
+        missing: defaultdict[str, set[StreamRevision]] = defaultdict(set)
+        for event in events:
+            target = parse_link_target(event)
+            if target is None or target in resolved:
+                continue
+            cached = self.link_cache.get(target) if self.link_cache is not None else None
+            if cached is not None:
+                resolved[target] = cached
+            else:
+                missing[target[0]].add(target[1])
+
+        semaphore = asyncio.Semaphore(options.concurrency)
+        await asyncio.gather(
+            *(
+                self._read_link_targets(stream_name, revisions, resolved, semaphore)
+                for stream_name, stream_revisions in missing.items()
+                for revisions in coalesce_revisions(stream_revisions, options.max_gap)
+            ),
+        )
+        return [resolve_link(event, resolved) for event in events]
+
+    async def _read_link_targets(
+        self,
+        stream_name: str,
+        revisions: list[StreamRevision],
+        resolved: dict[LinkTarget, RecordedEvent],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        options = ReadStreamOptions(
+            from_revision=revisions[0],
+            max_count=revisions[-1] - revisions[0] + 1,
+        )
+        async with semaphore:
+            try:
+                events = await self._read_events_list(stream_name, options)
+            except StreamNotFoundError:
+                # links to deleted streams resolve to no event, as they do on the server
+                return
+
+        wanted = set(revisions)
+        for event in events:
+            if event.event is None or event.event.revision not in wanted:
+                continue
+            target = (stream_name, event.event.revision)
+            resolved[target] = event.event
+            if self.link_cache is not None:
+                self.link_cache.put(target, event.event)
+
+
+def parse_link_target(event: ReadEvent) -> LinkTarget | None:
+    # the data of a link is the revision and the name of the stream of its target
+    link = event.event
+    if event.link is not None or link is None or link.type != LINK_EVENT_TYPE:
+        return None
+    if link.data is None:
+        return None
+    revision, _, stream_name = str(link.data, "utf-8").partition("@")
+    if not stream_name or not revision.isdigit():
+        return None
+    return stream_name, int(revision)
+
+
+def coalesce_revisions(
+    revisions: Iterable[StreamRevision],
+    max_gap: int,
+) -> list[list[StreamRevision]]:
+    runs: list[list[StreamRevision]] = []
+    for revision in sorted(revisions):
+        if runs and revision - runs[-1][-1] <= max_gap:
+            runs[-1].append(revision)
+        else:
+            runs.append([revision])
+    return runs
+
+
+def resolve_link(event: ReadEvent, resolved: dict[LinkTarget, RecordedEvent]) -> ReadEvent:
+    target = parse_link_target(event)
+    if target is None:
+        return event
+    return ReadEvent(
+        event=resolved.get(target),
+        link=event.event,
+        commit_position=event.commit_position,
+    )
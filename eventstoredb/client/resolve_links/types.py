@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ResolveLinksOptions:
+    concurrency: int = 10
+    # revisions of a stream at most this far apart are fetched with a single read
+    max_gap: int = 32
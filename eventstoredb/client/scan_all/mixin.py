@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union
+
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.read_all.grpc import create_read_all_request
+from eventstoredb.client.read_all.mixin import ReadAllMixin
+from eventstoredb.client.read_all.types import ReadAllOptions
+from eventstoredb.client.read_stream.grpc import convert_read_response
+from eventstoredb.client.scan_all.types import ScanAllOptions, ScanAllSegment, position_key
+from eventstoredb.events import ReadEvent
+from eventstoredb.types import AllPosition, ReadDirection, StreamPosition
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from grpclib.client import Channel
+
+    from eventstoredb.events import CaughtUp, FellBehind
+
+
+@dataclass
+class SegmentEnd:
+    error: Exception | None = None
+
+
+# NOTE not using union-operator for python3.9 compatibility
+ScanQueue = asyncio.Queue[Union[ReadEvent, SegmentEnd]]
+
+
+class ScanAllMixin(ReadAllMixin):
+    async def scan_all(
+        self,
+        options: ScanAllOptions | None = None,
+    ) -> AsyncIterator[ReadEvent]:
+        if options is None:
+            options = ScanAllOptions()
+
+        segments = await self._split_all(options)
+        if not segments:
+            return
+
+        # every partition reads over its own connection, otherwise they would share one http2 stream
+        channels = [self.create_channel() for _ in segments]
+        if options.ordered:
+            queues = [ScanQueue(maxsize=options.buffer_size) for _ in segments]
+        else:
+            queues = [ScanQueue(maxsize=options.buffer_size * len(segments))] * len(segments)
+        tasks = [
+            asyncio.create_task(self._scan_segment(channel, segment, options, queue))
+            for channel, segment, queue in zip(channels, segments, queues)
+        ]
+
+        try:
+            if options.ordered:
+                # segments are disjoint and in order, so consuming them one after the
+                # other restores the global order while the later ones keep reading ahead
+                for queue in queues:
+                    async for event in iterate_queue(queue, segments=1):
+                        yield event
+            else:
+                async for event in iterate_queue(queues[0], segments=len(segments)):
+                    yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for channel in channels:
+                channel.close()
+
+    async def _split_all(self, options: ScanAllOptions) -> list[ScanAllSegment]:
+        first, last = await asyncio.gather(
+            self._probe_all_position(StreamPosition.START, ReadDirection.FORWARDS, options),
+            self._probe_all_position(StreamPosition.END, ReadDirection.BACKWARDS, options),
+        )
+        if first is None or last is None:
+            return []
+
+        # the commit position range is split evenly, each boundary is moved forward
+        # to the next event since only positions of existing events can be read from
+        span = last.commit_position - first.commit_position
+        boundaries = [
+            first.commit_position + span * i // options.partitions
+            for i in range(1, options.partitions)
+        ]
+        probes = await asyncio.gather(
+            *(
+                self._probe_all_position(
+                    AllPosition(commit_position=boundary, prepare_position=boundary),
+                    ReadDirection.FORWARDS,
+                    options,
+                )
+                for boundary in boundaries
+            ),
+        )
+
+        # few events or large records make several boundaries land on the same event
+        starts = [first]
+        for position in probes:
+            if position is not None and (
+                position_key(starts[-1]) < position_key(position) <= position_key(last)
+            ):
+                starts.append(position)
+
+        segments = list(map(ScanAllSegment, starts, starts[1:]))
+        segments.append(ScanAllSegment(starts[-1], last, last=True))
+        return segments
+
+    async def _probe_all_position(
+        self,
+        from_position: AllPosition | StreamPosition,
+        direction: ReadDirection,
+        options: ScanAllOptions,
+    ) -> AllPosition | None:
+        read_options = ReadAllOptions(
+            from_position=from_position,
+            direction=direction,
+            max_count=1,
+            filter=options.filter,
+        )
+        events = [e async for e in self.read_all(read_options) if isinstance(e, ReadEvent)]
+        if not events:
+            return None
+        return get_all_position(events[0])
+
+    async def _scan_segment(
+        self,
+        channel: Channel,
+        segment: ScanAllSegment,
+        options: ScanAllOptions,
+        queue: ScanQueue,
+    ) -> None:
+        request = create_read_all_request(
+            options=ReadAllOptions(
+                from_position=segment.start,
+                resolve_links=options.resolve_links,
+                filter=options.filter,
+            ),
+            structured_uuids=self.options.structured_uuids,
+        )
+        responses = iterate_read_responses(
+            self,
+            request,
+            convert_read_response,
+            channel=channel,
+            headers_only=options.headers_only,
+        )
+        error = None
+        try:
+            await put_segment_events(responses, segment, queue)
+        except Exception as e:  # noqa: BLE001
+            error = e
+        finally:
+            await responses.aclose()
+        await queue.put(SegmentEnd(error=error))
+
+
+async def put_segment_events(
+    responses: AsyncIterator[ReadEvent | CaughtUp | FellBehind],
+    segment: ScanAllSegment,
+    queue: ScanQueue,
+) -> None:
+    async for event in responses:
+        if not isinstance(event, ReadEvent):
+            continue
+        position = get_all_position(event)
+        if position is not None and not segment.contains(position):
+            return
+        await queue.put(event)
+
+
+async def iterate_queue(queue: ScanQueue, segments: int) -> AsyncIterator[ReadEvent]:
+    while segments:
+        item = await queue.get()
+        if isinstance(item, SegmentEnd):
+            if item.error is not None:
+                raise item.error
+            segments -= 1
+        else:
+            yield item
+
+
+def get_all_position(event: ReadEvent) -> AllPosition | None:
+    # with resolved links the link is the record within $all
+    recorded_event = event.link or event.event
+    if recorded_event is None:
+        return None
+    return recorded_event.position
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from eventstoredb.filters import (
+        EventTypeFilter,
+        ExcludeSystemEventsFilter,
+        StreamNameFilter,
+    )
+    from eventstoredb.types import AllPosition
+
+
+@dataclass
+class ScanAllOptions:
+    partitions: int = 4
+    ordered: bool = False
+    resolve_links: bool = False
+    filter: ExcludeSystemEventsFilter | EventTypeFilter | StreamNameFilter | None = None
+    buffer_size: int = 1000  # events per partition
+    headers_only: bool = False  # data and metadata are left unset
+
+
+@dataclass
+class ScanAllSegment:
+    start: AllPosition
+    end: AllPosition
+    last: bool = False
+
+    def contains(self, position: AllPosition) -> bool:
+        if self.last:
+            return position_key(position) <= position_key(self.end)
+        return position_key(position) < position_key(self.end)
+
+
+def position_key(position: AllPosition) -> tuple[int, int]:
+    return position.commit_position, position.prepare_position
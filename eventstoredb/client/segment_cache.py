@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from eventstoredb.client.decoder import create_read_response_decoder, iterate_raw_read_responses
+from eventstoredb.client.read_all.types import ReadAllOptions
+from eventstoredb.events import ReadEvent
+from eventstoredb.types import AllPosition, ReadDirection, StreamPosition
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+    from io import BufferedWriter
+    from os import PathLike
+
+    from eventstoredb.client.decoder import ReadResponse
+    from eventstoredb.client.protocol import ClientProtocol
+    from eventstoredb.client.subscribe_to_all.types import SubscribeToAllOptions
+    from eventstoredb.generated.event_store.client.streams import ReadReq
+
+T = TypeVar("T")
+
+MAX_COUNT = 2**64 - 1  # max-uint64
+
+# every record is the commit and prepare position followed by the length of the message
+RECORD_HEADER = struct.Struct("<QQI")
+SEGMENT_SUFFIX = ".segment"
+DEFAULT_SEGMENT_SIZE = 64 * 2**20
+FLUSH_SIZE = 2**20
+
+
+@dataclass
+class Segment:
+    path: Path
+    first: tuple[int, int]
+    size: int = 0
+
+
+def parse_segment_name(path: Path) -> tuple[int, int]:
+    commit_position, prepare_position = path.name[: -len(SEGMENT_SUFFIX)].split("-")
+    return int(commit_position), int(prepare_position)
+
+
+def scan_segment(path: Path) -> tuple[int, tuple[int, int] | None]:
+    # returns the size of the complete records and the position of the last one,
+    # a record cut short by a crash while writing is left out
+    data = path.read_bytes()
+    size = 0
+    last = None
+    while size + RECORD_HEADER.size <= len(data):
+        commit_position, prepare_position, length = RECORD_HEADER.unpack_from(data, size)
+        end = size + RECORD_HEADER.size + length
+        if end > len(data):
+            break
+        size = end
+        last = (commit_position, prepare_position)
+    return size, last
+
+
+class SegmentCache:
+    # keeps the received messages of $all in append-only segment files. the records always
+    # form a gap-free range of $all from its start on, reads that begin within that range are
+    # served from disk and continued from the server. a directory is meant for one client only
+    def __init__(self, directory: str | PathLike[str], segment_size: int = DEFAULT_SEGMENT_SIZE):
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._segments: list[Segment] = []
+        self._end: tuple[int, int] | None = None
+        self._pending_end: tuple[int, int] | None = None
+        self._buffer = bytearray()
+        self._file: BufferedWriter | None = None
+
+        paths = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"), key=parse_segment_name)
+        for path in paths:
+            self._segments.append(Segment(path, parse_segment_name(path), path.stat().st_size))
+        if self._segments:
+            segment = self._segments[-1]
+            segment.size, self._end = scan_segment(segment.path)
+            with segment.path.open("r+b") as file:
+                file.truncate(segment.size)
+            if self._end is None:
+                segment.path.unlink()
+                self._segments.pop()
+                self._end = self._last_position()
+        self._pending_end = self._end
+
+    @property
+    def end(self) -> AllPosition | None:
+        if self._end is None:
+            return None
+        return AllPosition(commit_position=self._end[0], prepare_position=self._end[1])
+
+    def covers(self, from_position: AllPosition | StreamPosition) -> bool:
+        if from_position == StreamPosition.START:
+            return True
+        if not isinstance(from_position, AllPosition) or self._end is None:
+            return False
+        return (from_position.commit_position, from_position.prepare_position) <= self._end
+
+    def iterate(
+        self,
+        from_position: AllPosition | StreamPosition,
+        decode: Callable[[memoryview], T],
+        exclusive: bool = False,
+    ) -> Generator[T, None, None]:
+        # exclusive leaves out the record at from_position, as subscriptions start after it
+        first = (0, 0)
+        if isinstance(from_position, AllPosition):
+            first = (from_position.commit_position, from_position.prepare_position)
+        else:
+            exclusive = False
+        index = max(bisect_right([s.first for s in self._segments], first) - 1, 0)
+        for segment in self._segments[index:]:
+            yield from self._iterate_segment(segment, first, decode, exclusive)
+
+    def _iterate_segment(
+        self,
+        segment: Segment,
+        first: tuple[int, int],
+        decode: Callable[[memoryview], T],
+        exclusive: bool,
+    ) -> Iterator[T]:
+        # only the flushed part is mapped, records appended later are picked up by the next read
+        size = segment.size
+        if not size:
+            return
+        with segment.path.open("rb") as file, mmap.mmap(
+            file.fileno(),
+            size,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            view = memoryview(mapped)
+            try:
+                pos = 0
+                while pos < size:
+                    commit_position, prepare_position, length = RECORD_HEADER.unpack_from(
+                        mapped,
+                        pos,
+                    )
+                    pos += RECORD_HEADER.size
+                    position = (commit_position, prepare_position)
+                    if position > first or (position == first and not exclusive):
+                        yield decode_record(view, pos, pos + length, decode)
+                    pos += length
+            finally:
+                view.release()
+
+    def append(self, position: AllPosition, data: bytes) -> None:
+        key = (position.commit_position, position.prepare_position)
+        # concurrent reads receive the same records, only the first one extends the range
+        if self._pending_end is not None and key <= self._pending_end:
+            return
+        if not self._segments or self._segments[-1].size + len(self._buffer) >= self.segment_size:
+            self.flush()
+            self._start_segment(key)
+        self._buffer += RECORD_HEADER.pack(*key, len(data))
+        self._buffer += data
+        self._pending_end = key
+        if len(self._buffer) >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        segment = self._segments[-1]
+        if self._file is None:
+            self._file = segment.path.open("ab")
+        self._file.write(self._buffer)
+        self._file.flush()
+        segment.size += len(self._buffer)
+        self._buffer.clear()
+        self._end = self._pending_end
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _start_segment(self, first: tuple[int, int]) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        path = self.directory / f"{first[0]:020d}-{first[1]:020d}{SEGMENT_SUFFIX}"
+        path.touch()
+        self._segments.append(Segment(path, first))
+
+    def _last_position(self) -> tuple[int, int] | None:
+        if not self._segments:
+            return None
+        return scan_segment(self._segments[-1].path)[1]
+
+
+def decode_record(
+    view: memoryview,
+    start: int,
+    end: int,
+    decode: Callable[[memoryview], T],
+) -> T:
+    # the slice is released right away, the mapping can only be closed without exports
+    with view[start:end] as record:
+        return decode(record)
+
+
+def is_segment_cacheable(options: ReadAllOptions | SubscribeToAllOptions) -> bool:
+    # filtered reads skip records, resolved links change the content of a record
+    if isinstance(options, ReadAllOptions) and options.direction != ReadDirection.FORWARDS:
+        return False
+    return options.filter is None and not options.resolve_links
+
+
+async def iterate_segment_cached_responses(
+    client: ClientProtocol,
+    cache: SegmentCache,
+    from_position: AllPosition | StreamPosition,
+    create_request: Callable[[AllPosition | StreamPosition, int], ReadReq],
+    convert: Callable[..., ReadResponse],
+    max_count: int = MAX_COUNT,
+    headers_only: bool = False,
+    exclusive: bool = False,
+) -> AsyncGenerator[ReadResponse, None]:
+    decode = create_read_response_decoder(client, convert, headers_only=headers_only)
+
+    count = 0
+    last = None
+    records = cache.iterate(from_position, decode, exclusive=exclusive)
+    try:
+        for response in records:
+            if count >= max_count:
+                return
+            count += 1
+            if isinstance(response, ReadEvent) and response.event is not None:
+                last = response.event.position
+            yield response
+    finally:
+        records.close()
+    if count >= max_count:
+        return
+
+    # the server includes the record at the given position, it is skipped below
+    if last is not None:
+        from_position = last
+        max_count = min(max_count - count + 1, MAX_COUNT)
+    request = create_request(from_position, max_count)
+    try:
+        async for data in iterate_raw_read_responses(client, request):
+            response = decode(data)
+            if isinstance(response, ReadEvent) and response.event is not None:
+                position = response.event.position
+                if last is not None and (position.commit_position, position.prepare_position) <= (
+                    last.commit_position,
+                    last.prepare_position,
+                ):
+                    continue
+                cache.append(position, data)
+            yield response
+    finally:
+        cache.flush()
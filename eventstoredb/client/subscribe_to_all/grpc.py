@@ -26,19 +26,25 @@ from eventstoredb.generated.event_store.client.streams import (
     ReadResp,
     ReadRespCheckpoint,
 )
+from eventstoredb.serializers import DEFAULT_SERIALIZER
 from eventstoredb.types import AllPosition, StreamPosition
 
 if TYPE_CHECKING:
     from eventstoredb.client.subscribe_to_stream.types import SubscriptionConfirmation
     from eventstoredb.events import CaughtUp, FellBehind, ReadEvent
+    from eventstoredb.serializers import Serializer
 
 
 def create_subscribe_to_all_request(  # noqa: C901
     options: SubscribeToAllOptions,
+    structured_uuids: bool = False,
 ) -> ReadReq:
     request_options = ReadReqOptions()
     request_options.resolve_links = options.resolve_links
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
     request_options.subscription = ReadReqOptionsSubscriptionOptions()
     request_options.all = ReadReqOptionsAllOptions()
 
@@ -84,12 +90,20 @@ def create_subscribe_to_all_request(  # noqa: C901
 
 def convert_subscribe_to_all_response(
     message: ReadResp,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> ReadEvent | CaughtUp | FellBehind | SubscriptionConfirmation | Checkpoint:
     content_type, _ = betterproto.which_one_of(message, "content")
 
     if content_type == "checkpoint":
         return convert_read_response_checkpoint(message.checkpoint)
-    return convert_subscribe_to_stream_response(message)
+    return convert_subscribe_to_stream_response(
+        message,
+        serializer=serializer,
+        lazy=lazy,
+        decompress=decompress,
+    )
 
 
 def convert_read_response_checkpoint(message: ReadRespCheckpoint) -> Checkpoint:
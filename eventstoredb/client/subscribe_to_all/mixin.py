@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.prefetch import iterate_prefetched
 from eventstoredb.client.protocol import ClientProtocol
+from eventstoredb.client.segment_cache import (
+    is_segment_cacheable,
+    iterate_segment_cached_responses,
+)
 from eventstoredb.client.subscribe_to_all.grpc import (
     convert_subscribe_to_all_response,
     create_subscribe_to_all_request,
 )
 from eventstoredb.client.subscribe_to_all.types import Checkpoint, SubscribeToAllOptions
 from eventstoredb.client.subscribe_to_stream.types import SubscriptionConfirmation
-from eventstoredb.generated.event_store.client.streams import StreamsStub
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from eventstoredb.client.decoder import ReadResponse
     from eventstoredb.client.subscribe_to_stream.mixin import Subscription
+    from eventstoredb.generated.event_store.client.streams import ReadReq
+    from eventstoredb.types import AllPosition, StreamPosition
 
 
 class SubscribeToAllMixin(ClientProtocol):
@@ -23,11 +34,44 @@ class SubscribeToAllMixin(ClientProtocol):
         if options is None:
             options = SubscribeToAllOptions()
 
-        client = StreamsStub(channel=self.channel)
-        request = create_subscribe_to_all_request(options=options)
+        responses: AsyncIterator[ReadResponse]
+        if (
+            self.segment_cache is not None
+            and is_segment_cacheable(options)
+            and self.segment_cache.covers(options.from_position)
+        ):
+            subscribe_options = options
+
+            def create_request(from_position: AllPosition | StreamPosition, _: int) -> ReadReq:
+                return create_subscribe_to_all_request(
+                    options=replace(subscribe_options, from_position=from_position),
+                    structured_uuids=self.options.structured_uuids,
+                )
+
+            responses = iterate_segment_cached_responses(
+                self,
+                self.segment_cache,
+                options.from_position,
+                create_request,
+                convert_subscribe_to_all_response,
+                headers_only=options.headers_only,
+                exclusive=True,
+            )
+        else:
+            request = create_subscribe_to_all_request(
+                options=options,
+                structured_uuids=self.options.structured_uuids,
+            )
+            responses = iterate_read_responses(
+                self,
+                request,
+                convert_subscribe_to_all_response,
+                headers_only=options.headers_only,
+            )
+        if options.prefetch > 0:
+            responses = iterate_prefetched(responses, options.prefetch)
 
-        async for response in client.read(read_req=request):
-            response_content = convert_subscribe_to_all_response(response)
+        async for response_content in responses:
             if not isinstance(response_content, Checkpoint) and not isinstance(
                 response_content,
                 SubscriptionConfirmation,
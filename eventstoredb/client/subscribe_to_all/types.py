@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from eventstoredb.types import AllPosition, StreamPosition
+from eventstoredb.utils import dataclass_slots
 
 if TYPE_CHECKING:
     from eventstoredb.filters import (
@@ -20,7 +21,10 @@ class SubscribeToAllOptions:
     filter: ExcludeSystemEventsFilter | EventTypeFilter | StreamNameFilter | None = None
     max_search_window: int | None = None
     checkpoint_interval: int = 1
+    prefetch: int = 0  # responses received ahead of the consumer
+    headers_only: bool = False  # data and metadata are left unset
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
 class Checkpoint(AllPosition): ...
@@ -18,10 +18,14 @@ if TYPE_CHECKING:
 def create_read_request(
     group_name: str,
     options: SubscribeToPersistentSubscriptionToAllOptions,
+    structured_uuids: bool = False,
 ) -> ReadReq:
     request_options = ReadReqOptions()
     request_options.all = Empty()
     request_options.group_name = group_name
     request_options.buffer_size = options.buffer_size
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
     return ReadReq(options=request_options)
@@ -24,9 +24,15 @@ class SubscribeToPersistentSubscriptionToAllMixin(ClientProtocol):
         request = create_read_request(
             group_name=group_name,
             options=options,
+            structured_uuids=self.options.structured_uuids,
         )
 
         return PersistentSubscription(
             channel=self.channel,
             read_request=request,
+            serializer=self.serializer,
+            lazy=self.options.lazy_recorded_events,
+            decompress=self.options.compression is not None,
+            fast_decoder=self.options.fast_decoder,
+            structured_uuids=self.options.structured_uuids,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from uuid import UUID
+from functools import partial
+from typing import TYPE_CHECKING
 
 import betterproto
 
@@ -9,13 +10,18 @@ from eventstoredb.client.subscribe_to_persistent_subscription_to_stream.types im
     PersistentSubscriptionConfirmation,
     SubscribeToPersistentSubscriptionToStreamOptions,
 )
+from eventstoredb.compression import is_compressed_payload
 from eventstoredb.events import (
     BinaryRecordedEvent,
+    CompressedBinaryRecordedEvent,
     ContentType,
     JsonRecordedEvent,
+    LazyBinaryRecordedEvent,
+    LazyCompressedBinaryRecordedEvent,
+    LazyJsonRecordedEvent,
     PersistentSubscriptionEvent,
 )
-from eventstoredb.generated.event_store.client import Empty, StreamIdentifier, Uuid
+from eventstoredb.generated.event_store.client import Empty, StreamIdentifier
 from eventstoredb.generated.event_store.client.persistent_subscriptions import (
     ReadReq,
     ReadReqAck,
@@ -28,7 +34,15 @@ from eventstoredb.generated.event_store.client.persistent_subscriptions import (
     ReadRespReadEventRecordedEvent,
     ReadRespSubscriptionConfirmation,
 )
+from eventstoredb.serializers import DEFAULT_SERIALIZER
 from eventstoredb.types import AllPosition
+from eventstoredb.utils import uuid_from_message, uuid_to_message
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from eventstoredb.serializers import Serializer
 
 
 def get_original_event_id(event: PersistentSubscriptionEvent) -> UUID | None:
@@ -43,17 +57,22 @@ def create_read_request(
     stream_name: str,
     group_name: str,
     options: SubscribeToPersistentSubscriptionToStreamOptions,
+    structured_uuids: bool = False,
 ) -> ReadReq:
     request_options = ReadReqOptions()
     request_options.stream_identifier = StreamIdentifier(stream_name.encode())
     request_options.group_name = group_name
     request_options.buffer_size = options.buffer_size
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
     return ReadReq(options=request_options)
 
 
 def create_ack_request(
     events: PersistentSubscriptionEvent | list[PersistentSubscriptionEvent],
+    structured_uuids: bool = False,
 ) -> ReadReq:
     if not isinstance(events, list):
         events = [events]
@@ -62,7 +81,7 @@ def create_ack_request(
     for event in events:
         event_id = get_original_event_id(event)
         if event_id:
-            ack.ids.append(Uuid(string=str(event_id)))
+            ack.ids.append(uuid_to_message(event_id, structured=structured_uuids))
     return ReadReq(ack=ack)
 
 
@@ -70,6 +89,7 @@ def create_nack_request(
     action: NackAction,
     reason: str,
     events: PersistentSubscriptionEvent | list[PersistentSubscriptionEvent],
+    structured_uuids: bool = False,
 ) -> ReadReq:
     if not isinstance(events, list):
         events = [events]
@@ -91,16 +111,24 @@ def create_nack_request(
     for event in events:
         event_id = get_original_event_id(event)
         if event_id:
-            nack.ids.append(Uuid(string=str(event_id)))
+            nack.ids.append(uuid_to_message(event_id, structured=structured_uuids))
     return ReadReq(nack=nack)
 
 
 def convert_read_response(
     message: ReadResp,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> PersistentSubscriptionConfirmation | PersistentSubscriptionEvent:
     content_type, _ = betterproto.which_one_of(message, "content")
     if content_type == "event":
-        return convert_read_response_event(message.event)
+        return convert_read_response_event(
+            message.event,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
     if content_type == "subscription_confirmation":
         return convert_read_response_confirmation(message.subscription_confirmation)
     # TODO raise better exception
@@ -109,31 +137,61 @@ def convert_read_response(
 
 def convert_read_response_event(
     message: ReadRespReadEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> PersistentSubscriptionEvent:
-    event = PersistentSubscriptionEvent()
+    event = None
     if message.event:
-        event.event = convert_read_response_recorded_event(message.event)
+        event = convert_read_response_recorded_event(
+            message.event,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
+    link = None
     if message.link:
-        event.link = convert_read_response_recorded_event(message.link)
-    if message.commit_position:
-        event.commit_position = message.commit_position
-    if message.retry_count:
-        event.retry_count = message.retry_count
-    return event
+        link = convert_read_response_recorded_event(
+            message.link,
+            serializer=serializer,
+            lazy=lazy,
+            decompress=decompress,
+        )
+    return PersistentSubscriptionEvent(
+        event=event,
+        link=link,
+        commit_position=message.commit_position or None,
+        retry_count=message.retry_count or None,
+    )
 
 
 def convert_read_response_recorded_event(
     message: ReadRespReadEventRecordedEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> JsonRecordedEvent | BinaryRecordedEvent:
+    if lazy:
+        return convert_read_response_lazy_recorded_event(
+            message,
+            serializer=serializer,
+            decompress=decompress,
+        )
+
     stream_name = message.stream_identifier.stream_name.decode()
-    event_id = UUID(message.id.string)
+    event_id = uuid_from_message(message.id)
     content_type = ContentType(message.metadata["content-type"])
     position = AllPosition(
         commit_position=message.commit_position,
         prepare_position=message.prepare_position,
     )
-    event_class: type[JsonRecordedEvent] | type[BinaryRecordedEvent]
-    event_class = JsonRecordedEvent if content_type == ContentType.JSON else BinaryRecordedEvent
+    event_class: Callable[..., JsonRecordedEvent | BinaryRecordedEvent]
+    if content_type == ContentType.JSON:
+        event_class = partial(JsonRecordedEvent, serializer=serializer)
+    elif decompress and is_compressed_payload(message.data):
+        event_class = CompressedBinaryRecordedEvent
+    else:
+        event_class = BinaryRecordedEvent
     return event_class(
         stream_name=stream_name,
         id=event_id,
@@ -147,6 +205,19 @@ def convert_read_response_recorded_event(
     )
 
 
+def convert_read_response_lazy_recorded_event(
+    message: ReadRespReadEventRecordedEvent,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    decompress: bool = False,
+) -> LazyJsonRecordedEvent | LazyBinaryRecordedEvent:
+    # content-type is needed upfront to pick the class, everything else is decoded on access
+    if message.metadata["content-type"] == ContentType.JSON:
+        return LazyJsonRecordedEvent(message, serializer=serializer)
+    if decompress and is_compressed_payload(message.data):
+        return LazyCompressedBinaryRecordedEvent(message)
+    return LazyBinaryRecordedEvent(message)
+
+
 def convert_read_response_confirmation(
     message: ReadRespSubscriptionConfirmation,
 ) -> PersistentSubscriptionConfirmation:
@@ -9,6 +9,7 @@ from grpclib.exceptions import GRPCError
 from eventstoredb.client.create_persistent_subscription_to_stream.grpc import (
     convert_grpc_error_to_exception,
 )
+from eventstoredb.client.decoder import DecodingPersistentSubscriptionsStub
 from eventstoredb.client.protocol import ClientProtocol
 from eventstoredb.client.subscribe_to_persistent_subscription_to_stream.grpc import (
     convert_read_response,
@@ -25,11 +26,16 @@ from eventstoredb.events import PersistentSubscriptionEvent
 from eventstoredb.generated.event_store.client.persistent_subscriptions import (
     PersistentSubscriptionsStub,
     ReadReq,
+    ReadResp,
 )
+from eventstoredb.serializers import DEFAULT_SERIALIZER
 
 if TYPE_CHECKING:
     from grpclib.client import Channel
 
+    from eventstoredb.client.decoder import PersistentSubscriptionReadResponse
+    from eventstoredb.serializers import Serializer
+
 
 class SubscribeToPersistentSubscriptionToStreamMixin(ClientProtocol):
     def subscribe_to_persistent_subscription_to_stream(
@@ -45,11 +51,17 @@ class SubscribeToPersistentSubscriptionToStreamMixin(ClientProtocol):
             stream_name=stream_name,
             group_name=group_name,
             options=options,
+            structured_uuids=self.options.structured_uuids,
         )
 
         return PersistentSubscription(
             channel=self.channel,
             read_request=request,
+            serializer=self.serializer,
+            lazy=self.options.lazy_recorded_events,
+            decompress=self.options.compression is not None,
+            fast_decoder=self.options.fast_decoder,
+            structured_uuids=self.options.structured_uuids,
         )
 
 
@@ -66,12 +78,30 @@ class PersistentSubscription(AsyncIterator[PersistentSubscriptionEvent]):
         self,
         channel: Channel,
         read_request: ReadReq,
+        serializer: Serializer = DEFAULT_SERIALIZER,
+        lazy: bool = False,
+        decompress: bool = False,
+        fast_decoder: bool = False,
+        structured_uuids: bool = False,
     ) -> None:
-        client = PersistentSubscriptionsStub(channel=channel)
+        self._serializer = serializer
+        self._lazy = lazy
+        self._decompress = decompress
+        self._structured_uuids = structured_uuids
 
         self._request_queue = RequestQueue()
         self._request_queue.put_nowait(read_request)
-        self._it = client.read(self._request_queue)
+        self._it: AsyncIterator[ReadResp | PersistentSubscriptionReadResponse]
+        if fast_decoder and not lazy:
+            decoding_client = DecodingPersistentSubscriptionsStub(
+                channel=channel,
+                serializer=serializer,
+                decompress=decompress,
+            )
+            self._it = decoding_client.read_decoded(self._request_queue)
+        else:
+            client = PersistentSubscriptionsStub(channel=channel)
+            self._it = client.read(self._request_queue)
 
     def __aiter__(self) -> AsyncIterator[PersistentSubscriptionEvent]:
         return self
@@ -82,7 +112,15 @@ class PersistentSubscription(AsyncIterator[PersistentSubscriptionEvent]):
                 response = await self._it.__anext__()
             except GRPCError as e:
                 raise convert_grpc_error_to_exception(e)  # noqa: B904,TRY200
-            event = convert_read_response(response)
+            if isinstance(response, ReadResp):
+                event = convert_read_response(
+                    response,
+                    serializer=self._serializer,
+                    lazy=self._lazy,
+                    decompress=self._decompress,
+                )
+            else:
+                event = response
             if isinstance(event, PersistentSubscriptionConfirmation):
                 self.id = event.id
             else:
@@ -92,7 +130,7 @@ class PersistentSubscription(AsyncIterator[PersistentSubscriptionEvent]):
         self,
         events: PersistentSubscriptionEvent | list[PersistentSubscriptionEvent],
     ) -> None:
-        request = create_ack_request(events=events)
+        request = create_ack_request(events=events, structured_uuids=self._structured_uuids)
         await self._request_queue.put(request)
 
     async def nack(
@@ -101,5 +139,10 @@ class PersistentSubscription(AsyncIterator[PersistentSubscriptionEvent]):
         reason: str,
         events: PersistentSubscriptionEvent | list[PersistentSubscriptionEvent],
     ) -> None:
-        request = create_nack_request(action=action, reason=reason, events=events)
+        request = create_nack_request(
+            action=action,
+            reason=reason,
+            events=events,
+            structured_uuids=self._structured_uuids,
+        )
         await self._request_queue.put(request)
@@ -19,19 +19,25 @@ from eventstoredb.generated.event_store.client.streams import (
     ReadResp,
     ReadRespSubscriptionConfirmation,
 )
+from eventstoredb.serializers import DEFAULT_SERIALIZER
 from eventstoredb.types import StreamPosition, StreamRevision
 
 if TYPE_CHECKING:
     from eventstoredb.events import CaughtUp, FellBehind, ReadEvent
+    from eventstoredb.serializers import Serializer
 
 
 def create_subscribe_to_stream_request(
     stream_name: str,
     options: SubscribeToStreamOptions,
+    structured_uuids: bool = False,
 ) -> ReadReq:
     request_options = ReadReqOptions()
     request_options.resolve_links = options.resolve_links
-    request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
+    if structured_uuids:
+        request_options.uuid_option = ReadReqOptionsUuidOption(structured=Empty())
+    else:
+        request_options.uuid_option = ReadReqOptionsUuidOption(string=Empty())
     request_options.subscription = ReadReqOptionsSubscriptionOptions()
     request_options.no_filter = Empty()
     request_options.stream = ReadReqOptionsStreamOptions()
@@ -49,12 +55,20 @@ def create_subscribe_to_stream_request(
 
 def convert_subscribe_to_stream_response(
     message: ReadResp,
+    serializer: Serializer = DEFAULT_SERIALIZER,
+    lazy: bool = False,
+    decompress: bool = False,
 ) -> ReadEvent | CaughtUp | FellBehind | SubscriptionConfirmation:
     content_type, _ = betterproto.which_one_of(message, "content")
 
     if content_type == "confirmation":
         return convert_read_response_subscription_confirmation(message.confirmation)
-    return convert_read_response(message)
+    return convert_read_response(
+        message,
+        serializer=serializer,
+        lazy=lazy,
+        decompress=decompress,
+    )
 
 
 def convert_read_response_subscription_confirmation(
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from typing import Union
 
+from eventstoredb.client.decoder import iterate_read_responses
+from eventstoredb.client.prefetch import iterate_prefetched
 from eventstoredb.client.protocol import ClientProtocol
 from eventstoredb.client.subscribe_to_stream.grpc import (
     convert_subscribe_to_stream_response,
@@ -13,7 +15,6 @@ from eventstoredb.client.subscribe_to_stream.types import (
     SubscriptionConfirmation,
 )
 from eventstoredb.events import CaughtUp, FellBehind, ReadEvent
-from eventstoredb.generated.event_store.client.streams import StreamsStub
 
 # NOTE not using union-operator for python3.9 compatibility
 # yes, even from __future__ import annotations does not help
@@ -29,13 +30,22 @@ class SubscribeToStreamMixin(ClientProtocol):
         if options is None:
             options = SubscribeToStreamOptions()
 
-        client = StreamsStub(channel=self.channel)
         request = create_subscribe_to_stream_request(
             stream_name=stream_name,
             options=options,
+            structured_uuids=self.options.structured_uuids,
         )
 
-        async for response in client.read(read_req=request):
-            response_content = convert_subscribe_to_stream_response(response)
+        responses: AsyncIterator[ReadEvent | CaughtUp | FellBehind | SubscriptionConfirmation]
+        responses = iterate_read_responses(
+            self,
+            request,
+            convert_subscribe_to_stream_response,
+            headers_only=options.headers_only,
+        )
+        if options.prefetch > 0:
+            responses = iterate_prefetched(responses, options.prefetch)
+
+        async for response_content in responses:
             if not isinstance(response_content, SubscriptionConfirmation):
                 yield response_content
@@ -9,6 +9,8 @@ from eventstoredb.types import StreamPosition, StreamRevision
 class SubscribeToStreamOptions:
     from_revision: StreamRevision | StreamPosition = StreamPosition.START
     resolve_links: bool = False
+    prefetch: int = 0  # responses received ahead of the consumer
+    headers_only: bool = False  # data and metadata are left unset
 
 
 @dataclass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from yarl import URL
 
@@ -9,6 +10,10 @@ from eventstoredb.client.exceptions import (
     ConnectionStringMissingHostError,
 )
 
+if TYPE_CHECKING:
+    from eventstoredb.client.append_to_stream.types import GroupCommitOptions
+    from eventstoredb.compression import CompressionOptions
+
 
 @dataclass
 class ClientOptions:
@@ -20,6 +25,20 @@ class ClientOptions:
     dns_discovery: bool = False
     keep_alive_timeout: int = 10000
     keep_alive_interval: int = 10000
+    group_commit: GroupCommitOptions | None = None
+    # the caches are opt-in, a client holds no state between calls unless sized here
+    revision_cache_size: int = 0
+    read_cache_size: int = 0  # bytes
+    link_cache_size: int = 0  # events
+    # find_position_at results by timestamp. a found position stays valid, only
+    # timestamps without an event yet are looked up again
+    position_cache_size: int = 0  # timestamps
+    segment_cache_dir: str | None = None
+    serializer: str = "json"
+    lazy_recorded_events: bool = False
+    fast_decoder: bool = False
+    structured_uuids: bool = False
+    compression: CompressionOptions | None = None
 
     @classmethod
     def from_connection_string(cls, connection_string: str) -> ClientOptions:
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import importlib
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# compressed payloads are framed as FRAME_MAGIC + codec-id + compressed data.
+# the server drops unknown keys of the metadata map, so the marker travels with the data.
+FRAME_MAGIC = b"\x89ESDBZ"
+FRAME_HEADER_SIZE = len(FRAME_MAGIC) + 1
+
+
+class CompressionError(ValueError): ...
+
+
+class CodecNotFoundError(CompressionError):
+    def __init__(self, codec: str | int) -> None:
+        self.codec = codec
+        super().__init__(f"Compression codec '{codec}' is not registered")
+
+
+class CodecNotInstalledError(CompressionError):
+    def __init__(self, name: str, module: str) -> None:
+        self.name = name
+        self.module = module
+        super().__init__(f"Compression codec '{name}' requires '{module}' to be installed")
+
+
+@dataclass
+class CompressionOptions:
+    codec: str = "zlib"
+    level: int | None = None
+    min_size: int = 1024  # bytes
+
+
+class Codec(Protocol):
+    id: int
+    name: str
+
+    def compress(self, data: bytes, level: int | None) -> bytes: ...
+
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+class ZlibCodec:
+    id = 1
+    name = "zlib"
+
+    def compress(self, data: bytes, level: int | None) -> bytes:
+        return zlib.compress(data, -1 if level is None else level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec:
+    id = 2
+    name = "zstd"
+
+    def __init__(self) -> None:
+        self._zstandard = import_codec_module(self.name, "zstandard")
+        self._decompressor = self._zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes, level: int | None) -> bytes:
+        compressor = self._zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress(data)  # type: ignore[no-any-return]
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)  # type: ignore[no-any-return]
+
+
+class Lz4Codec:
+    id = 3
+    name = "lz4"
+
+    def __init__(self) -> None:
+        self._lz4 = import_codec_module(self.name, "lz4.frame")
+
+    def compress(self, data: bytes, level: int | None) -> bytes:
+        return self._lz4.compress(data, compression_level=level or 0)  # type: ignore[no-any-return]
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._lz4.decompress(data)  # type: ignore[no-any-return]
+
+
+def import_codec_module(name: str, module: str) -> Any:
+    # optional dependencies are imported on use, so they are only required when selected
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise CodecNotInstalledError(name=name, module=module) from e
+
+
+_codec_factories: dict[str | int, Callable[[], Codec]] = {}
+_codecs: dict[str | int, Codec] = {}
+
+
+def register_codec(codec_id: int, name: str, factory: Callable[[], Codec]) -> None:
+    _codec_factories[codec_id] = _codec_factories[name] = factory
+
+
+def get_codec(codec: str | int) -> Codec:
+    instance = _codecs.get(codec)
+    if instance is None:
+        factory = _codec_factories.get(codec)
+        if factory is None:
+            raise CodecNotFoundError(codec)
+        instance = _codecs[codec] = factory()
+    return instance
+
+
+register_codec(ZlibCodec.id, ZlibCodec.name, ZlibCodec)
+register_codec(ZstdCodec.id, ZstdCodec.name, ZstdCodec)
+register_codec(Lz4Codec.id, Lz4Codec.name, Lz4Codec)
+
+
+def compress_payload(data: bytes, options: CompressionOptions) -> bytes | None:
+    if len(data) < options.min_size:
+        return None
+    codec = get_codec(options.codec)
+    compressed = FRAME_MAGIC + bytes((codec.id,)) + codec.compress(data, options.level)
+    if len(compressed) >= len(data):
+        return None
+    return compressed
+
+
+def is_compressed_payload(data: bytes) -> bool:
+    return data.startswith(FRAME_MAGIC) and len(data) >= FRAME_HEADER_SIZE
+
+
+def decompress_payload(data: bytes) -> bytes:
+    if not is_compressed_payload(data):
+        return data
+    codec = get_codec(data[len(FRAME_MAGIC)])
+    return codec.decompress(data[FRAME_HEADER_SIZE:])
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import dataclasses
+from dataclasses import FrozenInstanceError, dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, TypeVar, Union
 from uuid import UUID, uuid4
 
+from eventstoredb.compression import decompress_payload, is_compressed_payload
+from eventstoredb.serializers import DEFAULT_SERIALIZER
+from eventstoredb.types import AllPosition
+from eventstoredb.utils import dataclass_slots, uuid_from_message
+
 if TYPE_CHECKING:
-    from eventstoredb.types import AllPosition, Position, StreamRevision
+    from eventstoredb.compression import CompressionOptions
+    from eventstoredb.generated.event_store.client import persistent_subscriptions, streams
+    from eventstoredb.serializers import Serializer
+    from eventstoredb.types import Position, StreamRevision
+
+    # NOTE not using union-operator for python3.9 compatibility
+    RecordedEventMessage = Union[
+        streams.ReadRespReadEventRecordedEvent,
+        persistent_subscriptions.ReadRespReadEventRecordedEvent,
+    ]
+
+T = TypeVar("T")
 
 
 class ContentType(str, Enum):
@@ -22,18 +39,69 @@ class EventData:
     data: bytes | None = None
     metadata: bytes | None = None
 
+    def encode(
+        self,
+        structured_uuids: bool = False,
+        compression: CompressionOptions | None = None,
+    ) -> EncodedEventData:
+        from eventstoredb.client.append_to_stream.grpc import encode_event_data  # noqa: PLC0415
+
+        return encode_event_data(self, structured_uuids=structured_uuids, compression=compression)
+
+
+@dataclass
+class EncodedEventData(EventData):
+    encoded: bytes = field(default=b"", repr=False)
+    # the options the cached bytes were encoded with
+    structured_uuids: bool = field(default=False, repr=False)
+    compression: CompressionOptions | None = field(default=None, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # the cached bytes would go stale, so fields can not be changed after __init__
+        if "compression" in self.__dict__:
+            raise FrozenInstanceError(f"cannot assign to field '{name}'")  # noqa: TRY003
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")  # noqa: TRY003
+
+    def encode(
+        self,
+        structured_uuids: bool = False,
+        compression: CompressionOptions | None = None,
+    ) -> EncodedEventData:
+        if structured_uuids == self.structured_uuids and compression == self.compression:
+            return self
+        # encoded with other options, the cached bytes can not be used
+        return super().encode(structured_uuids=structured_uuids, compression=compression)
+
 
 @dataclass
 class JsonEvent(EventData):
     content_type: Literal[ContentType.JSON] = ContentType.JSON
 
+    @classmethod
+    def from_obj(
+        cls,
+        type: str,  # noqa: A002
+        data: Any = None,
+        metadata: Any = None,
+        serializer: Serializer = DEFAULT_SERIALIZER,
+    ) -> JsonEvent:
+        return cls(
+            type=type,
+            data=serializer.dumps(data) if data is not None else None,
+            metadata=serializer.dumps(metadata) if metadata is not None else None,
+        )
+
 
 @dataclass
 class BinaryEvent(EventData):
     content_type: Literal[ContentType.BINARY] = ContentType.BINARY
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
 class RecordedEvent:
     stream_name: str
     id: UUID
@@ -46,15 +114,146 @@ class RecordedEvent:
     metadata: bytes | None
 
 
-@dataclass
-class JsonRecordedEvent(RecordedEvent): ...
+_UNSET: Any = object()
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
+class JsonRecordedEvent(RecordedEvent):
+    __slots__ = ("_json",)
+
+    serializer: Serializer = field(default=DEFAULT_SERIALIZER, repr=False, compare=False)
+
+    def json(self) -> Any:
+        # parsed on first access only, many consumers never look at the payload
+        value = getattr(self, "_json", _UNSET)
+        if value is _UNSET:
+            value = self.serializer.loads(self.data) if self.data is not None else None
+            self._json = value
+        return value
+
+
+@dataclass_slots
+@dataclass(frozen=True)
 class BinaryRecordedEvent(RecordedEvent): ...
 
 
-@dataclass
+class CompressedBinaryRecordedEvent(BinaryRecordedEvent):
+    # data is received as a compressed frame and only decompressed on first access
+    __slots__ = ("_data", "_decompressed")
+
+    _data: bytes | None
+    _decompressed: bool
+
+    @property
+    def data(self) -> bytes | None:
+        if not self._decompressed:
+            self._data = decompress_payload(self._data) if self._data is not None else None
+            self._decompressed = True
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes | None) -> None:
+        self._data = value
+        self._decompressed = value is None or not is_compressed_payload(value)
+
+
+class LazyField(Generic[T]):
+    def __init__(self, decode: Callable[[RecordedEventMessage], T]) -> None:
+        self._decode = decode
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # the decoded value is cached in the slot of the field in RecordedEvent
+        self._slot = RecordedEvent.__dict__[name]
+
+    def __get__(self, instance: LazyRecordedEvent, owner: type) -> T:
+        try:
+            return self._slot.__get__(instance, owner)  # type: ignore[no-any-return]
+        except AttributeError:
+            value = self._decode(instance._message)
+            self._slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: LazyRecordedEvent, value: T) -> None:
+        self._slot.__set__(instance, value)
+
+
+class LazyRecordedEvent(RecordedEvent):
+    # backed by the received message, each field is decoded on first access.
+    # the concrete classes add the _message slot, otherwise their layouts would conflict
+    __slots__ = ()
+
+    # the eager class the event stands in for, it compares and hashes like one
+    _eager_class: type[RecordedEvent] = RecordedEvent
+
+    _message: RecordedEventMessage
+
+    stream_name = LazyField(lambda m: m.stream_identifier.stream_name.decode())
+    id = LazyField(lambda m: uuid_from_message(m.id))
+    type = LazyField(lambda m: m.metadata["type"])
+    content_type = LazyField(lambda m: ContentType(m.metadata["content-type"]))
+    revision = LazyField(lambda m: m.stream_revision)
+    created = LazyField(lambda m: int(m.metadata["created"]))
+    position = LazyField(
+        lambda m: AllPosition(
+            commit_position=m.commit_position,
+            prepare_position=m.prepare_position,
+        ),
+    )
+    data = LazyField(lambda m: m.data or None)
+    metadata = LazyField(lambda m: m.custom_metadata or None)
+
+    def __init__(self, message: RecordedEventMessage | None = None, **fields: Any) -> None:
+        # dataclasses.replace passes all fields, they are read from the original event
+        # and so decoded before the copy is created without a message
+        object.__setattr__(self, "_message", message)
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        other_class = other._eager_class if isinstance(other, LazyRecordedEvent) else type(other)
+        if other_class is not self._eager_class:
+            return NotImplemented
+        return compared_fields(self, self._eager_class) == compared_fields(other, other_class)
+
+    def __hash__(self) -> int:
+        return hash(compared_fields(self, self._eager_class))
+
+
+def compared_fields(event: object, cls: type[RecordedEvent]) -> tuple[Any, ...]:
+    # the fields the dataclass __eq__ and __hash__ of cls are based on
+    return tuple(getattr(event, f.name) for f in dataclasses.fields(cls) if f.compare)
+
+
+class LazyJsonRecordedEvent(LazyRecordedEvent, JsonRecordedEvent):
+    __slots__ = ("_message",)
+
+    _eager_class = JsonRecordedEvent
+
+    def __init__(
+        self,
+        message: RecordedEventMessage | None = None,
+        serializer: Serializer = DEFAULT_SERIALIZER,
+        **fields: Any,
+    ) -> None:
+        super().__init__(message, **fields)
+        object.__setattr__(self, "serializer", serializer)
+
+
+class LazyBinaryRecordedEvent(LazyRecordedEvent, BinaryRecordedEvent):
+    __slots__ = ("_message",)
+
+    _eager_class = BinaryRecordedEvent
+
+
+class LazyCompressedBinaryRecordedEvent(LazyBinaryRecordedEvent):
+    __slots__ = ()
+
+    data = LazyField(lambda m: decompress_payload(m.data))
+
+
+@dataclass_slots
+@dataclass(frozen=True)
 class ReadEvent:
     event: RecordedEvent | None = None
     link: RecordedEvent | None = None
@@ -69,6 +268,7 @@ class CaughtUp: ...
 class FellBehind: ...
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
 class PersistentSubscriptionEvent(ReadEvent):
     retry_count: int | None = None
@@ -3,6 +3,10 @@ from eventstoredb.client.append_to_stream.exceptions import (
     RevisionMismatchError,
     StreamAlreadyExistsError,
 )
+from eventstoredb.client.batch_append.exceptions import (
+    BatchAppendWriterClosedError,
+    UnexpectedBatchAppendResponseError,
+)
 from eventstoredb.client.create_persistent_subscription_to_stream.exceptions import (
     PersistentSubscriptionAlreadyExistsError,
     PersistentSubscriptionDroppedError,
@@ -20,6 +24,7 @@ from eventstoredb.client.exceptions import (
 
 __all__ = [
     "AppendToStreamError",
+    "BatchAppendWriterClosedError",
     "ClientError",
     "ConnectionStringError",
     "ConnectionStringMalformedError",
@@ -32,4 +37,5 @@ __all__ = [
     "RevisionMismatchError",
     "StreamAlreadyExistsError",
     "StreamNotFoundError",
+    "UnexpectedBatchAppendResponseError",
 ]
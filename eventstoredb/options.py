@@ -1,7 +1,11 @@
+from eventstoredb.client.append_many.types import AppendManyOptions
 from eventstoredb.client.append_to_stream.types import (
     AppendExpectedRevision,
     AppendToStreamOptions,
+    AppendToStreamWithRetryOptions,
+    GroupCommitOptions,
 )
+from eventstoredb.client.batch_append.types import BatchAppendOptions
 from eventstoredb.client.create_persistent_subscription_to_all.types import (
     CreatePersistentSubscriptionToAllOptions,
 )
@@ -16,8 +20,12 @@ from eventstoredb.client.delete_persistent_subscription_to_all.types import (
 from eventstoredb.client.delete_persistent_subscription_to_stream.types import (
     DeletePersistentSubscriptionToStreamOptions,
 )
-from eventstoredb.client.read_all.types import ReadAllOptions
-from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.client.read_all.types import ReadAllBatchesOptions, ReadAllOptions
+from eventstoredb.client.read_paged.types import ReadAllPagedOptions, ReadStreamPagedOptions
+from eventstoredb.client.read_stream.types import ReadStreamBatchesOptions, ReadStreamOptions
+from eventstoredb.client.read_streams.types import ReadStreamsOptions
+from eventstoredb.client.resolve_links.types import ResolveLinksOptions
+from eventstoredb.client.scan_all.types import ScanAllOptions
 from eventstoredb.client.subscribe_to_all.types import SubscribeToAllOptions
 from eventstoredb.client.subscribe_to_persistent_subscription_to_all.types import (
     SubscribeToPersistentSubscriptionToAllOptions,
@@ -34,23 +42,36 @@ from eventstoredb.client.update_persistent_subscription_to_all.types import (
 from eventstoredb.client.update_persistent_subscription_to_stream.types import (
     UpdatePersistentSubscriptionToStreamOptions,
 )
+from eventstoredb.compression import CompressionOptions
 from eventstoredb.types import AllPosition, ReadDirection, StreamPosition
 
 __all__ = [
     "AllPosition",
     "AppendExpectedRevision",
+    "AppendManyOptions",
     "AppendToStreamOptions",
+    "AppendToStreamWithRetryOptions",
+    "BatchAppendOptions",
     "ClientOptions",
+    "CompressionOptions",
     "ConsumerStrategy",
     "CreatePersistentSubscriptionToAllOptions",
     "CreatePersistentSubscriptionToStreamOptions",
     "DeletePersistentSubscriptionToAllOptions",
     "DeletePersistentSubscriptionToStreamOptions",
+    "GroupCommitOptions",
     "NackAction",
     "PersistentSubscriptionSettings",
+    "ReadAllBatchesOptions",
     "ReadAllOptions",
+    "ReadAllPagedOptions",
     "ReadDirection",
+    "ReadStreamBatchesOptions",
     "ReadStreamOptions",
+    "ReadStreamPagedOptions",
+    "ReadStreamsOptions",
+    "ResolveLinksOptions",
+    "ScanAllOptions",
     "StreamPosition",
     "SubscribeToAllOptions",
     "SubscribeToPersistentSubscriptionToAllOptions",
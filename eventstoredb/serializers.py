@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import importlib
+import json
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class SerializerError(ValueError): ...
+
+
+class SerializerNotFoundError(SerializerError):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__(f"Serializer '{name}' is not registered")
+
+
+class SerializerNotInstalledError(SerializerError):
+    def __init__(self, name: str, module: str) -> None:
+        self.name = name
+        self.module = module
+        super().__init__(f"Serializer '{name}' requires '{module}' to be installed")
+
+
+class Serializer(Protocol):
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonSerializer:
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    def __init__(self) -> None:
+        self._orjson = import_serializer_module("orjson", "orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecSerializer:
+    def __init__(self) -> None:
+        msgspec = import_serializer_module("msgspec", "msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def import_serializer_module(name: str, module: str) -> Any:
+    # optional dependencies are imported on use, so they are only required when selected
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise SerializerNotInstalledError(name=name, module=module) from e
+
+
+_serializers: dict[str, Callable[[], Serializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+}
+
+
+def register_serializer(name: str, factory: Callable[[], Serializer]) -> None:
+    _serializers[name] = factory
+
+
+def get_serializer(name: str) -> Serializer:
+    factory = _serializers.get(name)
+    if factory is None:
+        raise SerializerNotFoundError(name)
+    return factory()
+
+
+DEFAULT_SERIALIZER: Serializer = JsonSerializer()
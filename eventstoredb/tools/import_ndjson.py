@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, TextIO
+from uuid import UUID
+
+from eventstoredb import Client
+from eventstoredb.events import JsonEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class RecordMalformedError(ValueError):
+    def __init__(self, line_number: int, reason: str) -> None:
+        self.line_number = line_number
+        super().__init__(f"Record on line {line_number} is malformed: {reason}")
+
+
+def parse_record(line: str, line_number: int = 0) -> tuple[str, JsonEvent]:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise RecordMalformedError(line_number, str(e)) from e
+    if not isinstance(record, dict):
+        raise RecordMalformedError(line_number, "expected a JSON object")
+    if not isinstance(record.get("stream"), str) or not isinstance(record.get("type"), str):
+        raise RecordMalformedError(line_number, "'stream' and 'type' are required strings")
+
+    event = JsonEvent(type=record["type"])
+    if record.get("id") is not None:
+        event.id = parse_record_id(record["id"], line_number)
+    if record.get("data") is not None:
+        event.data = json.dumps(record["data"]).encode()
+    if record.get("metadata") is not None:
+        event.metadata = json.dumps(record["metadata"]).encode()
+    return record["stream"], event
+
+
+def parse_record_id(value: object, line_number: int) -> UUID:
+    if not isinstance(value, str):
+        raise RecordMalformedError(line_number, "'id' must be a UUID string")
+    try:
+        return UUID(value)
+    except ValueError as e:
+        raise RecordMalformedError(line_number, f"'id' is not a valid UUID: {e}") from e
+
+
+def read_records(file: TextIO) -> Iterator[tuple[str, JsonEvent]]:
+    for line_number, line in enumerate(file, start=1):
+        if line.strip():
+            yield parse_record(line, line_number)
+
+
+def group_records(
+    records: Iterable[tuple[str, JsonEvent]],
+    max_batch_size: int,
+) -> Iterator[tuple[str, list[JsonEvent]]]:
+    # consecutive records of the same stream are appended together
+    stream_name = ""
+    batch: list[JsonEvent] = []
+    for record_stream_name, event in records:
+        if batch and (record_stream_name != stream_name or len(batch) >= max_batch_size):
+            yield stream_name, batch
+            batch = []
+        stream_name = record_stream_name
+        batch.append(event)
+    if batch:
+        yield stream_name, batch
+
+
+class Importer:
+    def __init__(
+        self,
+        client: Client,
+        max_in_flight: int,
+        progress_interval: float,
+        output: TextIO = sys.stderr,
+    ) -> None:
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._progress_interval = progress_interval
+        self._output = output
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
+        self._error: BaseException | None = None
+        self.imported = 0
+        self._started = 0.0
+        self._last_progress = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    async def run(self, batches: Iterable[tuple[str, list[JsonEvent]]]) -> None:
+        self._started = self._last_progress = time.monotonic()
+        try:
+            for stream_name, events in batches:
+                await self._semaphore.acquire()
+                if self._error is not None:
+                    raise self._error
+                self._submit(stream_name, events)
+            await asyncio.gather(*self._in_flight.values())
+        finally:
+            for task in self._in_flight.values():
+                task.cancel()
+
+    def _submit(self, stream_name: str, events: list[JsonEvent]) -> None:
+        # a stream that is still being written to is appended to once that append is done,
+        # this keeps the order of the events within each stream
+        previous = self._in_flight.get(stream_name)
+        task = asyncio.create_task(self._append(stream_name, events, previous))
+        self._in_flight[stream_name] = task
+        task.add_done_callback(lambda _: self._on_done(stream_name, task))
+
+    async def _append(
+        self,
+        stream_name: str,
+        events: list[JsonEvent],
+        previous: asyncio.Task[None] | None,
+    ) -> None:
+        if previous is not None:
+            await previous
+        await self._client.append_to_stream(stream_name=stream_name, events=events)
+        self.imported += len(events)
+
+    def _on_done(self, stream_name: str, task: asyncio.Task[None]) -> None:
+        if self._in_flight.get(stream_name) is task:
+            del self._in_flight[stream_name]
+        self._semaphore.release()
+        if not task.cancelled() and task.exception() is not None and self._error is None:
+            self._error = task.exception()
+        self._report_progress()
+
+    def _report_progress(self) -> None:
+        now = time.monotonic()
+        if now - self._last_progress < self._progress_interval:
+            return
+        self._last_progress = now
+        rate = self.imported / max(self.elapsed, 1e-9)
+        print(f"imported {self.imported} events ({rate:.0f} events/s)", file=self._output)
+
+
+async def import_ndjson(
+    client: Client,
+    file: TextIO,
+    max_in_flight: int = 100,
+    max_batch_size: int = 500,
+    progress_interval: float = 1.0,
+) -> Importer:
+    importer = Importer(
+        client=client,
+        max_in_flight=max_in_flight,
+        progress_interval=progress_interval,
+    )
+    await importer.run(group_records(read_records(file), max_batch_size=max_batch_size))
+    return importer
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m eventstoredb.tools.import_ndjson",
+        description="Import newline-delimited JSON records into EventStoreDB",
+    )
+    parser.add_argument("file", help="path to the NDJSON file, '-' reads from stdin")
+    parser.add_argument(
+        "--connection-string",
+        default="esdb://localhost:2113",
+        help="(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=100,
+        help="maximum number of streams appended to concurrently (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="maximum number of events per append (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=1.0,
+        help="seconds between progress reports (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    client = Client(args.connection_string)
+    with sys.stdin if args.file == "-" else open(args.file, encoding="utf-8") as file:  # noqa: PTH123
+        importer = asyncio.run(
+            import_ndjson(
+                client=client,
+                file=file,
+                max_in_flight=args.max_in_flight,
+                max_batch_size=args.batch_size,
+                progress_interval=args.progress_interval,
+            ),
+        )
+
+    elapsed = importer.elapsed
+    print(
+        f"imported {importer.imported} events in {elapsed:.2f}s "
+        f"({importer.imported / max(elapsed, 1e-9):.0f} events/s)",
+    )
+
+
+if __name__ == "__main__":
+    main()
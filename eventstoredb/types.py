@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
 
+from eventstoredb.utils import dataclass_slots
+
 Position = int
 StreamRevision = int
 
@@ -17,7 +19,8 @@ class ReadDirection(Enum):
     BACKWARDS = auto()
 
 
-@dataclass
+@dataclass_slots
+@dataclass(frozen=True)
 class AllPosition:
     commit_position: int
     prepare_position: int
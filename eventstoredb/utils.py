@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, TypeVar, cast
+from uuid import UUID, SafeUUID
+
+from eventstoredb.generated.event_store.client import Uuid, UuidStructured
+
+T = TypeVar("T")
+
+INT64_MASK = (1 << 64) - 1
+
+
+def dataclass_slots(cls: type[T]) -> type[T]:
+    # NOTE backport of dataclass(slots=True) which requires python3.10
+    fields = dataclasses.fields(cls)  # type: ignore[arg-type]
+    inherited_slots = {
+        slot for base in cls.__mro__[1:] for slot in base.__dict__.get("__slots__", ())
+    }
+    # slots declared in the class body are kept for attributes that are not fields
+    extra_slots = tuple(cls.__dict__.get("__slots__", ()))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = extra_slots + tuple(
+        f.name for f in fields if f.name not in inherited_slots
+    )
+    for name in (*extra_slots, *(f.name for f in fields)):
+        # defaults are kept by the generated __init__, the class attributes would shadow the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # the generated methods are bound to the original class, which is replaced here
+        cls_dict["__setattr__"] = _frozen_setattr
+        cls_dict["__delattr__"] = _frozen_delattr
+        cls_dict["__getstate__"] = _dataclass_getstate
+        cls_dict["__setstate__"] = _dataclass_setstate
+
+    slotted_cls = cast("type[T]", type(cls.__name__, cls.__bases__, cls_dict))
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    if name in self.__dataclass_fields__:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")  # noqa: TRY003
+    object.__setattr__(self, name, value)  # noqa: PLC2801
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    if name in self.__dataclass_fields__:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")  # noqa: TRY003
+    object.__delattr__(self, name)  # noqa: PLC2801
+
+
+def _dataclass_getstate(self: Any) -> list[Any]:
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+
+def _dataclass_setstate(self: Any, state: list[Any]) -> None:
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)  # noqa: PLC2801
+
+
+def uuid_from_int(value: int) -> UUID:
+    # skips the argument handling of UUID.__init__, the value is known to be a valid 128 bit int
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, "int", value)  # noqa: PLC2801
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)  # noqa: PLC2801
+    return uuid
+
+
+def uuid_from_message(message: Uuid) -> UUID:
+    # string and structured are a oneof, an empty string means the structured form was sent
+    if message.string:
+        return UUID(message.string)
+    structured = message.structured
+    return uuid_from_int(
+        (structured.most_significant_bits & INT64_MASK) << 64
+        | structured.least_significant_bits & INT64_MASK,
+    )
+
+
+def uuid_to_message(uuid: UUID, structured: bool = False) -> Uuid:
+    if not structured:
+        return Uuid(string=str(uuid))
+    value = uuid.int
+    return Uuid(
+        structured=UuidStructured(
+            most_significant_bits=to_int64(value >> 64),
+            least_significant_bits=to_int64(value & INT64_MASK),
+        ),
+    )
+
+
+def to_int64(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
@@ -0,0 +1,211 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any, Union
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.aggregates import (
+    SNAPSHOT_EVENT_TYPE,
+    AggregateRepository,
+    AggregateRepositoryOptions,
+    Snapshot,
+)
+from eventstoredb.client.append_to_stream.types import (
+    AppendExpectedRevision,
+    AppendResult,
+    AppendToStreamOptions,
+)
+from eventstoredb.client.read_stream.types import ReadStreamOptions
+from eventstoredb.events import (
+    CaughtUp,
+    EventData,
+    FellBehind,
+    JsonRecordedEvent,
+    ReadEvent,
+    RecordedEvent,
+)
+from eventstoredb.exceptions import StreamNotFoundError
+from eventstoredb.options import ClientOptions
+from eventstoredb.types import AllPosition, ReadDirection
+
+
+def apply(state: int, event: RecordedEvent) -> int:
+    assert isinstance(event, JsonRecordedEvent)
+    return state + int(event.json()["amount"])
+
+
+def create_repository(client: Client, snapshot_interval: int) -> AggregateRepository[int]:
+    def from_snapshot(data: Any) -> int:
+        return int(data)
+
+    return AggregateRepository(
+        client,
+        initial=lambda: 0,
+        apply=apply,
+        to_snapshot=lambda state: state,
+        from_snapshot=from_snapshot,
+        options=AggregateRepositoryOptions(snapshot_interval=snapshot_interval),
+    )
+
+
+async def test_aggregate_repository_load_new(eventstoredb_client: Client, stream_name: str) -> None:
+    repository = create_repository(eventstoredb_client, snapshot_interval=5)
+
+    aggregate = await repository.load(stream_name)
+
+    assert aggregate.state == 0
+    assert aggregate.revision is None
+    assert aggregate.expected_revision == AppendExpectedRevision.NO_STREAM
+
+
+async def test_aggregate_repository_snapshots(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    repository = create_repository(eventstoredb_client, snapshot_interval=5)
+    aggregate = await repository.load(stream_name)
+    await repository.save(
+        aggregate,
+        [eventstoredb_client.json_event(type="Deposited", data={"amount": 1}) for _ in range(6)],
+    )
+
+    aggregate = await repository.load(stream_name)
+    await repository.wait_for_snapshots()
+    assert aggregate.state == 6
+    assert aggregate.revision == 5
+    assert aggregate.snapshot_revision is None
+
+    await repository.save(
+        aggregate,
+        eventstoredb_client.json_event(type="Deposited", data={"amount": 10}),
+    )
+    aggregate = await repository.load(stream_name)
+
+    assert aggregate.state == 16
+    assert aggregate.revision == 6
+    assert aggregate.snapshot_revision == 5
+
+
+class InMemoryClient(Client):
+    # keeps appended events in memory, reads serve them as recorded events
+    def __init__(self) -> None:
+        super().__init__(ClientOptions(host="localhost"))
+        self.streams: dict[str, list[JsonRecordedEvent]] = {}
+
+    async def _append_to_stream(
+        self,
+        stream_name: str,
+        events: Union[EventData, Iterable[EventData], AsyncIterable[EventData]],
+        options: AppendToStreamOptions,
+    ) -> AppendResult:
+        assert isinstance(events, EventData)
+        stream = self.streams.setdefault(stream_name, [])
+        stream.append(
+            JsonRecordedEvent(
+                stream_name=stream_name,
+                id=events.id,
+                type=events.type,
+                content_type=events.content_type,
+                revision=len(stream),
+                created=0,
+                position=AllPosition(0, 0),
+                data=events.data,
+                metadata=events.metadata,
+            ),
+        )
+        return AppendResult(success=True, next_expected_revision=len(stream) - 1)
+
+    async def _read_stream(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> AsyncIterator[Union[ReadEvent, CaughtUp, FellBehind]]:
+        if stream_name not in self.streams:
+            raise StreamNotFoundError(stream_name)
+        events = self.streams[stream_name]
+        if options.direction == ReadDirection.BACKWARDS:
+            events = events[::-1]
+        elif isinstance(options.from_revision, int):
+            events = events[options.from_revision :]
+        for event in events[: options.max_count]:
+            yield ReadEvent(event=event)
+
+
+async def test_aggregate_repository_snapshot_serializes_state_on_load() -> None:
+    client = InMemoryClient()
+    repository = AggregateRepository[list[int]](
+        client,
+        initial=list,
+        apply=lambda state, event: [*state, apply(0, event)],
+        to_snapshot=list,
+        from_snapshot=list,
+        options=AggregateRepositoryOptions(snapshot_interval=2),
+    )
+    for amount in range(3):
+        await client.append_to_stream(
+            "account",
+            client.json_event(type="Deposited", data={"amount": amount}),
+        )
+
+    aggregate = await repository.load("account")
+    aggregate.state.append(100)
+    await repository.wait_for_snapshots()
+
+    snapshot = await repository.read_snapshot("account")
+    assert snapshot is not None
+    assert snapshot.revision == 2
+    assert snapshot.state == [0, 1, 2]
+    assert [e.type for e in client.streams["snapshot-account"]] == [SNAPSHOT_EVENT_TYPE]
+    assert not SNAPSHOT_EVENT_TYPE.startswith("$")
+    metadata = client.streams["$$snapshot-account"]
+    assert [e.type for e in metadata] == ["$metadata"]
+    assert metadata[0].json() == {"$maxCount": 1}
+
+    # the stream already exists, its metadata is only written once
+    await repository.write_snapshot("account", Snapshot(revision=2, state=[0, 1, 2]))
+    assert len(client.streams["snapshot-account"]) == 2
+    assert len(client.streams["$$snapshot-account"]) == 1
+
+
+async def test_aggregate_repository_ignores_snapshot_that_is_not_an_object() -> None:
+    client = InMemoryClient()
+    repository = create_repository(client, snapshot_interval=5)
+    await client.append_to_stream(
+        "snapshot-account",
+        client.json_event(type=SNAPSHOT_EVENT_TYPE, data=[1]),
+    )
+
+    assert await repository.read_snapshot("account") is None
+
+
+class FailingSnapshotClient(InMemoryClient):
+    async def _append_to_stream(
+        self,
+        stream_name: str,
+        events: Union[EventData, Iterable[EventData], AsyncIterable[EventData]],
+        options: AppendToStreamOptions,
+    ) -> AppendResult:
+        if stream_name.startswith("snapshot-"):
+            raise RuntimeError
+        return await super()._append_to_stream(stream_name, events, options)
+
+
+async def test_aggregate_repository_logs_failed_snapshots(caplog: pytest.LogCaptureFixture) -> None:
+    client = FailingSnapshotClient()
+    repository = create_repository(client, snapshot_interval=1)
+    await client.append_to_stream(
+        "account",
+        client.json_event(type="Deposited", data={"amount": 1}),
+    )
+
+    await repository.load("account")
+    (task,) = repository._snapshot_tasks.values()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert not repository._snapshot_tasks
+    (record,) = caplog.records
+    assert record.levelname == "ERROR"
+    assert "account" in record.getMessage()
+    assert record.exc_info is not None
+    assert isinstance(record.exc_info[1], RuntimeError)
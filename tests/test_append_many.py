@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Optional, Union
+from uuid import uuid4
+
+from eventstoredb import Client
+from eventstoredb.client.append_many.types import AppendManyRequest
+from eventstoredb.client.append_to_stream.types import AppendResult
+from eventstoredb.events import EventData, JsonEvent
+from eventstoredb.exceptions import StreamAlreadyExistsError
+from eventstoredb.options import (
+    AppendExpectedRevision,
+    AppendManyOptions,
+    AppendToStreamOptions,
+    ClientOptions,
+)
+
+from .utils import EventstoreHTTP as HTTPClient, json_test_events  # noqa: TID252
+
+
+async def test_append_many_mapping(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+) -> None:
+    stream_names = [f"test-stream-{uuid4()}" for _ in range(10)]
+
+    results = await eventstoredb_client.append_many(
+        {stream_name: json_test_events(2) for stream_name in stream_names},
+    )
+
+    assert [r.stream_name for r in results] == stream_names
+    assert all(r.success for r in results)
+    assert [r.result.next_expected_revision for r in results if r.result] == [1] * 10
+    for stream_name in stream_names:
+        assert len(eventstoredb_httpclient.read_stream(stream_name)) == 2
+
+
+async def test_append_many_async_iterable_in_submission_order(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+) -> None:
+    stream_names = [f"test-stream-{uuid4()}" for _ in range(3)]
+
+    async def requests() -> AsyncIterator[AppendManyRequest]:
+        for i in range(30):
+            yield stream_names[i % 3], JsonEvent(type=f"Test{i}"), None
+
+    results = await eventstoredb_client.append_many(
+        requests(),
+        options=AppendManyOptions(max_in_flight=5),
+    )
+
+    assert [r.stream_name for r in results] == [stream_names[i % 3] for i in range(30)]
+    assert all(r.success for r in results)
+    for stream_name in stream_names:
+        assert len(eventstoredb_httpclient.read_stream(stream_name)) == 10
+
+
+async def test_append_many_reports_failures_per_stream(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+) -> None:
+    existing_stream_name = f"test-stream-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=existing_stream_name,
+        events=JsonEvent(type="Test"),
+    )
+    stream_names = [f"test-stream-{uuid4()}" for _ in range(2)]
+    no_stream = AppendToStreamOptions(expected_revision=AppendExpectedRevision.NO_STREAM)
+
+    results = await eventstoredb_client.append_many(
+        [
+            (stream_names[0], JsonEvent(type="Test"), no_stream),
+            (existing_stream_name, JsonEvent(type="Test"), no_stream),
+            (stream_names[1], JsonEvent(type="Test"), no_stream),
+        ],
+    )
+
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, StreamAlreadyExistsError)
+    assert results[1].result is None
+    for stream_name in stream_names:
+        assert len(eventstoredb_httpclient.read_stream(stream_name)) == 1
+
+
+class RecordingClient(Client):
+    # appends take as long as the event type says, finished appends are recorded in order
+    def __init__(self) -> None:
+        super().__init__(ClientOptions(host="localhost"))
+        self.appended: list[tuple[str, str]] = []
+
+    async def append_to_stream(
+        self,
+        stream_name: str,
+        events: Union[EventData, Iterable[EventData], AsyncIterable[EventData]],
+        options: Optional[AppendToStreamOptions] = None,
+    ) -> AppendResult:
+        assert isinstance(events, EventData)
+        await asyncio.sleep(float(events.type))
+        self.appended.append((stream_name, events.type))
+        return AppendResult(success=True, next_expected_revision=0)
+
+
+async def test_append_many_appends_to_the_same_stream_in_order() -> None:
+    client = RecordingClient()
+
+    results = await client.append_many(
+        [
+            ("test", JsonEvent(type="0.02"), None),
+            ("other", JsonEvent(type="0.01"), None),
+            ("test", JsonEvent(type="0"), None),
+        ],
+    )
+
+    assert all(r.success for r in results)
+    assert client.appended == [("other", "0.01"), ("test", "0.02"), ("test", "0")]
@@ -1,15 +1,40 @@
+import asyncio
 import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import FrozenInstanceError
 
 import pytest
+from grpclib.client import Channel
 
 from eventstoredb import Client
-from eventstoredb.events import JsonEvent
+from eventstoredb.client.append_to_stream.group_commit import GroupCommit
+from eventstoredb.client.append_to_stream.grpc import create_append_request
+from eventstoredb.client.append_to_stream.types import AppendResult
+from eventstoredb.compression import CompressionOptions
+from eventstoredb.events import (
+    BinaryEvent,
+    EncodedEventData,
+    EventData,
+    JsonEvent,
+    RecordedEvent,
+)
 from eventstoredb.exceptions import (
     RevisionMismatchError,
     StreamAlreadyExistsError,
     StreamNotFoundError,
 )
-from eventstoredb.options import AppendExpectedRevision, AppendToStreamOptions
+from eventstoredb.generated.event_store.client.streams import (
+    AppendReq,
+    AppendResp,
+    AppendRespSuccess,
+)
+from eventstoredb.options import (
+    AppendExpectedRevision,
+    AppendToStreamOptions,
+    AppendToStreamWithRetryOptions,
+    ClientOptions,
+    GroupCommitOptions,
+)
 
 from .utils import EventstoreHTTP as HTTPClient  # noqa: TID252
 
@@ -134,6 +159,94 @@ async def test_append_to_stream_one_json_with_data_and_metadata(
     assert json.loads(http_events[0]["metaData"]) == {"meta": "data"}
 
 
+def test_encoded_event_data_serializes_like_event_data() -> None:
+    event = JsonEvent(
+        type="TestEvent",
+        data=json.dumps({"some": "data"}).encode(),
+        metadata=json.dumps({"meta": "data"}).encode(),
+    )
+    encoded = event.encode()
+
+    assert isinstance(encoded, EncodedEventData)
+    assert encoded.encode() is encoded
+    assert bytes(create_append_request(encoded)) == bytes(create_append_request(event))
+
+
+def test_encoded_event_data_is_frozen() -> None:
+    encoded = JsonEvent(type="TestEvent", data=b"{}").encode()
+
+    with pytest.raises(FrozenInstanceError):
+        encoded.data = b"[]"  # type: ignore[misc]
+
+
+def test_encoded_event_data_is_encoded_again_with_other_options() -> None:
+    event = BinaryEvent(type="TestEvent", data=b"x" * 2000)
+    compression = CompressionOptions(min_size=0)
+    encoded = event.encode()
+
+    assert encoded.encode() is encoded
+    assert bytes(create_append_request(encoded, compression=compression)) == bytes(
+        create_append_request(event, compression=compression),
+    )
+    assert bytes(create_append_request(encoded, structured_uuids=True)) == bytes(
+        create_append_request(event, structured_uuids=True),
+    )
+    encoded = event.encode(compression=compression)
+    assert encoded.data == event.data
+    assert bytes(create_append_request(encoded, compression=compression)) == bytes(
+        create_append_request(event, compression=compression),
+    )
+
+
+def test_encoded_append_request_repr_and_eq() -> None:
+    event = JsonEvent(type="TestEvent", data=b"{}")
+    request = create_append_request(event.encode())
+
+    assert request == create_append_request(event)
+    assert request != create_append_request(JsonEvent(type="OtherEvent"))
+    assert "TestEvent" in repr(request)
+
+
+async def test_append_to_stream_encoded_json_to_multiple_streams(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    encoded = JsonEvent(type="TestEvent", data=json.dumps({"some": "data"}).encode()).encode()
+    other_stream_name = f"{stream_name}-other"
+
+    await eventstoredb_client.append_to_stream(stream_name=stream_name, events=encoded)
+    await eventstoredb_client.append_to_stream(stream_name=other_stream_name, events=[encoded])
+
+    for name in (stream_name, other_stream_name):
+        http_events = eventstoredb_httpclient.read_stream(name)
+        assert len(http_events) == 1
+        assert http_events[0]["eventType"] == "TestEvent"
+        assert http_events[0]["isJson"] is True
+        assert json.loads(http_events[0]["data"]) == {"some": "data"}
+
+
+async def test_append_to_stream_async_iterable(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    async def events() -> AsyncIterator[JsonEvent]:
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield JsonEvent(type=f"Test{i + 1}")
+
+    result = await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=events(),
+    )
+
+    assert result.next_expected_revision == 2
+
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert [e["eventType"] for e in http_events] == ["Test1", "Test2", "Test3"]
+
+
 @pytest.mark.skip(reason="test not implemented")
 async def test_append_to_stream_one_binary() -> None:
     pass
@@ -298,3 +411,277 @@ async def test_append_to_stream_expected_revision_exact_but_not_exist(
             events=JsonEvent(type="TestEvent"),
         )
     assert execinfo.value.stream_name == stream_name
+
+
+class FakeStreamsStub:
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+        self.requests: list[AppendReq] = []
+
+    async def append(self, requests: AsyncIterator[AppendReq]) -> AppendResp:
+        self.requests = [r async for r in requests]
+        await self.release.wait()
+        return AppendResp(success=AppendRespSuccess(current_revision=len(self.requests) - 2))
+
+
+def create_group_commit(stub: FakeStreamsStub, max_events: int = 100) -> GroupCommit:
+    group_commit = GroupCommit(
+        channel=Channel(host="localhost", port=2113),
+        options=GroupCommitOptions(window=10_000_000, max_events=max_events),
+    )
+    group_commit._client = stub  # type: ignore[assignment]
+    return group_commit
+
+
+async def test_group_commit_leaves_out_cancelled_callers() -> None:
+    release = asyncio.Event()
+    release.set()
+    stub = FakeStreamsStub(release)
+    group_commit = create_group_commit(stub, max_events=3)
+
+    cancelled = asyncio.create_task(
+        group_commit.append_to_stream("test", [JsonEvent(type="Cancelled")]),
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    results = await asyncio.gather(
+        group_commit.append_to_stream("test", [JsonEvent(type="Test1")]),
+        group_commit.append_to_stream("test", [JsonEvent(type="Test2")]),
+    )
+
+    assert cancelled.cancelled()
+    assert [r.proposed_message.metadata["type"] for r in stub.requests[1:]] == ["Test1", "Test2"]
+    assert [r.next_expected_revision for r in results] == [0, 1]
+
+
+async def test_group_commit_cancelled_commit_cancels_callers() -> None:
+    stub = FakeStreamsStub(asyncio.Event())
+    group_commit = create_group_commit(stub, max_events=1)
+
+    append = asyncio.create_task(group_commit.append_to_stream("test", [JsonEvent(type="Test")]))
+    await asyncio.sleep(0.01)
+    for task in group_commit._tasks:
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(append, timeout=1)
+
+
+async def test_append_to_stream_group_commit(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(
+            host=eventstoredb_host,
+            port=eventstoredb_port,
+            group_commit=GroupCommitOptions(window=50000),
+        ),
+    )
+
+    results = await asyncio.gather(
+        *[
+            client.append_to_stream(
+                stream_name=stream_name,
+                events=[JsonEvent(type=f"Test{i}-1"), JsonEvent(type=f"Test{i}-2")],
+            )
+            for i in range(5)
+        ],
+    )
+
+    assert [r.next_expected_revision for r in results] == [1, 3, 5, 7, 9]
+
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert [e["eventType"] for e in http_events] == [
+        f"Test{i}-{j}" for i in range(5) for j in (1, 2)
+    ]
+
+
+async def test_append_to_stream_group_commit_max_events(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(
+            host=eventstoredb_host,
+            port=eventstoredb_port,
+            group_commit=GroupCommitOptions(window=10_000_000, max_events=2),
+        ),
+    )
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1")),
+            client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test2")),
+        ),
+        timeout=5,
+    )
+
+    assert [r.next_expected_revision for r in results] == [0, 1]
+
+
+async def test_append_to_stream_group_commit_ignores_exact_revision(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(
+            host=eventstoredb_host,
+            port=eventstoredb_port,
+            group_commit=GroupCommitOptions(),
+        ),
+    )
+    await client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1"))
+
+    with pytest.raises(RevisionMismatchError):
+        await client.append_to_stream(
+            stream_name=stream_name,
+            options=AppendToStreamOptions(expected_revision=5),
+            events=JsonEvent(type="Test2"),
+        )
+
+
+class DeletedStreamClient(Client):
+    # the first append fails as the stream was deleted, later appends succeed
+    def __init__(self) -> None:
+        super().__init__(ClientOptions(host="localhost", revision_cache_size=10))
+        self.expected_revisions: list[AppendExpectedRevision | int] = []
+
+    async def _append_to_stream(
+        self,
+        stream_name: str,
+        events: EventData | Iterable[EventData] | AsyncIterable[EventData],
+        options: AppendToStreamOptions,
+    ) -> AppendResult:
+        self.expected_revisions.append(options.expected_revision)
+        if len(self.expected_revisions) == 1:
+            raise StreamNotFoundError(stream_name)
+        return AppendResult(success=True, next_expected_revision=0, position=None)
+
+    async def _read_events_after(
+        self,
+        stream_name: str,
+        revision: int | AppendExpectedRevision,
+    ) -> list[RecordedEvent]:
+        return []
+
+
+async def test_append_to_stream_clears_cached_revision_of_deleted_stream() -> None:
+    client = DeletedStreamClient()
+    assert client.revision_cache is not None
+    client.revision_cache.put("test", 5)
+
+    with pytest.raises(StreamNotFoundError):
+        await client.append_to_stream(
+            stream_name="test",
+            events=JsonEvent(type="Test"),
+            options=AppendToStreamOptions(expected_revision=5),
+        )
+
+    assert client.revision_cache.get("test") is None
+
+
+async def test_append_to_stream_with_retry_on_deleted_stream() -> None:
+    client = DeletedStreamClient()
+    assert client.revision_cache is not None
+    client.revision_cache.put("test", 5)
+    conflicts: list[list[RecordedEvent]] = []
+
+    async def on_conflict(new_events: list[RecordedEvent]) -> EventData:
+        conflicts.append(new_events)
+        return JsonEvent(type="Retried")
+
+    result = await client.append_to_stream_with_retry(
+        stream_name="test",
+        events=JsonEvent(type="Test"),
+        on_conflict=on_conflict,
+    )
+
+    assert result.next_expected_revision == 0
+    assert client.expected_revisions == [5, AppendExpectedRevision.NO_STREAM]
+    assert conflicts == [[]]
+    assert client.revision_cache.get("test") == 0
+
+
+async def test_append_to_stream_with_retry_on_conflict(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, revision_cache_size=100),
+    )
+    other_client = Client(ClientOptions(host=eventstoredb_host, port=eventstoredb_port))
+
+    await client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1"))
+    assert client.revision_cache is not None
+    assert client.revision_cache.get(stream_name) == 0
+
+    await other_client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test2"))
+
+    conflicts: list[list[RecordedEvent]] = []
+
+    async def on_conflict(events: list[RecordedEvent]) -> EventData:
+        conflicts.append(events)
+        return JsonEvent(type="Test3")
+
+    result = await client.append_to_stream_with_retry(
+        stream_name=stream_name,
+        events=JsonEvent(type="Test3"),
+        on_conflict=on_conflict,
+    )
+
+    assert result.next_expected_revision == 2
+    assert [[e.type for e in events] for events in conflicts] == [["Test2"]]
+    assert client.revision_cache.get(stream_name) == 2
+
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert [e["eventType"] for e in http_events] == ["Test1", "Test2", "Test3"]
+
+
+async def test_append_to_stream_with_retry_new_stream(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    async def on_conflict(events: list[RecordedEvent]) -> EventData:
+        raise AssertionError
+
+    result = await eventstoredb_client.append_to_stream_with_retry(
+        stream_name=stream_name,
+        events=JsonEvent(type="Test1"),
+        on_conflict=on_conflict,
+    )
+
+    assert result.next_expected_revision == 0
+
+
+async def test_append_to_stream_with_retry_exhausted(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, revision_cache_size=100),
+    )
+    other_client = Client(ClientOptions(host=eventstoredb_host, port=eventstoredb_port))
+
+    await client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1"))
+    await other_client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test2"))
+
+    async def on_conflict(events: list[RecordedEvent]) -> EventData:
+        raise AssertionError
+
+    with pytest.raises(RevisionMismatchError) as execinfo:
+        await client.append_to_stream_with_retry(
+            stream_name=stream_name,
+            events=JsonEvent(type="Test3"),
+            on_conflict=on_conflict,
+            options=AppendToStreamWithRetryOptions(max_retries=0),
+        )
+
+    assert execinfo.value.current_revision == 1
@@ -0,0 +1,293 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Optional
+from uuid import uuid4
+
+import betterproto
+import pytest
+from grpclib.client import Channel
+
+from eventstoredb import Client
+from eventstoredb.client.append_to_stream.types import AppendResult
+from eventstoredb.client.batch_append.grpc import (
+    BatchAppendRequestChunker,
+    convert_batch_append_response,
+)
+from eventstoredb.client.batch_append.mixin import BatchAppendWriter
+from eventstoredb.compression import decompress_payload, is_compressed_payload
+from eventstoredb.events import BinaryEvent, JsonEvent
+from eventstoredb.exceptions import (
+    BatchAppendWriterClosedError,
+    RevisionMismatchError,
+    StreamAlreadyExistsError,
+    UnexpectedBatchAppendResponseError,
+)
+from eventstoredb.generated.event_store.client.streams import (
+    BatchAppendReq,
+    BatchAppendReqProposedMessage,
+    BatchAppendResp,
+    BatchAppendRespSuccess,
+)
+from eventstoredb.options import AppendExpectedRevision, BatchAppendOptions, CompressionOptions
+from eventstoredb.utils import uuid_from_message
+
+from .utils import EventstoreHTTP as HTTPClient, json_test_events  # noqa: TID252
+
+
+def test_batch_append_request_chunker() -> None:
+    chunker = BatchAppendRequestChunker(
+        correlation_id=uuid4(),
+        stream_name="test-stream",
+        options=BatchAppendOptions(max_chunk_size=2500),
+    )
+    events = [BinaryEvent(type="Test", data=b"x" * 1000) for _ in range(5)]
+
+    requests = [r for r in (chunker.add(e) for e in events) if r is not None]
+    requests.append(chunker.finish())
+
+    assert [len(r.proposed_messages) for r in requests] == [2, 2, 1]
+    assert [r.is_final for r in requests] == [False, False, True]
+    assert len({r.correlation_id.string for r in requests}) == 1
+
+
+def test_convert_batch_append_response_without_result() -> None:
+    with pytest.raises(UnexpectedBatchAppendResponseError):
+        convert_batch_append_response("test-stream", BatchAppendResp())
+
+
+class FakeStreamsStub:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.release = asyncio.Event()
+        self.requests: list[BatchAppendReq] = []
+        self.ended = False
+
+    async def batch_append(
+        self,
+        requests: AsyncIterator[BatchAppendReq],
+    ) -> AsyncIterator[BatchAppendResp]:
+        await self.release.wait()
+        async for request in requests:
+            self.requests.append(request)
+            if self.error is not None:
+                raise self.error
+            if request.is_final:
+                yield BatchAppendResp(
+                    correlation_id=request.correlation_id,
+                    success=BatchAppendRespSuccess(current_revision=0),
+                )
+        self.ended = True
+
+
+def create_batch_append_writer(stub: FakeStreamsStub, queue_size: int = 16) -> BatchAppendWriter:
+    writer = BatchAppendWriter(channel=Channel(host="localhost", port=2113), queue_size=queue_size)
+    writer._client = stub  # type: ignore[assignment]
+    return writer
+
+
+async def test_batch_append_writer_queue_is_bounded() -> None:
+    stub = FakeStreamsStub()
+    writer = create_batch_append_writer(stub, queue_size=2)
+    events = [BinaryEvent(type="Test", data=b"x" * 100) for _ in range(10)]
+
+    append = asyncio.create_task(
+        writer.append_to_stream("test", events, BatchAppendOptions(max_chunk_size=150)),
+    )
+    await asyncio.sleep(0.01)
+
+    assert writer._request_queue.qsize() == 2
+    assert not append.done()
+    stub.release.set()
+    assert (await asyncio.wait_for(append, timeout=1)).success
+    assert len(stub.requests) == 10
+    await writer.close()
+
+
+async def test_batch_append_writer_fails_only_the_append_whose_events_fail() -> None:
+    stub = FakeStreamsStub()
+    stub.release.set()
+    writer = create_batch_append_writer(stub)
+    options = BatchAppendOptions(max_chunk_size=150)
+
+    async def failing_events() -> AsyncIterator[BinaryEvent]:
+        yield BinaryEvent(type="Test", data=b"x" * 100)
+        yield BinaryEvent(type="Test", data=b"x" * 100)
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    async def events() -> AsyncIterator[BinaryEvent]:
+        for _ in range(3):
+            await asyncio.sleep(0.005)
+            yield BinaryEvent(type="Test", data=b"x" * 100)
+
+    failed, appended = await asyncio.gather(
+        writer.append_to_stream("failing", failing_events(), options),
+        writer.append_to_stream("test", events(), options),
+        return_exceptions=True,
+    )
+
+    assert isinstance(failed, ValueError)
+    assert isinstance(appended, AppendResult)
+    assert appended.success
+    assert not stub.ended
+    final = [r.correlation_id.string for r in stub.requests if r.is_final]
+    failing = stub.requests[0].correlation_id.string
+    assert len(final) == 1
+    assert failing not in final
+    assert (await writer.append_to_stream("test", JsonEvent(type="Test"))).success
+    await writer.close()
+    assert stub.ended
+
+
+async def test_batch_append_writer_passes_on_stream_errors() -> None:
+    stub = FakeStreamsStub(error=RuntimeError("stream failed"))
+    stub.release.set()
+    writer = create_batch_append_writer(stub)
+
+    with pytest.raises(RuntimeError, match="stream failed"):
+        await writer.append_to_stream("test", JsonEvent(type="Test"))
+
+
+async def test_batch_append_writer_sends_with_client_encoding_options() -> None:
+    stub = FakeStreamsStub()
+    stub.release.set()
+    writer = BatchAppendWriter(
+        channel=Channel(host="localhost", port=2113),
+        compression=CompressionOptions(),
+        structured_uuids=True,
+    )
+    writer._client = stub  # type: ignore[assignment]
+    event = BinaryEvent(type="Test", data=b"x" * 5000)
+
+    assert (await writer.append_to_stream("test", event)).success
+    await writer.close()
+
+    (message,) = stub.requests[0].proposed_messages
+    sent = BatchAppendReqProposedMessage().parse(bytes(message))
+    assert betterproto.which_one_of(sent.id, "value")[0] == "structured"
+    assert uuid_from_message(sent.id) == event.id
+    assert is_compressed_payload(sent.data)
+    assert decompress_payload(sent.data) == event.data
+
+
+async def test_batch_append_one_json(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    async with eventstoredb_client.batch_append_writer() as writer:
+        result = await writer.append_to_stream(
+            stream_name=stream_name,
+            events=JsonEvent(type="TestEvent"),
+        )
+
+    assert result.success is True
+    assert result.next_expected_revision == 0
+    assert result.position is not None
+
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert len(http_events) == 1
+    assert http_events[0]["eventType"] == "TestEvent"
+
+
+async def test_batch_append_multiple_json(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    async with eventstoredb_client.batch_append_writer() as writer:
+        result = await writer.append_to_stream(
+            stream_name=stream_name,
+            events=json_test_events(3),
+        )
+
+    assert result.next_expected_revision == 2
+
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert [e["eventType"] for e in http_events] == ["Test1", "Test2", "Test3"]
+
+
+async def test_batch_append_concurrent_streams(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+) -> None:
+    stream_names = [f"test-stream-{uuid4()}" for _ in range(10)]
+
+    async with eventstoredb_client.batch_append_writer() as writer:
+        results = await asyncio.gather(
+            *[
+                writer.append_to_stream(stream_name=stream_name, events=json_test_events(2))
+                for stream_name in stream_names
+            ],
+        )
+
+    assert [r.next_expected_revision for r in results] == [1] * len(stream_names)
+    for stream_name in stream_names:
+        assert len(eventstoredb_httpclient.read_stream(stream_name)) == 2
+
+
+async def test_batch_append_expected_revision_no_stream_but_exists(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    async with eventstoredb_client.batch_append_writer() as writer:
+        await writer.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1"))
+
+        with pytest.raises(StreamAlreadyExistsError) as execinfo:
+            await writer.append_to_stream(
+                stream_name=stream_name,
+                events=JsonEvent(type="Test2"),
+                options=BatchAppendOptions(expected_revision=AppendExpectedRevision.NO_STREAM),
+            )
+
+    assert execinfo.value.stream_name == stream_name
+
+
+async def test_batch_append_expected_revision_exact_but_mismatch(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    async with eventstoredb_client.batch_append_writer() as writer:
+        await writer.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test1"))
+
+        with pytest.raises(RevisionMismatchError) as execinfo:
+            await writer.append_to_stream(
+                stream_name=stream_name,
+                events=JsonEvent(type="Test2"),
+                options=BatchAppendOptions(expected_revision=1),
+            )
+
+    assert execinfo.value.stream_name == stream_name
+    assert execinfo.value.expected_revision == 1
+    assert execinfo.value.current_revision == 0
+
+
+async def test_batch_append_after_close(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    writer = eventstoredb_client.batch_append_writer()
+    await writer.close()
+
+    with pytest.raises(BatchAppendWriterClosedError):
+        await writer.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test"))
+
+
+async def test_batch_append_chunked(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    async def events() -> AsyncIterator[BinaryEvent]:
+        for i in range(50):
+            yield BinaryEvent(type=f"Test{i}", data=b"x" * 1000)
+
+    async with eventstoredb_client.batch_append_writer() as writer:
+        result = await writer.append_to_stream(
+            stream_name=stream_name,
+            events=events(),
+            options=BatchAppendOptions(max_chunk_size=10000),
+        )
+
+    assert result.next_expected_revision == 49
+    assert len(eventstoredb_httpclient.read_stream(stream_name)) == 50
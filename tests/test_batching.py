@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Optional
+
+from eventstoredb.client.batching import iterate_batches
+
+
+async def numbers(count: int, delays: Optional[dict[int, float]] = None) -> AsyncIterator[int]:
+    for i in range(count):
+        if delays and i in delays:
+            await asyncio.sleep(delays[i])
+        yield i
+
+
+async def test_iterate_batches_by_size() -> None:
+    batches = [b async for b in iterate_batches(numbers(5), convert=str, batch_size=2)]
+
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+async def test_iterate_batches_by_size_with_max_wait() -> None:
+    batches = [
+        b async for b in iterate_batches(numbers(5), convert=str, batch_size=2, max_wait=1000)
+    ]
+
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+async def test_iterate_batches_cut_short_by_max_wait() -> None:
+    responses = numbers(4, delays={2: 0.2})
+
+    batches = [b async for b in iterate_batches(responses, convert=str, batch_size=10, max_wait=50)]
+
+    assert batches == [["0", "1"], ["2", "3"]]
+
+
+async def test_iterate_batches_empty() -> None:
+    assert [b async for b in iterate_batches(numbers(0), convert=str, batch_size=2)] == []
@@ -0,0 +1,80 @@
+from uuid import uuid4
+
+from eventstoredb.client.cache import (
+    EVENT_SIZE_OVERHEAD,
+    CachedStream,
+    LRUCache,
+    StreamEventCache,
+    StreamRevisionCache,
+)
+from eventstoredb.events import BinaryRecordedEvent, ContentType, ReadEvent
+from eventstoredb.types import AllPosition, StreamPosition
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_stream_revision_cache_never_goes_backwards() -> None:
+    cache = StreamRevisionCache(max_size=10)
+    cache.update("test-stream", 5)
+    cache.update("test-stream", 3)
+    assert cache.get("test-stream") == 5
+
+    cache.update("test-stream", 7)
+    assert cache.get("test-stream") == 7
+
+
+def create_read_event(revision: int, data: bytes = b"") -> ReadEvent:
+    return ReadEvent(
+        event=BinaryRecordedEvent(
+            stream_name="test-stream",
+            id=uuid4(),
+            type="test",
+            content_type=ContentType.BINARY,
+            revision=revision,
+            created=0,
+            position=AllPosition(revision, revision),
+            data=data or None,
+            metadata=None,
+        ),
+    )
+
+
+def test_cached_stream_index() -> None:
+    cached = CachedStream(metadata_revision=None)
+    for revision in range(3, 6):
+        cached.append(create_read_event(revision))
+
+    assert cached.index(StreamPosition.START) == 0
+    assert cached.index(4) == 1
+    assert cached.index(6) == 3
+    assert cached.index(2) is None
+    assert cached.index(7) is None
+    assert cached.next_revision == 6
+
+
+def test_stream_event_cache_evicts_by_size() -> None:
+    cache = StreamEventCache(max_size=2 * EVENT_SIZE_OVERHEAD + 200)
+    for stream_name in ("a", "b", "c"):
+        cached = CachedStream(metadata_revision=None)
+        cached.append(create_read_event(0, data=b"x" * 100))
+        cache.put(stream_name, cached)
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+    assert cache.size == 2 * EVENT_SIZE_OVERHEAD + 200
+
+    cache.pop("b")
+    assert cache.size == EVENT_SIZE_OVERHEAD + 100
@@ -0,0 +1,184 @@
+import os
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.client.append_to_stream.grpc import compress_event_data
+from eventstoredb.client.decoder import decode_read_response
+from eventstoredb.client.read_stream.grpc import convert_read_response_recorded_event
+from eventstoredb.compression import (
+    CodecNotFoundError,
+    CompressionOptions,
+    compress_payload,
+    decompress_payload,
+    is_compressed_payload,
+)
+from eventstoredb.events import (
+    BinaryEvent,
+    BinaryRecordedEvent,
+    CompressedBinaryRecordedEvent,
+    JsonEvent,
+    ReadEvent,
+)
+from eventstoredb.generated.event_store.client import StreamIdentifier, Uuid
+from eventstoredb.generated.event_store.client.streams import (
+    ReadResp,
+    ReadRespReadEvent,
+    ReadRespReadEventRecordedEvent,
+)
+from eventstoredb.options import ClientOptions
+from eventstoredb.serializers import DEFAULT_SERIALIZER
+
+PAYLOAD = b"compressible payload " * 1000
+
+
+def create_recorded_event_message(data: bytes) -> ReadRespReadEventRecordedEvent:
+    return ReadRespReadEventRecordedEvent(
+        id=Uuid(string=str(uuid4())),
+        stream_identifier=StreamIdentifier(b"test-stream"),
+        metadata={
+            "type": "TestEvent",
+            "content-type": "application/octet-stream",
+            "created": "0",
+        },
+        data=data,
+    )
+
+
+@pytest.mark.parametrize(
+    ("codec", "module"),
+    [("zlib", None), ("zstd", "zstandard"), ("lz4", "lz4")],
+)
+def test_compress_payload_roundtrip(codec: str, module: Optional[str]) -> None:
+    if module is not None:
+        pytest.importorskip(module)
+
+    compressed = compress_payload(PAYLOAD, CompressionOptions(codec=codec))
+
+    assert compressed is not None
+    assert is_compressed_payload(compressed)
+    assert len(compressed) < len(PAYLOAD)
+    assert decompress_payload(compressed) == PAYLOAD
+
+
+def test_compress_payload_below_min_size() -> None:
+    assert compress_payload(b"x" * 100, CompressionOptions(min_size=1024)) is None
+
+
+def test_compress_payload_incompressible() -> None:
+    assert compress_payload(os.urandom(2048), CompressionOptions(min_size=0)) is None
+
+
+def test_compress_payload_codec_not_registered() -> None:
+    with pytest.raises(CodecNotFoundError):
+        compress_payload(PAYLOAD, CompressionOptions(codec="does-not-exist"))
+
+
+def test_compress_event_data_only_compresses_binary_events() -> None:
+    options = CompressionOptions()
+    binary_event = BinaryEvent(type="TestEvent", data=PAYLOAD)
+    json_event = JsonEvent(type="TestEvent", data=b'"' + PAYLOAD + b'"')
+
+    compressed = compress_event_data(binary_event, options)
+
+    assert compressed.id == binary_event.id
+    assert is_compressed_payload(compressed.data or b"")
+    assert compress_event_data(json_event, options) is json_event
+
+
+def test_convert_compressed_recorded_event_decompresses_lazily() -> None:
+    compressed = compress_payload(PAYLOAD, CompressionOptions())
+    assert compressed is not None
+
+    event = convert_read_response_recorded_event(
+        create_recorded_event_message(compressed),
+        decompress=True,
+    )
+
+    assert isinstance(event, CompressedBinaryRecordedEvent)
+    assert event._decompressed is False
+    assert event.data == PAYLOAD
+    assert event._decompressed is True
+
+
+def test_convert_uncompressed_recorded_event() -> None:
+    event = convert_read_response_recorded_event(
+        create_recorded_event_message(PAYLOAD),
+        decompress=True,
+    )
+
+    assert type(event) is BinaryRecordedEvent
+    assert event.data == PAYLOAD
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_convert_recorded_event_only_decompresses_when_enabled(lazy: bool) -> None:
+    # an uncompressed payload can start with the frame magic by chance
+    compressed = compress_payload(PAYLOAD, CompressionOptions())
+    assert compressed is not None
+    message = create_recorded_event_message(compressed)
+
+    event = convert_read_response_recorded_event(message, lazy=lazy)
+    decompressed = convert_read_response_recorded_event(message, lazy=lazy, decompress=True)
+
+    assert event.data == compressed
+    assert decompressed.data == PAYLOAD
+
+
+def test_decode_read_response_only_decompresses_when_enabled() -> None:
+    compressed = compress_payload(PAYLOAD, CompressionOptions())
+    assert compressed is not None
+    data = bytes(
+        ReadResp(event=ReadRespReadEvent(event=create_recorded_event_message(compressed))),
+    )
+
+    event = decode_read_response(data, DEFAULT_SERIALIZER)
+    decompressed = decode_read_response(data, DEFAULT_SERIALIZER, decompress=True)
+
+    assert isinstance(event, ReadEvent)
+    assert event.event is not None
+    assert event.event.data == compressed
+    assert isinstance(decompressed, ReadEvent)
+    assert decompressed.event is not None
+    assert decompressed.event.data == PAYLOAD
+
+
+async def test_append_compressed_read_compressed(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(
+            host=eventstoredb_host,
+            port=eventstoredb_port,
+            compression=CompressionOptions(),
+        ),
+    )
+    await client.append_to_stream(
+        stream_name=stream_name,
+        events=[BinaryEvent(type="Test1", data=PAYLOAD), BinaryEvent(type="Test2", data=b"small")],
+    )
+
+    events = [
+        e.event
+        async for e in client.read_stream(stream_name)
+        if isinstance(e, ReadEvent) and e.event
+    ]
+
+    assert [type(e) for e in events] == [CompressedBinaryRecordedEvent, BinaryRecordedEvent]
+    assert [e.data for e in events] == [PAYLOAD, b"small"]
+
+    # clients without compression leave the payloads as they are
+    other_client = Client(ClientOptions(host=eventstoredb_host, port=eventstoredb_port))
+    events = [
+        e.event
+        async for e in other_client.read_stream(stream_name)
+        if isinstance(e, ReadEvent) and e.event
+    ]
+
+    assert [type(e) for e in events] == [BinaryRecordedEvent, BinaryRecordedEvent]
+    assert is_compressed_payload(events[0].data or b"")
+    assert events[1].data == b"small"
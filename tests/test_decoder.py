@@ -0,0 +1,210 @@
+import json
+import random
+from typing import Any, Callable, Union
+from uuid import UUID
+
+from eventstoredb.client.decoder import (
+    clear_payloads,
+    decode_persistent_subscription_read_response,
+    decode_read_response,
+)
+from eventstoredb.client.subscribe_to_all.grpc import convert_subscribe_to_all_response
+from eventstoredb.client.subscribe_to_persistent_subscription_to_stream.grpc import (
+    convert_read_response as convert_persistent_subscription_read_response,
+)
+from eventstoredb.compression import CompressionOptions, compress_payload
+from eventstoredb.events import ContentType, ReadEvent
+from eventstoredb.generated.event_store.client import (
+    AllStreamPosition,
+    Empty,
+    StreamIdentifier,
+    Uuid,
+    UuidStructured,
+    persistent_subscriptions,
+    streams,
+)
+from eventstoredb.serializers import DEFAULT_SERIALIZER
+from eventstoredb.utils import uuid_to_message
+
+FUZZ_ITERATIONS = 2000
+
+# field 99 as varint and field 100 as fixed64, neither exists in the schema
+UNKNOWN_FIELDS = b"\x98\x06\x01\xa1\x06" + bytes(8)
+
+RecordedEventMessage = Union[
+    streams.ReadRespReadEventRecordedEvent,
+    persistent_subscriptions.ReadRespReadEventRecordedEvent,
+]
+
+
+def random_payload(rng: random.Random, content_type: ContentType) -> bytes:
+    kind = rng.randrange(4)
+    if kind == 0:
+        return b""
+    if content_type == ContentType.JSON:
+        return json.dumps({"value": rng.random(), "text": "ü" * rng.randrange(10)}).encode()
+    if kind == 1:
+        payload = compress_payload(b"x" * 100, CompressionOptions(min_size=0))
+        assert payload is not None
+        return payload
+    return rng.randbytes(rng.randrange(1, 300))
+
+
+def random_recorded_event(
+    rng: random.Random,
+    message_type: Callable[..., RecordedEventMessage],
+) -> RecordedEventMessage:
+    content_type = rng.choice(list(ContentType))
+    metadata = {
+        "type": rng.choice(["", "Created", "ümlaut-event", "$>"]),
+        "content-type": content_type.value,
+        "created": str(rng.getrandbits(60)),
+    }
+    if rng.random() < 0.2:
+        metadata["extra"] = "ignored"
+    event_id = UUID(int=rng.getrandbits(128))
+    message = message_type(
+        id=uuid_to_message(event_id, structured=rng.random() < 0.5),
+        stream_identifier=StreamIdentifier(rng.choice(["", "stream", "ström-1"]).encode()),
+        stream_revision=rng.getrandbits(rng.choice([0, 7, 32, 64])),
+        prepare_position=rng.getrandbits(rng.choice([0, 14, 64])),
+        commit_position=rng.getrandbits(rng.choice([0, 14, 64])),
+        metadata=metadata,
+        custom_metadata=rng.choice([b"", b'{"correlation-id": "1"}']),
+        data=random_payload(rng, content_type),
+    )
+    if rng.random() < 0.2:
+        message._unknown_fields = UNKNOWN_FIELDS
+    return message
+
+
+def random_read_response(rng: random.Random) -> streams.ReadResp:
+    content = rng.randrange(9)
+    if content == 0:
+        return streams.ReadResp(confirmation=streams.ReadRespSubscriptionConfirmation("sub-1"))
+    if content == 1:
+        return streams.ReadResp(
+            checkpoint=streams.ReadRespCheckpoint(rng.getrandbits(64), rng.getrandbits(64)),
+        )
+    if content == 2:
+        return streams.ReadResp(caught_up=streams.ReadRespCaughtUp())
+    if content == 3:
+        return streams.ReadResp(fell_behind=streams.ReadRespFellBehind())
+    if content == 4:
+        return streams.ReadResp(
+            stream_not_found=streams.ReadRespStreamNotFound(StreamIdentifier(b"missing")),
+        )
+    if content == 5:
+        return streams.ReadResp(last_all_stream_position=AllStreamPosition(1, 2))
+
+    read_event = streams.ReadRespReadEvent(
+        event=random_recorded_event(rng, streams.ReadRespReadEventRecordedEvent),
+    )
+    if rng.random() < 0.3:
+        read_event.link = random_recorded_event(rng, streams.ReadRespReadEventRecordedEvent)
+    if rng.random() < 0.5:
+        read_event.commit_position = rng.getrandbits(64)
+    else:
+        read_event.no_position = Empty()
+    return streams.ReadResp(event=read_event)
+
+
+def random_persistent_subscription_read_response(
+    rng: random.Random,
+) -> persistent_subscriptions.ReadResp:
+    if rng.random() < 0.1:
+        return persistent_subscriptions.ReadResp(
+            subscription_confirmation=persistent_subscriptions.ReadRespSubscriptionConfirmation(
+                "sub-1",
+            ),
+        )
+
+    read_event = persistent_subscriptions.ReadRespReadEvent(
+        event=random_recorded_event(rng, persistent_subscriptions.ReadRespReadEventRecordedEvent),
+    )
+    if rng.random() < 0.3:
+        read_event.link = random_recorded_event(
+            rng,
+            persistent_subscriptions.ReadRespReadEventRecordedEvent,
+        )
+    if rng.random() < 0.5:
+        read_event.commit_position = rng.getrandbits(64)
+    else:
+        read_event.no_position = Empty()
+    if rng.random() < 0.5:
+        read_event.retry_count = rng.randint(-(2**31), 2**31 - 1)
+    else:
+        read_event.no_retry_count = Empty()
+    return persistent_subscriptions.ReadResp(event=read_event)
+
+
+def outcome(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:  # noqa: BLE001
+        return type(e), e.args
+
+
+def test_decode_read_response_matches_betterproto() -> None:
+    rng = random.Random(42)
+    for _ in range(FUZZ_ITERATIONS):
+        data = bytes(random_read_response(rng))
+        expected = outcome(
+            convert_subscribe_to_all_response,
+            streams.ReadResp().parse(data),
+            serializer=DEFAULT_SERIALIZER,
+        )
+        assert outcome(decode_read_response, data, DEFAULT_SERIALIZER) == expected
+        assert outcome(decode_read_response, memoryview(data), DEFAULT_SERIALIZER) == expected
+
+
+def test_decode_read_response_headers_only_matches_betterproto() -> None:
+    rng = random.Random(42)
+    for _ in range(FUZZ_ITERATIONS):
+        data = bytes(random_read_response(rng))
+        message = streams.ReadResp().parse(data)
+        clear_payloads(message)
+        expected = outcome(
+            convert_subscribe_to_all_response,
+            message,
+            serializer=DEFAULT_SERIALIZER,
+        )
+        assert outcome(decode_read_response, data, DEFAULT_SERIALIZER, headers_only=True) == (
+            expected
+        )
+
+
+def test_decode_persistent_subscription_read_response_matches_betterproto() -> None:
+    rng = random.Random(42)
+    for _ in range(FUZZ_ITERATIONS):
+        data = bytes(random_persistent_subscription_read_response(rng))
+        expected = outcome(
+            convert_persistent_subscription_read_response,
+            persistent_subscriptions.ReadResp().parse(data),
+            serializer=DEFAULT_SERIALIZER,
+        )
+        assert outcome(decode_persistent_subscription_read_response, data, DEFAULT_SERIALIZER) == (
+            expected
+        )
+
+
+def test_decode_read_response_last_content_wins() -> None:
+    data = bytes(streams.ReadResp(caught_up=streams.ReadRespCaughtUp())) + bytes(
+        streams.ReadResp(fell_behind=streams.ReadRespFellBehind()),
+    )
+    assert decode_read_response(data, DEFAULT_SERIALIZER) == convert_subscribe_to_all_response(
+        streams.ReadResp().parse(data),
+    )
+
+
+def test_decode_read_response_structured_uuid() -> None:
+    rng = random.Random(1)
+    message = random_recorded_event(rng, streams.ReadRespReadEventRecordedEvent)
+    message.id = Uuid(structured=UuidStructured(-1, 2))
+    data = bytes(streams.ReadResp(event=streams.ReadRespReadEvent(event=message)))
+
+    response = decode_read_response(data, DEFAULT_SERIALIZER)
+
+    assert isinstance(response, ReadEvent)
+    assert response.event is not None
+    assert response.event.id == UUID("ffffffff-ffff-ffff-0000-000000000002")
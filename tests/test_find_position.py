@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from eventstoredb import Client
+from eventstoredb.client.find_position.mixin import UNIX_EPOCH, to_ticks
+from eventstoredb.client.types import ClientOptions
+from eventstoredb.events import BinaryRecordedEvent, ContentType, JsonEvent, ReadEvent
+from eventstoredb.options import ReadAllOptions, ReadDirection
+from eventstoredb.types import AllPosition
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from eventstoredb.events import CaughtUp, FellBehind
+
+
+def create_read_event(position: AllPosition, created: int) -> ReadEvent:
+    return ReadEvent(
+        event=BinaryRecordedEvent(
+            stream_name="test",
+            id=uuid4(),
+            type="test",
+            content_type=ContentType.BINARY,
+            revision=0,
+            created=created,
+            position=position,
+            data=None,
+            metadata=None,
+        ),
+    )
+
+
+class FakeClient(Client):
+    def __init__(self, options: ClientOptions, events: list[ReadEvent]) -> None:
+        super().__init__(options)
+        self.events = events
+        self.reads = 0
+
+    async def read_all(
+        self,
+        options: ReadAllOptions | None = None,
+    ) -> AsyncIterator[ReadEvent | CaughtUp | FellBehind]:
+        assert options is not None
+        self.reads += 1
+        events = self.events
+        if options.direction == ReadDirection.BACKWARDS:
+            events = events[::-1]
+        elif isinstance(options.from_position, AllPosition):
+            key = (options.from_position.commit_position, options.from_position.prepare_position)
+            events = [
+                e
+                for e in events
+                if e.event
+                and (e.event.position.commit_position, e.event.position.prepare_position) >= key
+            ]
+        for event in events[: options.max_count]:
+            yield event
+
+
+def test_to_ticks() -> None:
+    assert to_ticks(UNIX_EPOCH) == 0
+    assert to_ticks(UNIX_EPOCH + timedelta(seconds=1, microseconds=1)) == 10_000_010
+    assert to_ticks(datetime(1970, 1, 1, 1)) == to_ticks(  # noqa: DTZ001
+        datetime(1970, 1, 1, 2, tzinfo=timezone(timedelta(hours=1))),
+    )
+
+
+async def test_find_position_at() -> None:
+    # every commit holds two events, their created increases by 10 microseconds per event
+    events = [
+        create_read_event(AllPosition(1000 * (i // 2), 1000 * (i // 2) + i % 2), 100 * i)
+        for i in range(1000)
+    ]
+    client = FakeClient(ClientOptions(host="localhost"), events)
+
+    for i in (0, 1, 2, 333, 998, 999):
+        for microseconds in (10 * i, 10 * i - 5):
+            timestamp = UNIX_EPOCH + timedelta(microseconds=microseconds)
+            event = events[i].event
+            assert event is not None
+            assert await client.find_position_at(timestamp) == event.position
+
+    assert await client.find_position_at(UNIX_EPOCH - timedelta(days=1)) == AllPosition(0, 0)
+    assert await client.find_position_at(UNIX_EPOCH + timedelta(days=1)) is None
+
+
+async def test_find_position_at_probes_are_logarithmic_and_cached() -> None:
+    events = [create_read_event(AllPosition(100 * i, 100 * i), i) for i in range(100_000)]
+    client = FakeClient(ClientOptions(host="localhost", position_cache_size=1000), events)
+    timestamp = UNIX_EPOCH + timedelta(microseconds=5_432)
+
+    position = await client.find_position_at(timestamp)
+
+    assert position == AllPosition(5_432_000, 5_432_000)
+    assert client.reads < 40
+
+    client.reads = 0
+    assert await client.find_position_at(timestamp) == position
+    assert client.reads == 0
+
+
+async def test_find_position_at_is_not_cached_by_default() -> None:
+    events = [create_read_event(AllPosition(100 * i, 100 * i), i) for i in range(1_000)]
+    client = FakeClient(ClientOptions(host="localhost"), events)
+    timestamp = UNIX_EPOCH + timedelta(microseconds=432)
+
+    position = await client.find_position_at(timestamp)
+
+    client.reads = 0
+    assert await client.find_position_at(timestamp) == position
+    assert client.reads > 0
+
+
+async def test_find_position_at_read_all(eventstoredb_client: Client, stream_name: str) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_find_position_at") for _ in range(5)],
+    )
+    events = [
+        e.event
+        async for e in eventstoredb_client.read_stream(stream_name)
+        if isinstance(e, ReadEvent) and e.event
+    ]
+    target = events[2]
+    timestamp = UNIX_EPOCH + timedelta(microseconds=target.created // 10)
+
+    position = await eventstoredb_client.find_position_at(timestamp)
+
+    assert position is not None
+    read = [
+        e.event
+        async for e in eventstoredb_client.read_all(ReadAllOptions(from_position=position))
+        if isinstance(e, ReadEvent) and e.event and e.event.stream_name == stream_name
+    ]
+    assert target.id in [e.id for e in read]
+    assert all(e.created >= target.created - 10 for e in read)
+    assert await eventstoredb_client.find_position_at(timestamp) == position
@@ -0,0 +1,99 @@
+import io
+import json
+from uuid import UUID
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.tools.import_ndjson import (
+    RecordMalformedError,
+    group_records,
+    import_ndjson,
+    parse_record,
+    read_records,
+)
+
+from .utils import EventstoreHTTP as HTTPClient  # noqa: TID252
+
+
+def test_parse_record() -> None:
+    stream_name, event = parse_record(
+        json.dumps(
+            {
+                "stream": "test-stream",
+                "type": "TestEvent",
+                "id": "7d8d3e2e-1a5c-4c36-9d0e-2f2f1f0c3a1b",
+                "data": {"hello": "world"},
+                "metadata": {"source": "import"},
+            },
+        ),
+    )
+
+    assert stream_name == "test-stream"
+    assert event.type == "TestEvent"
+    assert event.id == UUID("7d8d3e2e-1a5c-4c36-9d0e-2f2f1f0c3a1b")
+    assert json.loads(event.data or b"") == {"hello": "world"}
+    assert json.loads(event.metadata or b"") == {"source": "import"}
+
+
+def test_parse_record_without_data() -> None:
+    _, event = parse_record('{"stream": "test-stream", "type": "TestEvent"}')
+
+    assert event.data is None
+    assert event.metadata is None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        "[]",
+        '{"type": "TestEvent"}',
+        '{"stream": "a", "type": "TestEvent", "id": "not-a-uuid"}',
+        '{"stream": "a", "type": "TestEvent", "id": 42}',
+    ],
+)
+def test_parse_record_malformed(line: str) -> None:
+    with pytest.raises(RecordMalformedError) as execinfo:
+        parse_record(line, line_number=3)
+
+    assert execinfo.value.line_number == 3
+
+
+def test_group_records() -> None:
+    file = io.StringIO(
+        "\n".join(
+            json.dumps({"stream": stream_name, "type": "TestEvent"})
+            for stream_name in ["a", "a", "a", "b", "a", "a"]
+        )
+        + "\n\n",
+    )
+
+    batches = list(group_records(read_records(file), max_batch_size=2))
+
+    assert [(stream_name, len(events)) for stream_name, events in batches] == [
+        ("a", 2),
+        ("a", 1),
+        ("b", 1),
+        ("a", 2),
+    ]
+
+
+async def test_import_ndjson(
+    eventstoredb_client: Client,
+    eventstoredb_httpclient: HTTPClient,
+    stream_name: str,
+) -> None:
+    other_stream_name = f"{stream_name}-other"
+    file = io.StringIO(
+        "\n".join(
+            json.dumps({"stream": name, "type": f"Test{i}", "data": {"i": i}})
+            for i, name in enumerate([stream_name, other_stream_name] * 5)
+        ),
+    )
+
+    importer = await import_ndjson(eventstoredb_client, file, max_in_flight=2, max_batch_size=1)
+
+    assert importer.imported == 10
+    http_events = eventstoredb_httpclient.read_stream(stream_name)
+    assert [e["eventType"] for e in http_events] == [f"Test{i}" for i in range(0, 10, 2)]
@@ -0,0 +1,81 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.client.prefetch import iterate_prefetched
+from eventstoredb.events import JsonEvent, ReadEvent
+from eventstoredb.options import ReadStreamOptions
+
+
+async def test_iterate_prefetched_keeps_order() -> None:
+    async def responses() -> AsyncIterator[int]:
+        for i in range(10):
+            yield i
+
+    assert [r async for r in iterate_prefetched(responses(), size=3)] == list(range(10))
+
+
+async def test_iterate_prefetched_is_bounded() -> None:
+    received: list[int] = []
+
+    async def responses() -> AsyncIterator[int]:
+        for i in range(10):
+            received.append(i)
+            yield i
+
+    prefetched = iterate_prefetched(responses(), size=3)
+    assert await prefetched.__anext__() == 0
+    await asyncio.sleep(0.01)
+
+    # one response is held by the receiving task while it waits for room in the buffer
+    assert len(received) == 5
+    await prefetched.aclose()
+
+
+async def test_iterate_prefetched_raises_after_received_responses() -> None:
+    async def responses() -> AsyncIterator[int]:
+        yield 1
+        raise ValueError("failed")
+
+    prefetched = iterate_prefetched(responses(), size=3)
+    assert await prefetched.__anext__() == 1
+    with pytest.raises(ValueError, match="failed"):
+        await prefetched.__anext__()
+
+
+async def test_iterate_prefetched_closes_responses() -> None:
+    closed = asyncio.Event()
+
+    async def responses() -> AsyncIterator[int]:
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed.set()
+
+    prefetched = iterate_prefetched(responses(), size=1)
+    assert await prefetched.__anext__() == 0
+    await prefetched.aclose()
+
+    assert closed.is_set()
+
+
+async def test_read_stream_prefetch(eventstoredb_client: Client, stream_name: str) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type=f"Test{i}") for i in range(10)],
+    )
+
+    events = [
+        e
+        async for e in eventstoredb_client.read_stream(
+            stream_name=stream_name,
+            options=ReadStreamOptions(prefetch=4),
+        )
+    ]
+
+    assert [e.event.type for e in events if isinstance(e, ReadEvent) and e.event] == [
+        f"Test{i}" for i in range(10)
+    ]
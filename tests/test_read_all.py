@@ -8,7 +8,12 @@ from eventstoredb.filters import (
     ExcludeSystemEventsFilter,
     StreamNameFilter,
 )
-from eventstoredb.options import ReadAllOptions, ReadDirection, StreamPosition
+from eventstoredb.options import (
+    ReadAllBatchesOptions,
+    ReadAllOptions,
+    ReadDirection,
+    StreamPosition,
+)
 
 
 async def test_read_all(eventstoredb_client: Client) -> None:
@@ -393,3 +398,18 @@ async def test_read_all_filter_by_stream_name_prefix(
     assert isinstance(event, RecordedEvent)
     assert event.stream_name == stream_name_2
     assert event.type == "Test"
+
+
+async def test_read_all_batches(eventstoredb_client: Client) -> None:
+    stream_name = f"Test-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_read_all_batches_Test") for _ in range(3)],
+    )
+
+    it = eventstoredb_client.read_all_batches(options=ReadAllBatchesOptions(batch_size=10))
+    batches = [b async for b in it]
+
+    assert all(0 < len(b) <= 10 for b in batches)
+    events = [e.event for b in batches for e in b if isinstance(e, ReadEvent) and e.event]
+    assert len([e for e in events if e.stream_name == stream_name]) == 3
@@ -0,0 +1,141 @@
+from collections.abc import AsyncIterator
+from typing import Optional, Union
+from uuid import uuid4
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+
+from eventstoredb import Client
+from eventstoredb.client.read_paged.mixin import PagedReader, is_transient_error
+from eventstoredb.events import (
+    CaughtUp,
+    ContentType,
+    FellBehind,
+    JsonEvent,
+    JsonRecordedEvent,
+    ReadEvent,
+)
+from eventstoredb.filters import StreamNameFilter
+from eventstoredb.options import (
+    ClientOptions,
+    ReadAllPagedOptions,
+    ReadDirection,
+    ReadStreamOptions,
+    ReadStreamPagedOptions,
+)
+from eventstoredb.types import AllPosition
+
+
+def test_is_transient_error() -> None:
+    assert is_transient_error(GRPCError(Status.UNAVAILABLE))
+    assert is_transient_error(StreamTerminatedError())
+    assert is_transient_error(ConnectionResetError())
+    assert not is_transient_error(GRPCError(Status.PERMISSION_DENIED))
+    assert not is_transient_error(ValueError())
+
+
+def test_paged_reader_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        PagedReader(ReadStreamPagedOptions())  # type: ignore[abstract]
+
+
+class EndlessStreamClient(Client):
+    # serves an endless stream and counts the reads that are still open
+    def __init__(self) -> None:
+        super().__init__(ClientOptions(host="localhost"))
+        self.open_reads = 0
+
+    async def read_stream(
+        self,
+        stream_name: str,
+        options: Optional[ReadStreamOptions] = None,
+    ) -> AsyncIterator[Union[ReadEvent, CaughtUp, FellBehind]]:
+        assert options is not None
+        assert isinstance(options.from_revision, int)
+        self.open_reads += 1
+        try:
+            for revision in range(options.from_revision, options.from_revision + options.max_count):
+                yield ReadEvent(
+                    event=JsonRecordedEvent(
+                        stream_name=stream_name,
+                        id=uuid4(),
+                        type="Test",
+                        content_type=ContentType.JSON,
+                        revision=revision,
+                        created=0,
+                        position=AllPosition(revision, revision),
+                        data=None,
+                        metadata=None,
+                    ),
+                )
+        finally:
+            self.open_reads -= 1
+
+
+async def test_read_stream_paged_aclose_closes_the_read() -> None:
+    client = EndlessStreamClient()
+
+    async with client.read_stream_paged("test", ReadStreamPagedOptions(from_revision=0)) as reader:
+        async for _ in reader:
+            assert client.open_reads == 1
+            break
+
+    assert client.open_reads == 0
+    assert reader.cursor == 1
+    assert not reader.done
+    assert [e async for e in reader] == []
+
+
+async def test_read_stream_paged(eventstoredb_client: Client, stream_name: str) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_read_stream_paged") for _ in range(10)],
+    )
+
+    reader = eventstoredb_client.read_stream_paged(
+        stream_name,
+        ReadStreamPagedOptions(page_size=3),
+    )
+    events = [e async for e in reader]
+
+    assert [e.event.revision for e in events if e.event] == list(range(10))
+    assert reader.cursor == 10
+
+
+async def test_read_stream_paged_backwards(eventstoredb_client: Client, stream_name: str) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_read_stream_paged") for _ in range(5)],
+    )
+
+    reader = eventstoredb_client.read_stream_paged(
+        stream_name,
+        ReadStreamPagedOptions(page_size=2, from_revision=4, direction=ReadDirection.BACKWARDS),
+    )
+
+    assert [e.event.revision async for e in reader if e.event] == [4, 3, 2, 1, 0]
+
+
+async def test_read_all_paged_resumes_from_cursor(eventstoredb_client: Client) -> None:
+    stream_name = f"ReadAllPaged-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_read_all_paged") for _ in range(10)],
+    )
+    options = ReadAllPagedOptions(page_size=3, filter=StreamNameFilter(prefix=[stream_name]))
+
+    reader = eventstoredb_client.read_all_paged(options)
+    revisions = []
+    async for event in reader:
+        assert event.event is not None
+        revisions.append(event.event.revision)
+        if len(revisions) == 4:
+            break
+
+    options.after_position = reader.cursor
+    revisions += [
+        e.event.revision async for e in eventstoredb_client.read_all_paged(options) if e.event
+    ]
+
+    assert revisions == list(range(10))
@@ -1,13 +1,37 @@
+import asyncio
+import dataclasses
 import json
 import uuid
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
 
 import pytest
 
 from eventstoredb import Client
-from eventstoredb.events import JsonEvent, JsonRecordedEvent, ReadEvent, RecordedEvent
+from eventstoredb.client.read_stream.grpc import convert_read_response_recorded_event
+from eventstoredb.events import (
+    BinaryEvent,
+    CaughtUp,
+    ContentType,
+    FellBehind,
+    JsonEvent,
+    JsonRecordedEvent,
+    LazyBinaryRecordedEvent,
+    LazyJsonRecordedEvent,
+    ReadEvent,
+    RecordedEvent,
+)
 from eventstoredb.exceptions import StreamNotFoundError
-from eventstoredb.options import ReadDirection, ReadStreamOptions, StreamPosition
+from eventstoredb.generated.event_store.client import StreamIdentifier, Uuid
+from eventstoredb.generated.event_store.client.streams import ReadRespReadEventRecordedEvent
+from eventstoredb.options import (
+    ClientOptions,
+    ReadDirection,
+    ReadStreamBatchesOptions,
+    ReadStreamOptions,
+    StreamPosition,
+)
+from eventstoredb.types import AllPosition, StreamRevision
 
 from .utils import json_test_events  # noqa: TID252
 
@@ -32,6 +56,241 @@ def test_recorded_event_type_no_event() -> None:
     assert recorded_event_type(ReadEvent()) == "Foo"
 
 
+def test_convert_lazy_recorded_event() -> None:
+    message = ReadRespReadEventRecordedEvent(
+        id=Uuid(string=str(uuid.uuid4())),
+        stream_identifier=StreamIdentifier(b"test-stream"),
+        stream_revision=3,
+        prepare_position=10,
+        commit_position=11,
+        metadata={"type": "TestEvent", "content-type": "application/json", "created": "42"},
+        data=b'{"some": "data"}',
+    )
+
+    event = convert_read_response_recorded_event(message, lazy=True)
+
+    assert isinstance(event, LazyJsonRecordedEvent)
+    assert not hasattr(event, "_stream_name")
+    assert event.type == "TestEvent"
+    assert not hasattr(event, "_stream_name")
+
+    eager_event = convert_read_response_recorded_event(message)
+    assert [getattr(event, f) for f in RecordedEvent.__dataclass_fields__] == [
+        getattr(eager_event, f) for f in RecordedEvent.__dataclass_fields__
+    ]
+    assert event.json() == {"some": "data"}
+
+
+def test_lazy_recorded_event_behaves_like_eager_event() -> None:
+    message = ReadRespReadEventRecordedEvent(
+        id=Uuid(string=str(uuid.uuid4())),
+        stream_identifier=StreamIdentifier(b"test-stream"),
+        stream_revision=3,
+        metadata={"type": "TestEvent", "content-type": "application/json", "created": "42"},
+        data=b'{"some": "data"}',
+    )
+    event = convert_read_response_recorded_event(message, lazy=True)
+    eager_event = convert_read_response_recorded_event(message)
+
+    assert event == eager_event
+    assert eager_event == event
+    assert hash(event) == hash(eager_event)
+    assert event != dataclasses.replace(eager_event, revision=4)
+    assert event == convert_read_response_recorded_event(message, lazy=True)
+
+    replaced = dataclasses.replace(event, revision=4)
+    assert isinstance(replaced, LazyJsonRecordedEvent)
+    assert replaced.revision == 4
+    assert replaced.id == eager_event.id
+    assert replaced.json() == {"some": "data"}
+    assert replaced == dataclasses.replace(eager_event, revision=4)
+
+
+async def test_read_stream_structured_uuids(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, structured_uuids=True),
+    )
+    event = JsonEvent(type="Test1", data=b"{}")
+    await client.append_to_stream(stream_name=stream_name, events=event)
+
+    events = [e async for e in client.read_stream(stream_name=stream_name)]
+
+    assert isinstance(events[0], ReadEvent)
+    assert events[0].event is not None
+    assert events[0].event.id == event.id
+
+
+async def test_read_stream_fast_decoder(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, fast_decoder=True),
+    )
+    await client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="Test1", data=b"{}"), BinaryEvent(type="Test2", data=b"bin")],
+    )
+
+    events = [e async for e in client.read_stream(stream_name=stream_name)]
+
+    assert [recorded_event_type(e) for e in events] == ["Test1", "Test2"]
+    assert isinstance(events[0], ReadEvent)
+    assert isinstance(events[0].event, JsonRecordedEvent)
+    assert events[0].event.json() == {}
+
+
+async def test_read_stream_read_cache(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, read_cache_size=2**20),
+    )
+    await client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="Test1"), JsonEvent(type="Test2")],
+    )
+    events = [e async for e in client.read_stream(stream_name=stream_name)]
+    assert client.read_cache is not None
+    assert stream_name in client.read_cache
+
+    await client.append_to_stream(stream_name=stream_name, events=JsonEvent(type="Test3"))
+    cached_events = [e async for e in client.read_stream(stream_name=stream_name)]
+
+    assert cached_events[:2] == events
+    assert [recorded_event_type(e) for e in cached_events] == ["Test1", "Test2", "Test3"]
+
+
+class InMemoryStreamClient(Client):
+    # serves one stream from memory, reads yield to the loop between events
+    def __init__(self, read_cache_size: int) -> None:
+        super().__init__(ClientOptions(host="localhost", read_cache_size=read_cache_size))
+        self.events: list[ReadEvent] = []
+
+    def add_events(self, count: int, size: int = 0) -> None:
+        for _ in range(count):
+            event = JsonRecordedEvent(
+                stream_name="test",
+                id=uuid.uuid4(),
+                type="Test",
+                content_type=ContentType.JSON,
+                revision=len(self.events),
+                created=0,
+                position=AllPosition(len(self.events), len(self.events)),
+                data=b"x" * size,
+                metadata=None,
+            )
+            self.events.append(ReadEvent(event=event))
+
+    async def _read_stream(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> AsyncIterator[Union[ReadEvent, CaughtUp, FellBehind]]:
+        start = 0 if options.from_revision == StreamPosition.START else options.from_revision
+        assert isinstance(start, int)
+        for event in self.events[start : start + options.max_count]:
+            await asyncio.sleep(0)
+            yield event
+
+    async def _read_metadata_revision(self, stream_name: str) -> Optional[StreamRevision]:
+        return None
+
+
+def event_revisions(events: list[Union[ReadEvent, CaughtUp, FellBehind]]) -> list[int]:
+    return [e.event.revision for e in events if isinstance(e, ReadEvent) and e.event]
+
+
+async def test_read_stream_read_cache_counts_tail_refreshes() -> None:
+    client = InMemoryStreamClient(read_cache_size=50_000)
+    client.add_events(1)
+    [e async for e in client.read_stream("test")]
+    cache = client.read_cache
+    assert cache is not None
+
+    for _ in range(3):
+        client.add_events(1, size=10_000)
+        [e async for e in client.read_stream("test")]
+        cached = cache.get("test")
+        assert cached is not None
+        assert cache.size == cached.size
+
+    client.add_events(4, size=10_000)
+    [e async for e in client.read_stream("test")]
+
+    assert cache.size <= cache.max_size
+    assert "test" not in cache
+
+
+async def test_read_stream_read_cache_concurrent_refreshes() -> None:
+    client = InMemoryStreamClient(read_cache_size=2**20)
+    client.add_events(2)
+    [e async for e in client.read_stream("test")]
+    client.add_events(1)
+
+    async def read(from_revision: Union[int, StreamPosition]) -> list[int]:
+        options = ReadStreamOptions(from_revision=from_revision)
+        return event_revisions([e async for e in client.read_stream("test", options)])
+
+    results = await asyncio.gather(read(StreamPosition.START), read(StreamPosition.START))
+
+    assert results == [[0, 1, 2], [0, 1, 2]]
+    assert await read(StreamPosition.START) == [0, 1, 2]
+    assert await read(2) == [2]
+
+
+async def test_read_stream_headers_only(eventstoredb_client: Client, stream_name: str) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=JsonEvent(type="Test1", data=b"{}", metadata=b"{}"),
+    )
+
+    events = [
+        e
+        async for e in eventstoredb_client.read_stream(
+            stream_name=stream_name,
+            options=ReadStreamOptions(headers_only=True),
+        )
+    ]
+
+    assert isinstance(events[0], ReadEvent)
+    assert events[0].event is not None
+    assert events[0].event.type == "Test1"
+    assert events[0].event.data is None
+    assert events[0].event.metadata is None
+
+
+async def test_read_stream_lazy_recorded_events(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    stream_name: str,
+) -> None:
+    client = Client(
+        ClientOptions(host=eventstoredb_host, port=eventstoredb_port, lazy_recorded_events=True),
+    )
+    await client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="Test1", data=b"{}"), BinaryEvent(type="Test2", data=b"bin")],
+    )
+
+    events = [e async for e in client.read_stream(stream_name=stream_name)]
+
+    assert [recorded_event_type(e) for e in events] == ["Test1", "Test2"]
+    assert isinstance(events[0], ReadEvent)
+    assert isinstance(events[0].event, LazyJsonRecordedEvent)
+    assert isinstance(events[1], ReadEvent)
+    assert isinstance(events[1].event, LazyBinaryRecordedEvent)
+    assert events[1].event.data == b"bin"
+    assert events[1].event.revision == 1
+
+
 async def test_read_stream_json(
     eventstoredb_client: Client,
     stream_name: str,
@@ -212,3 +471,28 @@ async def test_read_stream_stream_not_exist(
 @pytest.mark.skip(reason="test not implemented")
 async def test_read_stream_stream_deleted() -> None:
     pass
+
+
+async def test_read_stream_batches(
+    eventstoredb_client: Client,
+    stream_name: str,
+) -> None:
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=json_test_events(5),
+    )
+
+    it = eventstoredb_client.read_stream_batches(
+        stream_name=stream_name,
+        options=ReadStreamBatchesOptions(batch_size=2, max_wait=1000),
+    )
+    batches = [b async for b in it]
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [recorded_event_type(e) for b in batches for e in b] == [
+        "Test1",
+        "Test2",
+        "Test3",
+        "Test4",
+        "Test5",
+    ]
@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.client.exceptions import StreamNotFoundError
+from eventstoredb.client.read_streams.types import ReadStreamResult, ReadStreamsResult
+from eventstoredb.events import BinaryRecordedEvent, ContentType, JsonEvent, ReadEvent
+from eventstoredb.options import ReadDirection, ReadStreamsOptions
+from eventstoredb.types import AllPosition
+
+
+def create_read_event(stream_name: str, commit_position: int) -> ReadEvent:
+    return ReadEvent(
+        event=BinaryRecordedEvent(
+            stream_name=stream_name,
+            id=uuid4(),
+            type="test",
+            content_type=ContentType.BINARY,
+            revision=0,
+            created=0,
+            position=AllPosition(commit_position, commit_position),
+            data=None,
+            metadata=None,
+        ),
+    )
+
+
+def test_read_streams_result_interleaved() -> None:
+    events_1 = [create_read_event("stream-1", p) for p in (1, 4, 5)]
+    events_2 = [create_read_event("stream-2", p) for p in (2, 3, 6)]
+    result = ReadStreamsResult(
+        results=[
+            ReadStreamResult(stream_name="stream-1", events=events_1),
+            ReadStreamResult(stream_name="stream-2", events=events_2),
+            ReadStreamResult(stream_name="stream-3", error=StreamNotFoundError("stream-3")),
+        ],
+    )
+
+    assert [e.event.position.commit_position for e in result.interleaved() if e.event] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+    assert result["stream-2"].events == events_2
+    assert [r.stream_name for r in result.errors] == ["stream-3"]
+    with pytest.raises(KeyError):
+        result["stream-4"]
+
+
+def test_read_streams_result_interleaved_backwards() -> None:
+    result = ReadStreamsResult(
+        results=[
+            ReadStreamResult(
+                stream_name="stream-1",
+                events=[create_read_event("stream-1", p) for p in (5, 1)],
+            ),
+            ReadStreamResult(
+                stream_name="stream-2",
+                events=[create_read_event("stream-2", p) for p in (3, 2)],
+            ),
+        ],
+        direction=ReadDirection.BACKWARDS,
+    )
+
+    assert [e.event.position.commit_position for e in result.interleaved() if e.event] == [
+        5,
+        3,
+        2,
+        1,
+    ]
+
+
+async def test_read_streams(eventstoredb_client: Client) -> None:
+    stream_name_1 = f"ReadStreams-{uuid4()}"
+    stream_name_2 = f"ReadStreams-{uuid4()}"
+    stream_name_3 = f"ReadStreams-{uuid4()}"
+    for stream_name in (stream_name_1, stream_name_2, stream_name_1):
+        await eventstoredb_client.append_to_stream(
+            stream_name=stream_name,
+            events=[JsonEvent(type="test_read_streams")],
+        )
+
+    result = await eventstoredb_client.read_streams(
+        [stream_name_1, stream_name_2, stream_name_3],
+        ReadStreamsOptions(concurrency=2),
+    )
+
+    assert len(result[stream_name_1].events) == 2
+    assert len(result[stream_name_2].events) == 1
+    assert isinstance(result[stream_name_3].error, StreamNotFoundError)
+    assert [e.event.stream_name for e in result.interleaved() if e.event] == [
+        stream_name_1,
+        stream_name_2,
+        stream_name_1,
+    ]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from eventstoredb import Client
+from eventstoredb.client.resolve_links.mixin import coalesce_revisions, parse_link_target
+from eventstoredb.client.types import ClientOptions
+from eventstoredb.events import BinaryRecordedEvent, ContentType, JsonEvent, ReadEvent
+from eventstoredb.options import ReadStreamOptions
+from eventstoredb.types import AllPosition
+
+
+def create_recorded_event(
+    stream_name: str,
+    revision: int,
+    type: str = "test",  # noqa: A002
+    data: bytes | None = None,
+) -> BinaryRecordedEvent:
+    return BinaryRecordedEvent(
+        stream_name=stream_name,
+        id=uuid4(),
+        type=type,
+        content_type=ContentType.BINARY,
+        revision=revision,
+        created=0,
+        position=AllPosition(revision, revision),
+        data=data,
+        metadata=None,
+    )
+
+
+def create_link(target_stream_name: str, target_revision: int, revision: int = 0) -> ReadEvent:
+    return ReadEvent(
+        event=create_recorded_event(
+            "$ce-test",
+            revision,
+            type="$>",
+            data=f"{target_revision}@{target_stream_name}".encode(),
+        ),
+    )
+
+
+class FakeClient(Client):
+    def __init__(self, options: ClientOptions, streams: dict[str, int]) -> None:
+        super().__init__(options)
+        self.streams = streams
+        self.reads: list[tuple[str, ReadStreamOptions]] = []
+
+    async def _read_events_list(
+        self,
+        stream_name: str,
+        options: ReadStreamOptions,
+    ) -> list[ReadEvent]:
+        self.reads.append((stream_name, options))
+        assert isinstance(options.from_revision, int)
+        end = min(options.from_revision + options.max_count, self.streams[stream_name])
+        return [
+            ReadEvent(event=create_recorded_event(stream_name, revision))
+            for revision in range(options.from_revision, end)
+        ]
+
+
+def test_parse_link_target() -> None:
+    assert parse_link_target(create_link("test-1", 5)) == ("test-1", 5)
+    assert parse_link_target(create_link("test@1", 5)) == ("test@1", 5)
+    assert parse_link_target(ReadEvent(event=create_recorded_event("test-1", 0))) is None
+    assert parse_link_target(ReadEvent(event=None)) is None
+
+
+def test_coalesce_revisions() -> None:
+    assert coalesce_revisions([], max_gap=2) == []
+    assert coalesce_revisions([9, 1, 2, 4, 20], max_gap=2) == [[1, 2, 4], [9], [20]]
+
+
+async def test_resolve_links_coalesces_and_caches_reads() -> None:
+    client = FakeClient(ClientOptions(host="localhost", link_cache_size=100), {"test-1": 10})
+    links = [create_link("test-1", revision, i) for i, revision in enumerate((3, 1, 3, 2))]
+
+    events = await client.resolve_links(links)
+
+    assert [(e.event.stream_name, e.event.revision) for e in events if e.event] == [
+        ("test-1", 3),
+        ("test-1", 1),
+        ("test-1", 3),
+        ("test-1", 2),
+    ]
+    assert [e.link for e in events] == [link.event for link in links]
+    assert [(name, o.from_revision, o.max_count) for name, o in client.reads] == [
+        ("test-1", 1, 3),
+    ]
+
+    client.reads.clear()
+    await client.resolve_links([create_link("test-1", 2), create_link("test-1", 12)])
+
+    assert [(name, o.from_revision, o.max_count) for name, o in client.reads] == [
+        ("test-1", 12, 1),
+    ]
+
+
+async def test_resolve_links(eventstoredb_client: Client, stream_name: str) -> None:
+    target_stream_name = f"ResolveLinks-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=target_stream_name,
+        events=[JsonEvent(type="test_resolve_links") for _ in range(3)],
+    )
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[
+            JsonEvent(type="$>", data=f"{revision}@{target_stream_name}".encode())
+            for revision in (2, 0, 2, 5)
+        ],
+    )
+
+    links = [
+        e async for e in eventstoredb_client.read_stream(stream_name) if isinstance(e, ReadEvent)
+    ]
+    expected = [
+        e
+        async for e in eventstoredb_client.read_stream(
+            stream_name,
+            ReadStreamOptions(resolve_links=True),
+        )
+        if isinstance(e, ReadEvent)
+    ]
+    events = await eventstoredb_client.resolve_links(links)
+
+    assert [e.event.id if e.event else None for e in events] == [
+        e.event.id if e.event else None for e in expected
+    ]
+    assert [e.link for e in events] == [e.event for e in links]
@@ -0,0 +1,73 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from eventstoredb import Client
+from eventstoredb.client.scan_all.mixin import ScanQueue, SegmentEnd, iterate_queue
+from eventstoredb.client.scan_all.types import ScanAllSegment
+from eventstoredb.events import JsonEvent, ReadEvent
+from eventstoredb.filters import StreamNameFilter
+from eventstoredb.options import ScanAllOptions
+from eventstoredb.types import AllPosition
+
+
+def test_scan_all_segment_contains() -> None:
+    segment = ScanAllSegment(AllPosition(10, 10), AllPosition(20, 20))
+    assert segment.contains(AllPosition(10, 10))
+    assert segment.contains(AllPosition(20, 19))
+    assert not segment.contains(AllPosition(20, 20))
+
+    last_segment = ScanAllSegment(AllPosition(10, 10), AllPosition(20, 20), last=True)
+    assert last_segment.contains(AllPosition(20, 20))
+    assert not last_segment.contains(AllPosition(21, 21))
+
+
+async def test_iterate_queue_waits_for_all_segments() -> None:
+    queue: ScanQueue = ScanQueue()
+    events = [ReadEvent(commit_position=i) for i in range(3)]
+    for item in [events[0], SegmentEnd(), events[1], events[2], SegmentEnd()]:
+        queue.put_nowait(item)
+
+    assert [e async for e in iterate_queue(queue, segments=2)] == events
+
+
+async def test_iterate_queue_raises_segment_error() -> None:
+    queue: ScanQueue = ScanQueue()
+    queue.put_nowait(SegmentEnd(error=ValueError("failed")))
+
+    with pytest.raises(ValueError, match="failed"):
+        _ = [e async for e in iterate_queue(queue, segments=1)]
+
+
+async def test_scan_all(eventstoredb_client: Client) -> None:
+    stream_name = f"ScanAll-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[
+            JsonEvent(type="test_scan_all", data=json.dumps({"index": i}).encode())
+            for i in range(50)
+        ],
+    )
+
+    options = ScanAllOptions(
+        partitions=4,
+        ordered=True,
+        filter=StreamNameFilter(prefix=[stream_name]),
+    )
+    events = [e async for e in eventstoredb_client.scan_all(options)]
+
+    assert [e.event.revision for e in events if e.event] == list(range(50))
+
+
+async def test_scan_all_unordered(eventstoredb_client: Client) -> None:
+    stream_name = f"ScanAll-{uuid4()}"
+    await eventstoredb_client.append_to_stream(
+        stream_name=stream_name,
+        events=[JsonEvent(type="test_scan_all") for _ in range(50)],
+    )
+
+    options = ScanAllOptions(partitions=4, filter=StreamNameFilter(prefix=[stream_name]))
+    events = [e async for e in eventstoredb_client.scan_all(options)]
+
+    assert sorted(e.event.revision for e in events if e.event) == list(range(50))
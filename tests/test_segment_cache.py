@@ -0,0 +1,158 @@
+from pathlib import Path
+from uuid import uuid4
+
+from eventstoredb import Client
+from eventstoredb.client.decoder import decode_read_response
+from eventstoredb.client.segment_cache import SegmentCache, iterate_segment_cached_responses
+from eventstoredb.client.subscribe_to_all.grpc import convert_subscribe_to_all_response
+from eventstoredb.events import JsonEvent, LazyJsonRecordedEvent, ReadEvent
+from eventstoredb.generated.event_store.client import StreamIdentifier, Uuid
+from eventstoredb.generated.event_store.client.streams import (
+    ReadReq,
+    ReadResp,
+    ReadRespReadEvent,
+    ReadRespReadEventRecordedEvent,
+)
+from eventstoredb.options import ClientOptions, ReadAllOptions
+from eventstoredb.serializers import DEFAULT_SERIALIZER
+from eventstoredb.types import AllPosition, StreamPosition
+
+
+def create_record(position: int) -> tuple[AllPosition, bytes]:
+    message = ReadResp(
+        event=ReadRespReadEvent(
+            event=ReadRespReadEventRecordedEvent(
+                id=Uuid(string=str(uuid4())),
+                stream_identifier=StreamIdentifier(b"test-stream"),
+                stream_revision=position,
+                prepare_position=position,
+                commit_position=position,
+                metadata={"type": "test", "content-type": "application/json", "created": "0"},
+                data=b"{}",
+            ),
+            commit_position=position,
+        ),
+    )
+    return AllPosition(position, position), bytes(message)
+
+
+def read_positions(
+    cache: SegmentCache,
+    from_position: AllPosition | StreamPosition,
+    exclusive: bool = False,
+) -> list[int]:
+    def decode(data: memoryview) -> int:
+        response = decode_read_response(data, DEFAULT_SERIALIZER)
+        assert isinstance(response, ReadEvent)
+        assert response.event is not None
+        return response.event.position.commit_position
+
+    return list(cache.iterate(from_position, decode, exclusive=exclusive))
+
+
+def test_segment_cache_iterate(tmp_path: Path) -> None:
+    cache = SegmentCache(tmp_path, segment_size=500)
+    assert cache.covers(StreamPosition.START)
+    assert not cache.covers(AllPosition(0, 0))
+
+    for position in range(10, 110, 10):
+        cache.append(*create_record(position))
+    # records that are already cached are ignored
+    cache.append(*create_record(50))
+    cache.flush()
+
+    assert len(list(tmp_path.iterdir())) > 1
+    assert cache.end == AllPosition(100, 100)
+    assert cache.covers(AllPosition(100, 100))
+    assert not cache.covers(AllPosition(110, 110))
+    assert read_positions(cache, StreamPosition.START) == list(range(10, 110, 10))
+    assert read_positions(cache, AllPosition(45, 45)) == list(range(50, 110, 10))
+    assert read_positions(cache, AllPosition(50, 50)) == list(range(50, 110, 10))
+    assert read_positions(cache, AllPosition(50, 50), exclusive=True) == list(range(60, 110, 10))
+    assert read_positions(cache, StreamPosition.START, exclusive=True) == list(range(10, 110, 10))
+
+
+async def test_segment_cached_responses_use_client_decoder(tmp_path: Path) -> None:
+    client = Client(ClientOptions(host="localhost", fast_decoder=True, lazy_recorded_events=True))
+    cache = SegmentCache(tmp_path)
+    for position in range(10, 60, 10):
+        cache.append(*create_record(position))
+    cache.flush()
+
+    def create_request(from_position: AllPosition | StreamPosition, count: int) -> ReadReq:
+        raise AssertionError
+
+    responses = [
+        r
+        async for r in iterate_segment_cached_responses(
+            client,
+            cache,
+            AllPosition(20, 20),
+            create_request,
+            convert_subscribe_to_all_response,
+            max_count=2,
+            exclusive=True,
+        )
+    ]
+
+    assert [type(r.event) for r in responses if isinstance(r, ReadEvent)] == [
+        LazyJsonRecordedEvent,
+        LazyJsonRecordedEvent,
+    ]
+    assert [
+        r.event.position.commit_position for r in responses if isinstance(r, ReadEvent) and r.event
+    ] == [
+        30,
+        40,
+    ]
+
+
+def test_segment_cache_unflushed_records_are_not_served(tmp_path: Path) -> None:
+    cache = SegmentCache(tmp_path)
+    cache.append(*create_record(10))
+
+    assert cache.end is None
+    assert read_positions(cache, StreamPosition.START) == []
+
+
+def test_segment_cache_recovers_partial_record(tmp_path: Path) -> None:
+    cache = SegmentCache(tmp_path)
+    for position in (10, 20):
+        cache.append(*create_record(position))
+    cache.close()
+    (segment_path,) = tmp_path.iterdir()
+    with segment_path.open("ab") as file:
+        file.write(b"\x01\x02\x03")
+
+    cache = SegmentCache(tmp_path)
+
+    assert cache.end == AllPosition(20, 20)
+    assert read_positions(cache, StreamPosition.START) == [10, 20]
+    cache.append(*create_record(30))
+    cache.flush()
+    assert read_positions(cache, StreamPosition.START) == [10, 20, 30]
+
+
+async def test_read_all_segment_cache(
+    eventstoredb_host: str,
+    eventstoredb_port: int,
+    tmp_path: Path,
+) -> None:
+    client = Client(
+        ClientOptions(
+            host=eventstoredb_host,
+            port=eventstoredb_port,
+            segment_cache_dir=str(tmp_path),
+        ),
+    )
+    await client.append_to_stream(
+        stream_name=f"SegmentCache-{uuid4()}",
+        events=[JsonEvent(type="test_read_all_segment_cache")],
+    )
+
+    events = [e async for e in client.read_all()]
+    assert client.segment_cache is not None
+    assert client.segment_cache.end is not None
+
+    cached_events = [e async for e in client.read_all(ReadAllOptions(max_count=len(events)))]
+    assert cached_events == events
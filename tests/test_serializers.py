@@ -0,0 +1,105 @@
+from typing import Any, Optional
+from uuid import uuid4
+
+import pytest
+
+from eventstoredb import Client, serializers
+from eventstoredb.events import ContentType, JsonEvent, JsonRecordedEvent
+from eventstoredb.options import ClientOptions
+from eventstoredb.serializers import (
+    DEFAULT_SERIALIZER,
+    JsonSerializer,
+    Serializer,
+    SerializerNotFoundError,
+    get_serializer,
+    register_serializer,
+)
+from eventstoredb.types import AllPosition
+
+
+class CountingSerializer(JsonSerializer):
+    def __init__(self) -> None:
+        self.loads_count = 0
+
+    def loads(self, data: bytes) -> Any:
+        self.loads_count += 1
+        return super().loads(data)
+
+
+def create_recorded_event(
+    data: Optional[bytes],
+    serializer: Serializer = DEFAULT_SERIALIZER,
+) -> JsonRecordedEvent:
+    return JsonRecordedEvent(
+        stream_name="test-stream",
+        id=uuid4(),
+        type="TestEvent",
+        content_type=ContentType.JSON,
+        revision=0,
+        created=0,
+        position=AllPosition(commit_position=0, prepare_position=0),
+        data=data,
+        metadata=None,
+        serializer=serializer,
+    )
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_serializer_roundtrip(name: str) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    serializer = get_serializer(name)
+    obj = {"hello": "world", "numbers": [1, 2.5], "nested": {"flag": True, "none": None}}
+
+    assert serializer.loads(serializer.dumps(obj)) == obj
+
+
+def test_get_serializer_not_registered() -> None:
+    with pytest.raises(SerializerNotFoundError):
+        get_serializer("does-not-exist")
+
+
+def test_register_serializer(monkeypatch: pytest.MonkeyPatch) -> None:
+    # registered into a copy, so other tests see the default registry
+    monkeypatch.setattr(serializers, "_serializers", dict(serializers._serializers))
+    register_serializer("counting", CountingSerializer)
+
+    client = Client(ClientOptions(host="localhost", serializer="counting"))
+
+    assert isinstance(client.serializer, CountingSerializer)
+    assert isinstance(client.json_event(type="TestEvent"), JsonEvent)
+
+
+def test_json_event_from_obj() -> None:
+    event = JsonEvent.from_obj(type="TestEvent", data={"hello": "world"}, metadata={"a": 1})
+
+    assert event.type == "TestEvent"
+    assert event.data == b'{"hello":"world"}'
+    assert event.metadata == b'{"a":1}'
+
+
+def test_client_json_event_uses_client_serializer(monkeypatch: pytest.MonkeyPatch) -> None:
+    class UpperSerializer(JsonSerializer):
+        def dumps(self, obj: Any) -> bytes:
+            return super().dumps(obj).upper()
+
+    monkeypatch.setattr(serializers, "_serializers", dict(serializers._serializers))
+    register_serializer("upper", UpperSerializer)
+    client = Client(ClientOptions(host="localhost", serializer="upper"))
+
+    event = client.json_event(type="TestEvent", data={"hello": "world"})
+
+    assert event.data == b'{"HELLO":"WORLD"}'
+
+
+def test_json_recorded_event_json_is_parsed_once() -> None:
+    serializer = CountingSerializer()
+    event = create_recorded_event(b'{"hello": "world"}', serializer=serializer)
+
+    assert event.json() == {"hello": "world"}
+    assert event.json() is event.json()
+    assert serializer.loads_count == 1
+
+
+def test_json_recorded_event_json_without_data() -> None:
+    assert create_recorded_event(None).json() is None
@@ -0,0 +1,81 @@
+import dataclasses
+import pickle
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from eventstoredb.client.subscribe_to_all.types import Checkpoint
+from eventstoredb.events import ReadEvent
+from eventstoredb.generated.event_store.client import Uuid
+from eventstoredb.types import AllPosition
+from eventstoredb.utils import dataclass_slots, uuid_from_int, uuid_from_message, uuid_to_message
+
+
+@dataclass_slots
+@dataclasses.dataclass(frozen=True)
+class Point:
+    x: int
+    y: Optional[int] = None
+
+
+def test_dataclass_slots_has_no_dict() -> None:
+    point = Point(x=1)
+    assert Point.__slots__ == ("x", "y")
+    assert not hasattr(point, "__dict__")
+    assert point == Point(x=1, y=None)
+
+
+def test_dataclass_slots_is_frozen() -> None:
+    point = Point(x=1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        point.x = 2  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del point.x  # type: ignore[misc]
+
+
+def test_dataclass_slots_pickle() -> None:
+    point = Point(x=1, y=2)
+    assert pickle.loads(pickle.dumps(point)) == point
+
+
+def test_dataclass_slots_subclass_only_adds_new_slots() -> None:
+    checkpoint = Checkpoint(commit_position=1, prepare_position=2)
+    assert Checkpoint.__slots__ == ()
+    assert not hasattr(checkpoint, "__dict__")
+    assert checkpoint.commit_position == 1
+    assert isinstance(checkpoint, AllPosition)
+
+
+def test_read_event_is_slotted() -> None:
+    assert not hasattr(ReadEvent(event=None, link=None), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "uuid",
+    [
+        UUID(int=0),
+        UUID(int=2**128 - 1),
+        UUID("ffffffff-ffff-ffff-0000-000000000002"),
+        UUID("00000000-0000-0001-8000-000000000000"),
+    ],
+)
+def test_uuid_message_roundtrip(uuid: UUID) -> None:
+    for structured in (False, True):
+        message = Uuid().parse(bytes(uuid_to_message(uuid, structured=structured)))
+        decoded = uuid_from_message(message)
+        assert decoded == uuid
+        assert str(decoded) == str(uuid)
+        assert hash(decoded) == hash(uuid)
+
+
+def test_uuid_to_message_structured_is_signed() -> None:
+    message = uuid_to_message(UUID("ffffffff-ffff-ffff-0000-000000000002"), structured=True)
+    assert message.structured.most_significant_bits == -1
+    assert message.structured.least_significant_bits == 2
+
+
+def test_uuid_from_int() -> None:
+    uuid = uuid_from_int(2**127)
+    assert uuid == UUID(int=2**127)
+    assert pickle.loads(pickle.dumps(uuid)) == uuid